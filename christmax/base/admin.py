@@ -0,0 +1,231 @@
+"""
+Admin building blocks for tables with millions of rows.
+
+``LargeTableAdminMixin`` combines:
+    - ``EstimatedCountPaginator`` and no second "full result" COUNT per page
+    - keyset ("Show more") pagination along the admin's default ordering, so deep
+      browsing never pays for a large OFFSET
+Pair it with ``list_select_related`` and ``CachedAllValuesFieldListFilter`` as needed.
+
+``csv_export_action`` builds an admin action that streams the selected rows as CSV, read
+through a database cursor in chunks, so exporting every row doesn't load the table into
+memory.
+
+``OutboxMessageAdmin`` lists queued and dead-letter email (see base/mail.py).
+"""
+
+import base64
+import csv
+import datetime
+import json
+from itertools import islice
+
+from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ORDER_VAR
+from django.contrib.admin.views.main import PAGE_VAR
+from django.contrib.admin.views.main import ChangeList
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from base.models import OutboxMessage
+from base.paginators import EstimatedCountPaginator
+
+CURSOR_VAR = 'cursor'
+
+
+def keyset_filter(model, ordering, values):
+    """
+    Build the "rows after ``values``" filter for ``ordering`` (e.g. ``['-date_joined', '-pk']``).
+
+    (a, b) after (x, y) means ``a < x OR (a = x AND b < y)`` for descending fields.
+    """
+    condition = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        equal = {ordering[j].lstrip('-'): values[j] for j in range(i)}
+        condition |= Q(**equal, **{f'{name}__{lookup}': values[i]})
+    return condition
+
+
+def _model_field(model, name):
+    return model._meta.pk if name == 'pk' else model._meta.get_field(name)
+
+
+def _cursor_value(value):
+    # DjangoJSONEncoder cuts times to milliseconds, which would skip rows sharing one
+    if isinstance(value, (datetime.datetime, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(obj, ordering):
+    values = [
+        _cursor_value(getattr(obj, _model_field(type(obj), f.lstrip('-')).attname))
+        for f in ordering
+    ]
+    raw = json.dumps(values, cls=DjangoJSONEncoder).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, model, ordering):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if len(values) != len(ordering):
+            raise ValueError
+        return [
+            _model_field(model, f.lstrip('-')).to_python(v)
+            for f, v in zip(ordering, values, strict=True)
+        ]
+    except (ValueError, TypeError, ValidationError) as e:
+        raise IncorrectLookupParameters(f'Invalid cursor: {cursor!r}') from e
+
+
+class KeysetChangeList(ChangeList):
+    """ChangeList that continues past the current page with a keyset cursor."""
+
+    def get_filters_params(self, params=None):
+        params = super().get_filters_params(params)
+        params.pop(CURSOR_VAR, None)
+        return params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # Sorting, filtering and page links start over from the first page
+        new_params = new_params or {}
+        if CURSOR_VAR not in new_params:
+            remove = [*(remove or []), CURSOR_VAR]
+        return super().get_query_string(new_params, remove)
+
+    def keyset_ordering(self, request):
+        """Default admin ordering plus pk, or None when the user sorted by a column."""
+        if ORDER_VAR in self.params:
+            return None
+        ordering = list(self.model_admin.get_ordering(request) or ['-pk'])
+        if not {'pk', '-pk', 'id', '-id'} & set(ordering):
+            ordering.append('-pk')
+        return ordering
+
+    def get_results(self, request):
+        ordering = self.keyset_ordering(request)
+        cursor = self.params.get(CURSOR_VAR)
+        self.next_cursor = None
+
+        if not (cursor and ordering):
+            super().get_results(request)
+            if ordering and self.multi_page and not self.show_all:
+                rows = list(self.result_list)
+                if rows:
+                    self.next_cursor = encode_cursor(rows[-1], ordering)
+            return
+
+        values = decode_cursor(cursor, self.model, ordering)
+        queryset = self.queryset.order_by(*ordering).filter(
+            keyset_filter(self.model, ordering, values)
+        )
+        rows = list(queryset[: self.list_per_page + 1])
+
+        self.paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        self.result_count = self.paginator.count
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.result_list = rows[: self.list_per_page]
+        self.can_show_all = False
+        self.multi_page = False
+        if len(rows) > self.list_per_page:
+            self.next_cursor = encode_cursor(rows[self.list_per_page - 1], ordering)
+
+    @property
+    def next_page_url(self):
+        if not self.next_cursor:
+            return None
+        return self.get_query_string({CURSOR_VAR: self.next_cursor}, [PAGE_VAR])
+
+
+class LargeTableAdminMixin:
+    """ModelAdmin mixin: estimated counts, no full-count query, keyset "Show more"."""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+
+class CachedAllValuesFieldListFilter(admin.AllValuesFieldListFilter):
+    """
+    ``AllValuesFieldListFilter`` whose ``SELECT DISTINCT`` choices are cached.
+
+    The distinct scan over a large table runs at most once per ``cache_timeout`` seconds
+    instead of on every changelist view.
+    """
+
+    cache_timeout = 300
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super().__init__(field, request, params, model, model_admin, field_path)
+        key = f'admin:list_filter:{model._meta.label_lower}:{field_path}'
+        choices = self.lookup_choices
+        self.lookup_choices = cache.get_or_set(key, lambda: list(choices), self.cache_timeout)
+
+
+class _Echo:
+    """A file for ``csv.writer`` whose ``write`` hands back the line instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def _cell(value):
+    """Keep spreadsheets from running user-supplied text such as ``=HYPERLINK(...)``."""
+    if isinstance(value, str) and value.startswith(('=', '+', '-', '@', '\t', '\r')):
+        return "'" + value
+    return value
+
+
+def csv_lines(header, rows, batch=500):
+    """``header`` and ``rows`` as CSV text, ``batch`` rows per chunk."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    rows = iter(rows)
+    while chunk := list(islice(rows, batch)):
+        yield ''.join(writer.writerow([_cell(value) for value in row]) for row in chunk)
+
+
+def csv_export_action(*fields, chunk_size=2000):
+    """
+    An admin action that downloads ``fields`` (lookups such as ``'user__email'`` work) of
+    the selected rows, in changelist order, as a streamed CSV file.
+    """
+
+    @admin.action(description=_('Export selected as CSV'))
+    def export_as_csv(modeladmin, request, queryset):
+        rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+        response = StreamingHttpResponse(
+            csv_lines(fields, rows), content_type='text/csv; charset=utf-8'
+        )
+        filename = f'{queryset.model._meta.model_name}s.csv'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    return export_as_csv
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ('id', '__str__', 'created_at', 'attempts', 'next_attempt_at', 'last_error')
+    ordering = ('-id',)
+    exclude = ('payload',)
+    readonly_fields = ('from_email', 'recipients', 'created_at', 'attempts', 'last_error')
+    actions = ('retry_now',)
+
+    @admin.action(description='Retry selected messages now')
+    def retry_now(self, request, queryset):
+        queryset.update(next_attempt_at=timezone.now())
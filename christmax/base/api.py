@@ -0,0 +1,167 @@
+"""
+Plumbing for the versioned JSON API under ``/api/v1/``.
+
+Game clients poll and post small state updates, and the full ``MIDDLEWARE`` stack does
+work they never use: locale negotiation, messages, clickjacking headers, allauth's account
+middleware and, in development, the debug toolbar. ``ApiMiddleware`` sits right after
+replica pinning. It sends requests under ``API_PREFIX`` through a separate chain built
+from ``API_MIDDLEWARE`` (sessions, CSRF and auth are kept), and never reaches the rest
+of ``MIDDLEWARE``.
+
+Responses are encoded with orjson when it is installed (``poetry install -E fast-json``),
+else with the standard library's ``json`` and compact separators. ``conditional()`` answers
+``If-None-Match`` with a 304 before the body is built, so read endpoints with a cheap ETag
+skip serialization on repeat polls.
+
+``StreamingApiResponse`` sends a JSON array from an iterator in chunks, so a dump of the whole
+table never holds more than one batch of rows.
+
+Settings:
+    API_PREFIX      - path prefix routed through the API chain (default '/api/')
+    API_MIDDLEWARE  - middleware for API requests, outermost first
+"""
+
+import json
+from itertools import islice
+
+from asgiref.sync import iscoroutinefunction
+from asgiref.sync import markcoroutinefunction
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from django.utils.http import quote_etag
+from django.views import View
+
+try:
+    import orjson
+except ImportError:  # optional: poetry install -E fast-json
+    orjson = None
+
+
+def dumps(value):
+    """``value`` as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+class ApiResponse(HttpResponse):
+    def __init__(self, data, status=200, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(dumps(data), status=status, **kwargs)
+
+
+def stream_array(items, batch=500):
+    """``items`` as the chunks of one JSON array, ``batch`` items per chunk."""
+    yield b'['
+    items = iter(items)
+    separator = b''
+    while chunk := list(islice(items, batch)):
+        yield separator + b','.join(dumps(item) for item in chunk)
+        separator = b','
+    yield b']'
+
+
+class StreamingApiResponse(StreamingHttpResponse):
+    def __init__(self, items, status=200, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(stream_array(items), status=status, **kwargs)
+
+
+class ApiError(Exception):
+    """Raised in an ``ApiView`` to answer with ``{"error": code, "message": message}``."""
+
+    def __init__(self, code, message, status=400):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+class ApiView(View):
+    """A view that speaks JSON for its errors too, including 405."""
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except ApiError as e:
+            return ApiResponse({'error': e.code, 'message': str(e.message)}, status=e.status)
+
+    def http_method_not_allowed(self, request, *args, **kwargs):
+        response = ApiResponse({'error': 'method_not_allowed'}, status=405)
+        response['Allow'] = ', '.join(self._allowed_methods())
+        return response
+
+    def data(self):
+        """The request's fields, from a JSON body or a form."""
+        if self.request.content_type == 'application/json':
+            try:
+                data = json.loads(self.request.body or b'{}')
+            except ValueError as e:
+                raise ApiError('invalid_json', 'Request body is not valid JSON') from e
+            if not isinstance(data, dict):
+                raise ApiError('invalid_json', 'Request body must be a JSON object')
+            return data
+        return self.request.POST
+
+
+def conditional(request, etag, build, **cache_control):
+    """
+    ``build()``'s response with an ``ETag``, or a 304 if the client already has ``etag``.
+
+    Responses must be revalidated on every use (``Cache-Control: no-cache``, plus any
+    ``cache_control`` directives such as ``private=True``), so a poll is one round trip that
+    usually ends in an empty 304.
+    """
+    etag = quote_etag(etag)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = build()
+    response['ETag'] = etag
+    patch_cache_control(response, no_cache=True, **cache_control)
+    return response
+
+
+class ApiHandler(BaseHandler):
+    """Django's request handler, with ``API_MIDDLEWARE`` in place of ``MIDDLEWARE``."""
+
+    def load_middleware(self, is_async=False):
+        # BaseHandler builds its chain from settings.MIDDLEWARE, adapting each middleware to
+        # the handler's sync/async mode. Swap the list in while it does (once, at startup);
+        # override_settings would do the same but pulls django.test into every worker.
+        middleware = settings.MIDDLEWARE
+        settings.MIDDLEWARE = settings.API_MIDDLEWARE
+        try:
+            super().load_middleware(is_async=is_async)
+        finally:
+            settings.MIDDLEWARE = middleware
+
+
+class ApiMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = getattr(settings, 'API_PREFIX', '/api/')
+        # Under ASGI the API chain runs async too, so async middleware isn't wrapped twice
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        self.api = ApiHandler()
+        self.api.load_middleware(is_async=self.is_async)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if request.path_info.startswith(self.prefix):
+            return self.api.get_response(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if request.path_info.startswith(self.prefix):
+            return await self.api.get_response_async(request)
+        return await self.get_response(request)
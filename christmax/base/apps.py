@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class BaseConfig(AppConfig):
+    name = 'base'
+
+    def ready(self):
+        if getattr(settings, 'TRANSLATION_MMAP_CATALOGS', True):
+            from base import translation
+
+            translation.install()
@@ -0,0 +1,200 @@
+"""
+Stampede-safe caching for expensive computed values and pages.
+
+A plain ``cache.get() or compute()`` sends every worker to recompute when a hot key expires
+(leaderboards and the daily puzzle all turn over at midnight UTC). ``get_or_compute`` avoids
+that three ways:
+
+- Probabilistic early refresh (XFetch): each read may refresh a still-fresh entry, with a
+  probability that rises as expiry nears and with how long the value took to compute. One
+  request usually refreshes ahead of expiry while the rest keep hitting.
+- Single flight: only the request that wins ``cache.add(lock_key)`` recomputes a key. On a
+  cold miss the others wait for its result instead of computing alongside it.
+- Stale while revalidate: entries outlive their TTL by ``stale_ttl``. While one request
+  recomputes, the others get the previous value immediately.
+
+Outcomes are counted in ``django_cache_requests_total{key, result}`` (hit, miss, refresh,
+stale, wait) and exported at /metrics.
+"""
+
+import functools
+import hashlib
+import math
+import random
+import time
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import patch_vary_headers
+from django.utils.translation import get_language
+
+from base.htmx import is_htmx
+from base.instrumentation import registry
+
+registry.describe('django_cache_requests_total', 'Stampede-protected cache reads by outcome')
+
+LOCK_SUFFIX = ':lock'
+
+
+class DoNotCache(Exception):
+    """Raised by ``compute`` to return ``value`` without caching it."""
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.value = value
+
+
+def _record(name, result):
+    registry.increment('django_cache_requests_total', {'key': name, 'result': result})
+
+
+def get_or_compute(
+    key,
+    compute,
+    ttl,
+    *,
+    name=None,
+    stale_ttl=None,
+    beta=1.0,
+    lock_timeout=30,
+    wait_timeout=5.0,
+    cache_alias='default',
+):
+    """
+    Return the cached value for ``key``, calling ``compute()`` at most once per refresh.
+
+    ``ttl`` is the freshness window in seconds. ``stale_ttl`` (default: ``ttl``) is how long
+    an expired value may still be served while another request recomputes it. ``beta`` > 1
+    refreshes earlier. ``name`` labels the metrics (default: ``key`` up to the first ``:``).
+    """
+    cache = caches[cache_alias]
+    name = name or key.split(':', 1)[0]
+    stale_ttl = ttl if stale_ttl is None else stale_ttl
+    lock_key = key + LOCK_SUFFIX
+
+    def refresh():
+        started = time.monotonic()
+        try:
+            value = compute()
+        except DoNotCache as e:
+            return e.value
+        delta = time.monotonic() - started
+        cache.set(key, (value, delta, time.time() + ttl), ttl + stale_ttl)
+        return value
+
+    entry = cache.get(key)
+    if entry is not None:
+        value, delta, expires_at = entry
+        # XFetch: -log(u) is exponentially distributed, so early refreshes are rare until
+        # the remaining lifetime is within a few compute times
+        head_start = -delta * beta * math.log(1.0 - random.random())  # noqa: S311
+        if time.time() + head_start < expires_at:
+            _record(name, 'hit')
+            return value
+        if not cache.add(lock_key, 1, lock_timeout):
+            _record(name, 'stale')
+            return value
+        try:
+            _record(name, 'refresh')
+            return refresh()
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + wait_timeout
+    while not cache.add(lock_key, 1, lock_timeout):
+        # Someone else is computing this key: wait for their result rather than pile on
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None:
+            _record(name, 'wait')
+            return entry[0]
+        if time.monotonic() >= deadline:
+            _record(name, 'miss')
+            return refresh()
+    try:
+        _record(name, 'miss')
+        return refresh()
+    finally:
+        cache.delete(lock_key)
+
+
+def cached(ttl, *, key=None, **options):
+    """
+    Decorate a function so its results go through ``get_or_compute``.
+
+    The cache key is ``key`` (or the function's qualified name) plus a digest of the
+    arguments, which must have stable ``repr()``s.
+    """
+
+    def decorator(func):
+        prefix = key or f'{func.__module__}.{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            digest = hashlib.md5(
+                repr((args, sorted(kwargs.items()))).encode(), usedforsecurity=False
+            ).hexdigest()
+            return get_or_compute(
+                f'{prefix}:{digest}', lambda: func(*args, **kwargs), ttl, name=prefix, **options
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def cache_view(ttl, *, name=None, **options):
+    """
+    Cache a view's GET responses for anonymous users through ``get_or_compute``.
+
+    Responses are keyed by path, query string, active language and whether htmx asked for a
+    fragment (base/htmx.py). Authenticated users (whose navbar differs) bypass the cache.
+    Non-200 responses, responses that set cookies and pages that render a CSRF token are
+    returned but not stored.
+    """
+
+    def decorator(view):
+        view_name = name or f'{view.__module__}.{view.__qualname__}'
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            user = getattr(request, 'user', None)
+            if request.method not in ('GET', 'HEAD') or (user and user.is_authenticated):
+                return view(request, *args, **kwargs)
+
+            def render():
+                response = view(request, *args, **kwargs)
+                if hasattr(response, 'render') and not response.is_rendered:
+                    response.render()
+                if (
+                    response.status_code != 200
+                    or response.streaming
+                    or response.cookies
+                    or request.META.get('CSRF_COOKIE_NEEDS_UPDATE')  # get_token() was called
+                ):
+                    raise DoNotCache(response)
+                return response.status_code, dict(response.items()), response.content
+
+            path = hashlib.md5(
+                request.get_full_path().encode(), usedforsecurity=False
+            ).hexdigest()
+            variant = 'htmx' if is_htmx(request) else 'page'
+            key = f'view:{view_name}:{get_language()}:{variant}:{path}'
+            result = get_or_compute(key, render, ttl, name=view_name, **options)
+            if isinstance(result, HttpResponseBase):
+                return result
+            response = _build_response(*result)
+            patch_vary_headers(response, ('Cookie',))
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _build_response(status, headers, content):
+    response = HttpResponse(content, status=status)
+    for header, value in headers.items():
+        response[header] = value
+    return response
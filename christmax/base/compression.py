@@ -0,0 +1,148 @@
+"""
+Brotli and gzip compression of responses, negotiated from ``Accept-Encoding``.
+
+Text responses (HTML, the ``jsi18n`` catalog, JSON, CSS, SVG) of at least
+``COMPRESSION_MIN_SIZE`` bytes are compressed. The client's preferred coding wins; on a tie,
+brotli beats gzip. Brotli needs the optional ``brotli`` package
+(``poetry install -E brotli``); without it, responses are gzip-only. Streaming responses are
+compressed chunk by chunk, so their memory stays flat.
+
+BREACH: an attacker who can inject text into a compressed page and watch its size can guess
+a secret on the same page byte by byte. Responses that carry a CSRF token are therefore never
+compressed. Once ``get_token()`` has been called (e.g. by ``{% csrf_token %}``),
+``CsrfViewMiddleware`` sends the CSRF cookie with the response, and that cookie is the
+signal. Gzip output also gets Django's random-length filename padding, as in
+``GZipMiddleware``.
+
+Settings:
+    COMPRESSION_MIN_SIZE        - smallest body worth compressing, in bytes (default: 1024)
+    COMPRESSION_BROTLI_QUALITY  - 0-11; dynamic pages want speed over ratio (default: 5)
+"""
+
+import re
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+from django.utils.text import compress_string
+
+from base.instrumentation import registry
+
+try:
+    import brotli
+except ImportError:  # optional: poetry install -E brotli
+    brotli = None
+
+registry.describe('http_responses_compressed_total', 'Responses compressed, by content coding')
+
+# Same padding as django.middleware.gzip.GZipMiddleware
+GZIP_MAX_RANDOM_BYTES = 100
+
+COMPRESSIBLE_TYPES = re.compile(
+    r'^(text/|application/(json|javascript|xml|.*\+json|.*\+xml)|image/svg\+xml)'
+)
+
+
+def codings():
+    """The content codings this server can produce, most preferred first."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate(accept_encoding, available):
+    """
+    The coding from ``available`` that the ``Accept-Encoding`` header rates highest (earlier
+    in ``available`` on a tie), or None if it accepts none of them.
+    """
+    qualities = {}
+    for part in accept_encoding.split(','):
+        coding, *params = (item.strip() for item in part.split(';'))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            qualities[coding.lower()] = q
+    best, best_q = None, 0.0
+    for coding in available:
+        q = qualities.get(coding, qualities.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def carries_csrf_token(request, response):
+    """Whether ``get_token()`` was called while handling ``request``."""
+    # CsrfViewMiddleware clears the flag once it has set the cookie
+    return settings.CSRF_COOKIE_NAME in response.cookies or request.META.get(
+        'CSRF_COOKIE_NEEDS_UPDATE', False
+    )
+
+
+def _brotli_sequence(sequence, quality):
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in sequence:
+        if data := compressor.process(chunk):
+            yield data
+        # Flush per chunk, as compress_sequence does, so streamed rows reach the client
+        if data := compressor.flush():
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        self.brotli_quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 5)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self.compressible(response):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if carries_csrf_token(request, response):
+            return response  # BREACH
+        coding = negotiate(request.headers.get('Accept-Encoding', ''), codings())
+        if coding is None:
+            return response
+
+        if response.streaming:
+            if coding == 'br':
+                content = _brotli_sequence(response.streaming_content, self.brotli_quality)
+            else:
+                content = compress_sequence(
+                    response.streaming_content, max_random_bytes=GZIP_MAX_RANDOM_BYTES
+                )
+            response.streaming_content = content
+            del response.headers['Content-Length']
+        else:
+            if coding == 'br':
+                compressed = brotli.compress(response.content, quality=self.brotli_quality)
+            else:
+                compressed = compress_string(
+                    response.content, max_random_bytes=GZIP_MAX_RANDOM_BYTES
+                )
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # The bytes differ from the uncompressed representation's, so a strong ETag can't stay
+        if (etag := response.get('ETag')) and etag.startswith('"'):
+            response.headers['ETag'] = f'W/{etag}'
+        response.headers['Content-Encoding'] = coding
+        registry.increment('http_responses_compressed_total', {'coding': coding})
+        return response
+
+    def compressible(self, response):
+        if response.has_header('Content-Encoding'):
+            return False
+        if not COMPRESSIBLE_TYPES.match(response.get('Content-Type', '')):
+            return False
+        if response.streaming:
+            return not response.is_async
+        return len(response.content) >= self.min_size
@@ -0,0 +1,10 @@
+from base.i18n_urls import language_choices
+from base.i18n_urls import urls_for
+
+
+def i18n_urls(request):
+    """
+    Expose the current language's URL map as ``{{ i18n_urls.home }}`` etc., and the
+    language switcher's options as ``language_choices``.
+    """
+    return {'i18n_urls': urls_for(request), 'language_choices': language_choices()}
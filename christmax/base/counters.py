@@ -0,0 +1,72 @@
+"""
+Sharded counters for hot, write-heavy tallies such as the daily puzzle's guess distribution.
+
+Counting on one row makes every increment wait for the row lock held by the previous one.
+At peak, thousands of players finishing the same puzzle would queue behind each other.
+``ShardedCounter`` spreads each ``(name, bucket)`` over ``shards`` ``CounterShard`` rows.
+An increment updates one row picked at random, so concurrent writers rarely touch the same
+row. Only PostgreSQL-style row locking benefits: SQLite serializes every write anyway.
+
+Reads sum the shards with one ``GROUP BY`` query, through ``get_or_compute``
+(base/caching.py). The totals are therefore at most ``ttl`` seconds old, and a hot
+histogram costs one query per TTL instead of one per page view.
+
+Any categorical tally fits: a puzzle's guess counts, or the share of players picking each
+answer choice (``percentages()``).
+
+Settings:
+    SHARDED_COUNTER_SHARDS - rows per bucket (default: 16)
+    SHARDED_COUNTER_TTL    - seconds totals are cached for (default: 5)
+"""
+
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models import Sum
+
+from base.caching import get_or_compute
+from base.models import CounterShard
+
+KEY_PREFIX = 'counters:'
+
+
+class ShardedCounter:
+    def __init__(self, name, *, shards=None, ttl=None, using=None):
+        self.name = name
+        self.shards = shards or getattr(settings, 'SHARDED_COUNTER_SHARDS', 16)
+        self.ttl = getattr(settings, 'SHARDED_COUNTER_TTL', 5) if ttl is None else ttl
+        self.using = using
+
+    def _rows(self):
+        return CounterShard.objects.using(self.using).filter(name=self.name)
+
+    def increment(self, bucket, amount=1):
+        shard = random.randrange(self.shards)  # noqa: S311
+        row = self._rows().filter(bucket=bucket, shard=shard)
+        if not row.update(count=F('count') + amount):
+            # First hit on this shard: create it (or lose the race to create it), then add
+            CounterShard.objects.using(self.using).bulk_create(
+                [CounterShard(name=self.name, bucket=bucket, shard=shard)], ignore_conflicts=True
+            )
+            row.update(count=F('count') + amount)
+
+    def aggregate(self):
+        """``{bucket: total}`` straight from the database."""
+        totals = self._rows().values_list('bucket').annotate(total=Sum('count')).order_by()
+        return dict(totals)
+
+    def counts(self):
+        """``{bucket: total}``, cached for ``ttl`` seconds."""
+        return get_or_compute(f'{KEY_PREFIX}{self.name}', self.aggregate, self.ttl, name='counters')
+
+    def percentages(self):
+        """``{bucket: percent of the total}``, from the cached counts."""
+        counts = self.counts()
+        total = sum(counts.values())
+        return {bucket: 100 * count / total for bucket, count in counts.items()} if total else {}
+
+    def clear(self):
+        self._rows().delete()
+        cache.delete(f'{KEY_PREFIX}{self.name}')
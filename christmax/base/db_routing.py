@@ -0,0 +1,120 @@
+"""
+Read-replica routing with read-your-writes stickiness.
+
+Read-only ORM queries for the models in ``REPLICA_READ_MODELS`` go to one of the
+``DATABASE_REPLICAS`` aliases; everything else, and every write, uses ``default``.
+
+After a request writes one of those models, reads stay on the primary for
+``REPLICA_STICKY_SECONDS`` so users see their own changes despite replication lag:
+for the rest of the request through a context variable, and for following requests
+through a short-lived cookie set by ``ReplicaPinningMiddleware``.
+
+Settings:
+    DATABASE_REPLICAS       - replica aliases in DATABASES; empty disables routing
+    REPLICA_READ_MODELS     - 'app_label' or 'app_label.model_name' entries to route
+    REPLICA_STICKY_SECONDS  - read-your-writes window (default 5)
+"""
+
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PIN_COOKIE = 'primary_pin'
+
+_pinned_until = ContextVar('replica_pinned_until', default=0.0)
+_wrote = ContextVar('replica_wrote', default=False)
+
+
+def get_replicas():
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def sticky_seconds():
+    return getattr(settings, 'REPLICA_STICKY_SECONDS', 5)
+
+
+def is_replicated(model):
+    routed = getattr(settings, 'REPLICA_READ_MODELS', [])
+    return model._meta.label_lower in routed or model._meta.app_label in routed
+
+
+def pin_to_primary(seconds=None):
+    """Send replicated reads in this context to the primary for ``seconds``."""
+    until = time.time() + (sticky_seconds() if seconds is None else seconds)
+    _pinned_until.set(max(_pinned_until.get(), until))
+    _wrote.set(True)
+
+
+def is_pinned():
+    return _pinned_until.get() > time.time()
+
+
+def clear_pin():
+    _pinned_until.set(0.0)
+    _wrote.set(False)
+
+
+class ReplicaRouter:
+    """Route reads of replicated models to a replica unless the context is pinned."""
+
+    def db_for_read(self, model, **hints):
+        replicas = get_replicas()
+        if not replicas or not is_replicated(model) or is_pinned():
+            return None
+        return random.choice(replicas)  # noqa: S311
+
+    def db_for_write(self, model, **hints):
+        if is_replicated(model):
+            pin_to_primary()
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary, so cross-alias relations are fine
+        pool = {'default', *get_replicas()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """
+    Carry read-your-writes stickiness across requests with a short-lived cookie.
+
+    Place it right after ``InstrumentationMiddleware`` so the whole request is covered.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        pinned_until = _parse_pin(request.COOKIES.get(PIN_COOKIE))
+        until_token = _pinned_until.set(pinned_until)
+        wrote_token = _wrote.set(False)
+        try:
+            response = self.get_response(request)
+            if _wrote.get():
+                response.set_cookie(
+                    PIN_COOKIE,
+                    f'{_pinned_until.get():.3f}',
+                    max_age=sticky_seconds(),
+                    httponly=True,
+                    samesite='Lax',
+                )
+            return response
+        finally:
+            _pinned_until.reset(until_token)
+            _wrote.reset(wrote_token)
+
+
+def _parse_pin(value):
+    try:
+        until = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    # A forged cookie can only pin reads to the primary, and never for long
+    return min(until, time.time() + sticky_seconds())
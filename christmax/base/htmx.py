@@ -0,0 +1,44 @@
+"""
+Partial responses for htmx requests.
+
+htmx (loaded in base.html) sends ``HX-Request: true`` with each request it makes and swaps
+the HTML it gets back into the page. An interaction therefore only needs the fragment that
+changed, such as a board row, the keyboard or a leaderboard slice. Views answer those
+requests from small templates under ``<app>/templates/<app>/partials/`` instead of
+rendering ``base.html`` again with the navbar, footer and script tags.
+
+A URL that serves both the page and a fragment must say so. ``vary_on_htmx`` adds
+``Vary: HX-Request`` so browser and proxy caches keep the two apart, and ``cache_view``
+(base/caching.py) stores them under separate keys.
+"""
+
+from django.utils.cache import patch_vary_headers
+
+
+def is_htmx(request):
+    """
+    Whether htmx made ``request``. History restores are excluded, because they want the
+    whole page.
+    """
+    return request.headers.get('HX-Request') == 'true' and not request.headers.get(
+        'HX-History-Restore-Request'
+    )
+
+
+def vary_on_htmx(response):
+    patch_vary_headers(response, ('HX-Request',))
+    return response
+
+
+class HtmxTemplateMixin:
+    """A ``TemplateView`` mixin that renders ``partial_template_name`` for htmx requests."""
+
+    partial_template_name = None
+
+    def get_template_names(self):
+        if is_htmx(self.request):
+            return [self.partial_template_name]
+        return super().get_template_names()
+
+    def render_to_response(self, context, **response_kwargs):
+        return vary_on_htmx(super().render_to_response(context, **response_kwargs))
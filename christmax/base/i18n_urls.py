@@ -0,0 +1,75 @@
+"""
+Per-language URLs for the pages that redirects and the navbar point at.
+
+``i18n_patterns`` gives every page one path per entry in ``LANGUAGES``. Rather than each
+caller working out the prefix (``request.path.startswith('/zh/')``) or picking a URL name per
+language, ``urls_for(request)`` returns that language's reversed URLs. Each language's map is
+built on first use and then shared, so a redirect is one dict lookup. ``language_choices()``
+feeds the navbar's language switcher from the same maps.
+
+Adding a language only means adding it to ``LANGUAGES``.
+"""
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import reverse
+from django.utils.translation import get_language_from_path
+from django.utils.translation import override
+
+URL_NAMES = ('home', 'settings', 'account_login', 'account_logout', 'account_signup')
+
+_maps = {}
+_choices = []
+
+
+@receiver(setting_changed)
+def _reset_maps(setting, **kwargs):
+    if setting in ('LANGUAGES', 'LANGUAGE_CODE', 'ROOT_URLCONF'):
+        _maps.clear()
+        _choices.clear()
+
+
+def _build_maps():
+    maps = {}
+    for code, _name in settings.LANGUAGES:
+        with override(code):
+            maps[code] = {name: reverse(name) for name in URL_NAMES}
+    return maps
+
+
+def language_urls(language):
+    """The URL map for ``language``, falling back to ``LANGUAGE_CODE`` for unknown codes."""
+    if not _maps:
+        _maps.update(_build_maps())
+    return _maps.get(language) or _maps[settings.LANGUAGE_CODE]
+
+
+def language_choices():
+    """``(code, name, home URL)`` per language, each name in its own language (``English``)."""
+    if not _choices:
+        for code, name in settings.LANGUAGES:
+            with override(code):
+                _choices.append((code, str(name), language_urls(code)['home']))
+    return _choices
+
+
+def request_language(request):
+    """
+    The language ``LocaleMiddleware`` chose for ``request``.
+
+    Falls back to the path prefix for requests that never went through the middleware.
+    """
+    language = getattr(request, 'LANGUAGE_CODE', None)
+    if language is None:
+        language = get_language_from_path(request.path_info)
+    return language
+
+
+def urls_for(request):
+    return language_urls(request_language(request))
+
+
+def url_for(request, name):
+    """``reverse(name)`` in the request's language, e.g. ``url_for(request, 'settings')``."""
+    return urls_for(request)[name]
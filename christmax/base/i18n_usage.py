@@ -0,0 +1,189 @@
+"""
+Which translatable strings the site actually uses, and the .po plumbing to prune the rest.
+
+The vendor catalogs we merge (``allauth.po``, ``django-core.po``) are whole upstream
+catalogs. Most of their entries are for features the site never renders. ``used_messages()``
+extracts every ``(context, msgid)`` the site can ask for:
+
+- Python: ``gettext``/``_``/``ngettext``/``pgettext`` (and lazy/noop variants) calls with
+  literal arguments, in installed apps, the project package (settings, URLs) and Django's
+  non-contrib packages.
+- Templates: ``{% translate %}``/``{% blocktranslate %}`` via Django's own ``templatize``,
+  the converter ``makemessages`` uses, in app template directories and ``TEMPLATES['DIRS']``.
+
+Strings built at runtime (``_(variable)``) can't be seen, so only vendor catalogs are
+pruned. Our own ``app.po`` and ``manual.po`` are always kept whole.
+"""
+
+import ast
+import re
+from collections import namedtuple
+from importlib import import_module
+from pathlib import Path
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.utils.translation.template import templatize
+
+GETTEXT_FUNCTIONS = {
+    '_',
+    'gettext',
+    'gettext_lazy',
+    'gettext_noop',
+    'ngettext',
+    'ngettext_lazy',
+    'pgettext',
+    'pgettext_lazy',
+    'npgettext',
+    'npgettext_lazy',
+}
+TEMPLATE_SUFFIXES = ('.html', '.txt')
+# Upstream catalogs copied into base/locale (see the Makefile's restore-* targets)
+VENDOR_CATALOGS = ('allauth.po', 'django-core.po')
+# templatize() renders every translatable string as one of these calls with repr() literals
+TEMPLATIZED_CALL = re.compile(
+    r"\b(n?p?gettext)\(((?:\s*u?(?:'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")\s*,?)+)"
+)
+LITERAL = re.compile(r"u?(?:'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")")
+
+PoEntry = namedtuple('PoEntry', 'context msgid translated text')
+
+
+def _message(function, args):
+    """The ``(context, msgid)`` a gettext-family call looks up, or None if not literal."""
+    if function.lstrip('n').startswith('p'):
+        if len(args) < 2 or not all(isinstance(arg, str) for arg in args[:2]):
+            return None
+        return args[0], args[1]
+    if not args or not isinstance(args[0], str):
+        return None
+    return None, args[0]
+
+
+def python_messages(source):
+    messages = set()
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+        if name not in GETTEXT_FUNCTIONS:
+            continue
+        args = [arg.value if isinstance(arg, ast.Constant) else None for arg in node.args]
+        message = _message('gettext' if name == '_' else name, args)
+        if message:
+            messages.add(message)
+    return messages
+
+
+def template_messages(source):
+    messages = set()
+    for match in TEMPLATIZED_CALL.finditer(templatize(source)):
+        args = [ast.literal_eval(literal) for literal in LITERAL.findall(match.group(2))]
+        message = _message(match.group(1), args)
+        if message:
+            messages.add(message)
+    return messages
+
+
+def _is_test_path(path):
+    return 'tests' in path.parts or path.name.startswith('test_')
+
+
+def _app_files(root):
+    """Files under an app, minus tests and nested apps (which are scanned if installed)."""
+    nested = {path.parent for path in root.rglob('apps.py') if path.parent != root}
+    for path in root.rglob('*'):
+        if not path.is_file() or _is_test_path(path.relative_to(root)):
+            continue
+        if any(parent in nested for parent in path.parents):
+            continue
+        yield path
+
+
+def source_files():
+    """Every Python file and template the site's strings can come from."""
+    roots = [Path(app_config.path) for app_config in apps.get_app_configs()]
+    roots.append(Path(import_module(settings.ROOT_URLCONF).__file__).parent)
+    django_root = Path(django.__file__).parent
+    roots += [
+        path
+        for path in django_root.iterdir()
+        if path.is_dir() and path.name not in ('contrib', 'conf', '__pycache__')
+    ]
+    files = set()
+    for root in roots:
+        files.update(_app_files(root))
+    for engine in settings.TEMPLATES:
+        for directory in engine.get('DIRS', []):
+            files.update(path for path in Path(directory).rglob('*') if path.is_file())
+    return sorted(files)
+
+
+def used_messages(files=None):
+    """The set of ``(context, msgid)`` pairs referenced by ``files`` (default: the site)."""
+    messages = set()
+    for file in source_files() if files is None else files:
+        path = Path(file)
+        if path.suffix == '.py':
+            try:
+                messages |= python_messages(path.read_text(encoding='utf-8'))
+            except (SyntaxError, UnicodeDecodeError):
+                continue
+        elif path.suffix in TEMPLATE_SUFFIXES and 'templates' in path.parts:
+            try:
+                messages |= template_messages(path.read_text(encoding='utf-8'))
+            except (UnicodeDecodeError, ValueError, SyntaxError):
+                continue
+    return messages
+
+
+def _unquote(lines):
+    return ''.join(ast.literal_eval(line) for line in lines)
+
+
+def read_po(path):
+    """
+    Parse a .po file into PoEntry tuples, one per blank-line-separated block.
+
+    ``text`` is the block exactly as written, so pruned catalogs keep comments and flags.
+    The header is the entry with an empty msgid. Obsolete (``#~``) blocks are dropped.
+    """
+    entries = []
+    for block in re.split(r'\n\s*\n', Path(path).read_text(encoding='utf-8')):
+        lines = block.strip().splitlines()
+        if not lines or all(line.startswith('#') for line in lines):
+            continue
+        fields, current = {}, None
+        for line in lines:
+            if line.startswith('#'):
+                continue
+            keyword, _space, rest = line.partition(' ')
+            if line.startswith('"'):
+                fields[current].append(line)
+            else:
+                current = keyword
+                fields[current] = [rest]
+        msgstrs = [_unquote(value) for key, value in fields.items() if key.startswith('msgstr')]
+        fuzzy = any(line.startswith('#,') and 'fuzzy' in line for line in lines)
+        entries.append(
+            PoEntry(
+                context=_unquote(fields['msgctxt']) if 'msgctxt' in fields else None,
+                msgid=_unquote(fields.get('msgid', ['""'])),
+                translated=bool(msgstrs) and all(msgstrs) and not fuzzy,
+                text=block.strip(),
+            )
+        )
+    return entries
+
+
+def write_po(path, entries):
+    Path(path).write_text('\n\n'.join(entry.text for entry in entries) + '\n', encoding='utf-8')
+
+
+def prune_entries(entries, used):
+    """Keep the header and the entries whose ``(context, msgid)`` is in ``used``."""
+    return [
+        entry for entry in entries if not entry.msgid or (entry.context, entry.msgid) in used
+    ]
@@ -0,0 +1,278 @@
+"""
+Lightweight per-view request instrumentation.
+
+Every request is timed and its database activity counted while it runs. Samples are
+folded into in-process log-linear (HDR-style) histograms keyed by view name, so the
+memory cost is fixed no matter how much traffic a worker serves. The collected data is
+exported in Prometheus text format by ``base.views.MetricsView``.
+
+Settings:
+    INSTRUMENTATION_ENABLED        - turn recording on/off (default True)
+    INSTRUMENTATION_QUERY_BUDGETS  - {view_name: max queries}; requests over budget are
+                                     logged as warnings and fail ``query_budget()`` in tests.
+                                     Keys may be prefixed with a method ('GET settings') to
+                                     budget only that method; the prefixed key wins.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+def log_linear_bounds(lowest, highest, sub_buckets=4):
+    """
+    Build HDR-style bucket upper bounds between ``lowest`` and ``highest``.
+
+    Each power of two is split into ``sub_buckets`` linear steps, which keeps the relative
+    error of every bucket below ``1 / sub_buckets`` with only a few dozen buckets.
+    """
+    bounds = []
+    magnitude = lowest
+    while magnitude < highest:
+        step = magnitude / sub_buckets
+        for i in range(1, sub_buckets + 1):
+            bound = magnitude + step * i
+            if not bounds or bound > bounds[-1]:
+                bounds.append(bound)
+        magnitude *= 2
+    return tuple(bounds)
+
+
+# Latencies in seconds: 0.25ms .. ~33s
+LATENCY_BOUNDS = log_linear_bounds(0.000125, 30.0)
+# Query counts: integers 1 .. ~1000
+QUERY_COUNT_BOUNDS = (0, *sorted({int(b) for b in log_linear_bounds(1, 1000)}))
+
+
+class Histogram:
+    """Fixed-bucket histogram with a running sum and count (not thread-safe on its own)."""
+
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Yield ``(upper_bound, cumulative_count)`` pairs, ending with ``+Inf``."""
+        running = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            running += count
+            yield bound, running
+        yield float('inf'), self.count
+
+
+class MetricsRegistry:
+    """Process-wide store of histograms and counters, keyed by metric and labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._help = {}
+
+    def describe(self, name, help_text):
+        self._help[name] = help_text
+
+    def observe(self, name, labels, value, bounds=LATENCY_BOUNDS):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(bounds)
+            histogram.observe(value)
+
+    def increment(self, name, labels, amount=1):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def get_histogram(self, name, **labels):
+        return self._histograms.get((name, tuple(sorted(labels.items()))))
+
+    def get_counter(self, name, **labels):
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def render_prometheus(self):
+        """Render every metric in the Prometheus text exposition format (v0.0.4)."""
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        seen = set()
+        for (name, labels), histogram in histograms:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f'# HELP {name} {self._help.get(name, name)}')
+                lines.append(f'# TYPE {name} histogram')
+            for bound, count in histogram.cumulative():
+                le = '+Inf' if bound == float('inf') else _format_number(bound)
+                lines.append(f'{name}_bucket{_format_labels(labels, le=le)} {count}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_number(histogram.sum)}')
+            lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+
+        for (name, labels), value in counters:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f'# HELP {name} {self._help.get(name, name)}')
+                lines.append(f'# TYPE {name} counter')
+            lines.append(f'{name}{_format_labels(labels)} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ''
+    body = ','.join(
+        '{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in pairs
+    )
+    return '{' + body + '}'
+
+
+registry = MetricsRegistry()
+registry.describe('django_request_latency_seconds', 'Total request latency per view')
+registry.describe('django_request_db_seconds', 'Time spent in database queries per view')
+registry.describe('django_request_queries', 'Number of database queries per request')
+registry.describe('django_template_render_seconds', 'Template rendering time per view')
+registry.describe('django_query_budget_exceeded_total', 'Requests that exceeded their budget')
+
+
+class QueryCounter:
+    """``connection.execute_wrapper`` hook that counts queries and their wall time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+@contextmanager
+def count_queries():
+    """Count queries issued on every configured database alias inside the block."""
+    counter = QueryCounter()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(counter))
+        yield counter
+
+
+def get_query_budget(view_name, method=None):
+    budgets = getattr(settings, 'INSTRUMENTATION_QUERY_BUDGETS', {})
+    if method is not None and f'{method} {view_name}' in budgets:
+        return budgets[f'{method} {view_name}']
+    return budgets.get(view_name)
+
+
+@contextmanager
+def query_budget(view_name, budget=None, method='GET'):
+    """
+    Fail with ``AssertionError`` if the block runs more queries than the view's budget.
+
+    Intended for tests::
+
+        with query_budget('settings'):
+            client.get('/settings/')
+    """
+    if budget is None:
+        budget = get_query_budget(view_name, method)
+    if budget is None:
+        raise AssertionError(f'No query budget configured for view {view_name!r}')
+    with count_queries() as counter:
+        yield counter
+    if counter.count > budget:
+        raise AssertionError(
+            f'{view_name!r} ran {counter.count} queries, budget is {budget}'
+        )
+
+
+def _view_name(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return '<unresolved>'
+    return match.view_name or match.route or '<unnamed>'
+
+
+class InstrumentationMiddleware:
+    """
+    Record latency, query count, DB time and template render time for each request.
+
+    Place it first in ``MIDDLEWARE`` so the latency covers the whole stack.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'INSTRUMENTATION_ENABLED', True)
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        request._instrumentation_render = 0.0
+        start = time.perf_counter()
+        with count_queries() as counter:
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        view = _view_name(request)
+        labels = {'view': view}
+        registry.observe('django_request_latency_seconds', labels, elapsed)
+        registry.observe('django_request_db_seconds', labels, counter.duration)
+        registry.observe('django_request_queries', labels, counter.count, QUERY_COUNT_BOUNDS)
+        if request._instrumentation_render:
+            registry.observe(
+                'django_template_render_seconds', labels, request._instrumentation_render
+            )
+
+        budget = get_query_budget(view, request.method)
+        if budget is not None and counter.count > budget:
+            registry.increment('django_query_budget_exceeded_total', labels)
+            logger.warning(
+                'Query budget exceeded for %s: %d queries (budget %d)', view, counter.count, budget
+            )
+        return response
+
+    def process_template_response(self, request, response):
+        """Time the render that the handler performs right after this hook."""
+        if not hasattr(request, '_instrumentation_render'):
+            return response
+        started = time.perf_counter()
+
+        def _record(rendered):
+            request._instrumentation_render += time.perf_counter() - started
+
+        response.add_post_render_callback(_record)
+        return response
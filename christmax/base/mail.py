@@ -0,0 +1,189 @@
+"""
+Durable email outbox: requests enqueue mail, a separate process delivers it.
+
+``OutboxEmailBackend`` stores each rendered message as an ``OutboxMessage`` row and returns
+at once. This means allauth's verification and password-reset mails never wait on an SMTP
+handshake inside a request. ``ATOMIC_REQUESTS`` is off, so the rows are committed as soon
+as they are written, unless the caller sends inside its own ``transaction.atomic()`` block.
+
+``manage.py send_outbox`` drains the table:
+
+- It claims up to ``batch_size`` due rows. On PostgreSQL this uses ``SKIP LOCKED``, so
+  several senders can run at once. Each claimed row gets a lease, pushing its
+  ``next_attempt_at`` forward so a crashed sender's batch is retried later.
+- It sends the batch over one connection from ``OUTBOX_EMAIL_BACKEND``, which defaults to
+  SMTP.
+- It deletes the delivered rows. Temporary failures (4xx replies, dropped connections) are
+  retried with exponential back-off. Permanent 5xx rejections, and messages that reach
+  ``OUTBOX_MAX_ATTEMPTS``, become dead letters.
+
+Outcomes are counted in ``django_outbox_messages_total{result}`` (queued, sent, retry,
+failed) and exported at /metrics.
+"""
+
+import contextlib
+import smtplib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import connection as db_connection
+from django.db import transaction
+from django.utils import timezone
+
+from base.instrumentation import registry
+from base.models import OutboxMessage
+
+registry.describe('django_outbox_messages_total', 'Outbox emails by outcome')
+
+# A claimed batch is invisible to other senders for this long
+LEASE = timedelta(minutes=5)
+
+
+def _record(result, count=1):
+    if count:
+        registry.increment('django_outbox_messages_total', {'result': result}, count)
+
+
+class OutboxEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        rows = [
+            OutboxMessage(
+                from_email=message.from_email,
+                recipients=message.recipients(),
+                payload=message.message().as_bytes(),
+                next_attempt_at=timezone.now(),
+            )
+            for message in email_messages
+            if message.recipients()
+        ]
+        OutboxMessage.objects.bulk_create(rows)
+        _record('queued', len(rows))
+        return len(rows)
+
+
+class _StoredMIME:
+    """The stored bytes, behind the slice of the MIME API that mail backends call."""
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def as_bytes(self, linesep='\n', **kwargs):
+        lines = self.payload.replace(b'\r\n', b'\n').split(b'\n')
+        return linesep.encode().join(lines)
+
+    def get_charset(self):
+        return None
+
+
+class StoredEmailMessage(EmailMessage):
+    """An EmailMessage whose MIME body was rendered when it was queued."""
+
+    def __init__(self, row):
+        super().__init__(from_email=row.from_email, to=row.recipients)
+        self.payload = bytes(row.payload)
+
+    def message(self, **kwargs):
+        return _StoredMIME(self.payload)
+
+
+def claim_batch(batch_size):
+    """Lease up to ``batch_size`` due messages to this sender."""
+    now = timezone.now()
+    with transaction.atomic():
+        due = OutboxMessage.objects.filter(next_attempt_at__lte=now).order_by('next_attempt_at')
+        if db_connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        batch = list(due[:batch_size])
+        OutboxMessage.objects.filter(pk__in=[row.pk for row in batch]).update(
+            next_attempt_at=now + LEASE
+        )
+    return batch
+
+
+def retry_delay(attempts):
+    base = getattr(settings, 'OUTBOX_RETRY_BASE_SECONDS', 30)
+    cap = getattr(settings, 'OUTBOX_RETRY_MAX_SECONDS', 3600)
+    return timedelta(seconds=min(cap, base * 2 ** (attempts - 1)))
+
+
+def _is_permanent(error):
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _msg in error.recipients.values())
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+def _fail(row, error):
+    row.attempts += 1
+    row.last_error = f'{type(error).__name__}: {error}'[:2000]
+    max_attempts = getattr(settings, 'OUTBOX_MAX_ATTEMPTS', 8)
+    if _is_permanent(error) or row.attempts >= max_attempts:
+        row.next_attempt_at = None
+        _record('failed')
+    else:
+        row.next_attempt_at = timezone.now() + retry_delay(row.attempts)
+        _record('retry')
+    row.save(update_fields=['attempts', 'last_error', 'next_attempt_at'])
+
+
+def _reopen(connection):
+    """Reconnect after a dropped connection; return the error if that fails too."""
+    try:
+        connection.close()
+        connection.open()
+    except OSError as e:  # SMTPException is an OSError too
+        return e
+    return None
+
+
+def deliver(batch, connection=None):
+    """
+    Send ``batch`` over one connection; return the number delivered.
+
+    A dropped connection is reopened after the message that hit it. If it cannot be
+    reopened, the rest of the batch is rescheduled rather than failed one by one against a
+    dead server.
+    """
+    if connection is None:
+        backend = getattr(
+            settings, 'OUTBOX_EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend'
+        )
+        connection = get_connection(backend, fail_silently=False)
+    try:
+        connection.open()
+    except OSError as e:
+        for row in batch:
+            _fail(row, e)
+        return 0
+    sent = []
+    try:
+        for index, row in enumerate(batch):
+            try:
+                connection.send_messages([StoredEmailMessage(row)])
+            except OSError as e:
+                _fail(row, e)
+                dropped = not isinstance(e, smtplib.SMTPException) or isinstance(
+                    e, smtplib.SMTPServerDisconnected
+                )
+                if dropped and (reopen_error := _reopen(connection)):
+                    for rest in batch[index + 1 :]:
+                        _fail(rest, reopen_error)
+                    break
+            else:
+                sent.append(row.pk)
+    finally:
+        with contextlib.suppress(OSError):
+            connection.close()
+    OutboxMessage.objects.filter(pk__in=sent).delete()
+    _record('sent', len(sent))
+    return len(sent)
+
+
+def drain(batch_size=100, connection=None):
+    """Deliver due messages until none are left; return the number delivered."""
+    total = 0
+    while batch := claim_batch(batch_size):
+        total += deliver(batch, connection)
+    return total
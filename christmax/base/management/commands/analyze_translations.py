@@ -0,0 +1,86 @@
+"""
+Django management command to report which catalog entries the site actually uses.
+
+Scans installed apps, the project package, Django's non-contrib packages and template
+directories for translatable strings (see base/i18n_usage.py), then compares them with each
+source catalog in base/locale. For each file it reports entries, used entries and the
+translated share of the used ones. It also lists project strings that no catalog translates.
+``compile_translations --prune`` drops the unused vendor entries before merging.
+
+Usage:
+    python manage.py analyze_translations
+    python manage.py analyze_translations --locale zh --show-missing
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from base.i18n_usage import VENDOR_CATALOGS
+from base.i18n_usage import read_po
+from base.i18n_usage import source_files
+from base.i18n_usage import used_messages
+
+SOURCE_CATALOGS = ('manual.po', 'app.po', *VENDOR_CATALOGS)
+
+
+class Command(BaseCommand):
+    """Translation coverage and dead-string report."""
+
+    help = 'Report used, unused and untranslated strings per translation catalog'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--locale', '-l', action='append', dest='locales', help='Locale(s) to report'
+        )
+        parser.add_argument(
+            '--show-missing', action='store_true', help='List untranslated project strings'
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        locale_dir = Path(settings.BASE_DIR) / 'base' / 'locale'
+        files = source_files()
+        used = used_messages(files)
+        project = used_messages(
+            path for path in files if Path(settings.BASE_DIR) in path.parents
+        )
+        self.stdout.write(f'{len(used):,} strings referenced, {len(project):,} by the project\n')
+
+        locales = options['locales'] or sorted(
+            d.name for d in locale_dir.iterdir() if (d / 'LC_MESSAGES').is_dir()
+        )
+        for locale in locales:
+            self._report(locale, locale_dir / locale / 'LC_MESSAGES', used, project, options)
+
+    def _report(self, locale, lang_dir, used, project, options):
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Language: {locale}'))
+        translated = set()
+        for name in SOURCE_CATALOGS:
+            path = lang_dir / name
+            if not path.exists():
+                continue
+            entries = [entry for entry in read_po(path) if entry.msgid]
+            live = [entry for entry in entries if (entry.context, entry.msgid) in used]
+            translated.update((e.context, e.msgid) for e in live if e.translated)
+            done = sum(entry.translated for entry in live)
+            share = f'{done / len(live):.0%}' if live else '-'
+            self.stdout.write(
+                f'  {name:<15} {len(entries):>5} entries  {len(live):>5} used  '
+                f'{len(entries) - len(live):>5} unused  {share:>4} of used translated'
+            )
+
+        if locale.split('_')[0] == 'en':
+            # msgids are English, so English needs no translations of its own
+            self.stdout.write('')
+            return
+        missing = sorted(project - translated, key=lambda message: message[1])
+        coverage = 1 - len(missing) / len(project) if project else 1
+        self.stdout.write(f'  Project strings translated: {coverage:.1%} ({len(missing)} missing)')
+        if options['show_missing']:
+            for context, msgid in missing:
+                label = f'{context} | {msgid}' if context else msgid
+                self.stdout.write(f'    - {label!r}')
+        self.stdout.write('')
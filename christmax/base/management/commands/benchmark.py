@@ -0,0 +1,151 @@
+"""
+Django management command to run the benchmark suite in ``benchmarks/``.
+
+By default every benchmark runs in-process against a throwaway test database, so no
+server or network is needed. With ``--base-url`` the HTTP flows drive a running local
+server instead (e.g. ``manage.py runserver`` or gunicorn); in-process-only flows such
+as the mocked Google login are skipped.
+
+Usage:
+    python manage.py benchmark
+    python manage.py benchmark --flow home_anonymous_en --flow signup_email -n 200
+    python manage.py benchmark --base-url http://127.0.0.1:8000
+    python manage.py benchmark --save-baseline
+"""
+
+import importlib
+import pkgutil
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.test import Client
+from django.test.utils import override_settings
+from django.test.utils import setup_databases
+from django.test.utils import setup_test_environment
+from django.test.utils import teardown_databases
+from django.test.utils import teardown_test_environment
+
+
+class Command(BaseCommand):
+    """Run benchmarks, report p50/p95/p99 and req/s, and compare against baselines."""
+
+    help = 'Run the offline benchmark suite and fail on regressions against stored baselines'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--flow',
+            action='append',
+            dest='flows',
+            help='Benchmark(s) to run. Default is to run all registered benchmarks.',
+        )
+        parser.add_argument(
+            '--iterations', '-n', type=int, default=100, help='Timed iterations per benchmark'
+        )
+        parser.add_argument(
+            '--base-url', help='Drive a running server instead of the in-process test client'
+        )
+        parser.add_argument(
+            '--save-baseline',
+            action='store_true',
+            help='Store these results as the new baselines instead of comparing',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='Allowed p95/throughput regression as a fraction (default 0.25)',
+        )
+        parser.add_argument('--list', action='store_true', help='List benchmarks and exit')
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        from benchmarks import harness
+
+        self._discover()
+
+        if options['list']:
+            for name, bench in sorted(harness.REGISTRY.items()):
+                kind = 'http' if bench.http else 'in-process'
+                self.stdout.write(f'{name:<28} {kind}')
+            return
+
+        names = options['flows'] or sorted(harness.REGISTRY)
+        unknown = set(names) - set(harness.REGISTRY)
+        if unknown:
+            raise CommandError(f'Unknown benchmark(s): {", ".join(sorted(unknown))}')
+
+        if not options['save_baseline'] and not harness.BASELINES_FILE.exists():
+            raise CommandError(
+                f'No baselines at {harness.BASELINES_FILE}: record them on this machine with '
+                '--save-baseline first'
+            )
+
+        base_url = options['base_url']
+        benches = [harness.REGISTRY[name] for name in names]
+        if base_url:
+            skipped = [b.name for b in benches if b.in_process_only]
+            if skipped:
+                self.stdout.write(
+                    self.style.WARNING(f'Skipping in-process-only: {", ".join(skipped)}')
+                )
+            benches = [b for b in benches if not b.in_process_only]
+
+            def session_factory():
+                return harness.HttpSession(base_url)
+        else:
+            session_factory = Client
+
+        results = self._run(harness, benches, options['iterations'], session_factory, base_url)
+
+        if options['save_baseline']:
+            harness.save_baselines(results, harness.BASELINES_FILE)
+            self.stdout.write(
+                self.style.SUCCESS(f'\n✓ Saved baselines to {harness.BASELINES_FILE}')
+            )
+            return
+
+        baselines = harness.load_baselines(harness.BASELINES_FILE)
+        regressions = []
+        for result in results:
+            if result.name in baselines:
+                regressions += harness.compare(result, baselines[result.name], options['tolerance'])
+        unrecorded = [result.name for result in results if result.name not in baselines]
+        if unrecorded:
+            self.stdout.write(
+                self.style.WARNING(f'No baseline (not compared): {", ".join(unrecorded)}')
+            )
+
+        if regressions:
+            raise CommandError('Performance regressions:\n  ' + '\n  '.join(regressions))
+        self.stdout.write(self.style.SUCCESS(f'\n✓ {len(results)} benchmark(s), no regressions'))
+
+    def _discover(self):
+        """Import every module in the benchmarks package so they can register."""
+        import benchmarks
+
+        for module in pkgutil.iter_modules(benchmarks.__path__):
+            importlib.import_module(f'benchmarks.{module.name}')
+
+    def _run(self, harness, benches, iterations, session_factory, base_url):
+        results = []
+        old_config = None
+        if not base_url:
+            setup_test_environment(debug=False)
+            old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            # Flows hammer signup/login far beyond allauth's per-IP rate limits
+            with override_settings(ACCOUNT_RATE_LIMITS=False):
+                for bench in benches:
+                    try:
+                        result = harness.run(bench, iterations, session_factory)
+                    except harness.SkipBenchmark as e:
+                        self.stdout.write(self.style.WARNING(f'{bench.name:<28} skipped: {e}'))
+                        continue
+                    self.stdout.write(result.as_row())
+                    results.append(result)
+        finally:
+            if old_config is not None:
+                teardown_databases(old_config, verbosity=0)
+                teardown_test_environment()
+        return results
@@ -0,0 +1,53 @@
+"""
+Django management command to delete expired sessions in small batches.
+
+``clearsessions`` removes every expired ``django_session`` row in one DELETE, which holds
+locks and bloats the WAL on a large table. This command walks the ``expire_date`` index and
+deletes at most ``--batch-size`` rows per statement, optionally pausing between batches.
+It then runs the configured engine's own ``clear_expired()`` (a no-op for cache and cookie
+sessions, which expire by themselves).
+
+Usage:
+    python manage.py cleanup_sessions
+    python manage.py cleanup_sessions --batch-size 1000 --sleep 0.1
+"""
+
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+def delete_expired_sessions(batch_size=5000, sleep=0.0):
+    """Delete expired database sessions ``batch_size`` rows at a time; return the count."""
+    now = timezone.now()
+    expired = Session.objects.filter(expire_date__lt=now)
+    total = 0
+    while True:
+        keys = list(expired.values_list('pk', flat=True)[:batch_size])
+        if not keys:
+            return total
+        total += Session.objects.filter(pk__in=keys).delete()[0]
+        if sleep:
+            time.sleep(sleep)
+
+
+class Command(BaseCommand):
+    """Batched replacement for clearsessions."""
+
+    help = 'Delete expired sessions in batches'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per DELETE')
+        parser.add_argument('--sleep', type=float, default=0.0, help='Seconds between batches')
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        deleted = delete_expired_sessions(options['batch_size'], options['sleep'])
+        engine = import_module(settings.SESSION_ENGINE)
+        engine.SessionStore.clear_expired()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted:,} expired database sessions'))
@@ -2,7 +2,11 @@
 Django management command to compile translations from modular .po files.
 
 This command merges multiple translation source files into a single django.po file
-and then compiles it to django.mo for use by Django's translation system.
+and then compiles it to django.mo for use by Django's translation system. It also writes
+django.cat, the same catalog in the memory-mapped format read by base.translation.
+
+With --prune, entries of the vendor catalogs (allauth.po, django-core.po) that the site
+never references are dropped before merging (see analyze_translations).
 
 Source files (in priority order - first has highest priority):
 1. manual.po      - Manual overrides and fixes
@@ -14,14 +18,23 @@ Usage:
     python manage.py compile_translations
     python manage.py compile_translations --locale zh
     python manage.py compile_translations --verbose
+    python manage.py compile_translations --prune
 """
 
 import subprocess
+import tempfile
 from pathlib import Path
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
+from base.i18n_usage import VENDOR_CATALOGS
+from base.i18n_usage import prune_entries
+from base.i18n_usage import read_po
+from base.i18n_usage import used_messages
+from base.i18n_usage import write_po
+from base.translation import write_catalog
+
 
 class Command(BaseCommand):
     """Compile translations by merging multiple .po files."""
@@ -42,6 +55,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Show detailed list of files being merged",
         )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Drop vendor catalog entries the site never uses before merging",
+        )
 
     def handle(self, *args, **options):
         """Execute the command."""
@@ -71,107 +89,125 @@ class Command(BaseCommand):
             return
 
         total_compiled = 0
+        used = used_messages() if options.get("prune") else None
+        # Removed on the way out, also when a locale fails with CommandError
+        with tempfile.TemporaryDirectory() as pruned_dir:
+            for lang_code in locale_codes:
+                lang_dir = locale_dir / lang_code / "LC_MESSAGES"
+
+                if not lang_dir.exists():
+                    if show_files or verbosity > 1:
+                        self.stdout.write(
+                            self.style.WARNING(f"Skipping {lang_code}: No LC_MESSAGES directory")
+                        )
+                    continue
+
+                # Define source files in priority order (first = highest priority)
+                source_files = [
+                    lang_dir / "manual.po",  # Highest priority
+                    lang_dir / "app.po",  # Custom project strings
+                    lang_dir / "allauth.po",  # Allauth translations
+                    lang_dir / "django-core.po",  # Django core (lowest priority)
+                ]
 
-        for lang_code in locale_codes:
-            lang_dir = locale_dir / lang_code / "LC_MESSAGES"
+                # Filter to existing files
+                existing_files = [f for f in source_files if f.exists()]
 
-            if not lang_dir.exists():
-                if show_files or verbosity > 1:
-                    self.stdout.write(
-                        self.style.WARNING(f"Skipping {lang_code}: No LC_MESSAGES directory")
+                if not existing_files:
+                    if show_files or verbosity > 1:
+                        self.stdout.write(
+                            self.style.WARNING(
+                                f"Skipping {lang_code}: No source .po files found"
+                            )
+                        )
+                    continue
+
+                if used is not None:
+                    existing_files = [
+                        self._pruned(f, used, Path(pruned_dir) / lang_code, show_files)
+                        if f.name in VENDOR_CATALOGS
+                        else f
+                        for f in existing_files
+                    ]
+
+                # Output file
+                output_file = lang_dir / "django.po"
+
+                # Merge using msgcat (--use-first gives priority to first file)
+                try:
+                    if show_files or verbosity > 1:
+                        self.stdout.write(
+                            f"\nMerging {len(existing_files)} files for {lang_code}:"
+                        )
+                        for f in existing_files:
+                            self.stdout.write(f"  - {f.name}")
+
+                    cmd = [
+                        "msgcat",
+                        "--use-first",  # First occurrence wins
+                        "--sort-output",  # Alphabetical order
+                        "-o",
+                        str(output_file),
+                    ] + [str(f) for f in existing_files]
+
+                    result = subprocess.run(
+                        cmd,
+                        check=True,
+                        capture_output=True,
+                        text=True,
                     )
-                continue
 
-            # Define source files in priority order (first = highest priority)
-            source_files = [
-                lang_dir / "manual.po",  # Highest priority
-                lang_dir / "app.po",  # Custom project strings
-                lang_dir / "allauth.po",  # Allauth translations
-                lang_dir / "django-core.po",  # Django core (lowest priority)
-            ]
+                    if show_files and result.stdout:
+                        self.stdout.write(result.stdout)
 
-            # Filter to existing files
-            existing_files = [f for f in source_files if f.exists()]
+                except subprocess.CalledProcessError as e:
+                    raise CommandError(
+                        f"Failed to merge .po files for {lang_code}: {e.stderr}"
+                    )
+                except FileNotFoundError:
+                    raise CommandError(
+                        "msgcat command not found. Please install gettext utilities:\n"
+                        "  macOS: brew install gettext\n"
+                        "  Ubuntu/Debian: apt-get install gettext\n"
+                        "  Windows: https://mlocati.github.io/articles/gettext-iconv-windows.html"
+                    )
 
-            if not existing_files:
-                if show_files or verbosity > 1:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"Skipping {lang_code}: No source .po files found"
-                        )
+                # Compile to .mo using msgfmt
+                try:
+                    mo_file = lang_dir / "django.mo"
+                    compile_cmd = [
+                        "msgfmt",
+                        "-o",
+                        str(mo_file),
+                        str(output_file),
+                    ]
+
+                    result = subprocess.run(
+                        compile_cmd,
+                        check=True,
+                        capture_output=True,
+                        text=True,
                     )
-                continue
 
-            # Output file
-            output_file = lang_dir / "django.po"
+                    if show_files and result.stdout:
+                        self.stdout.write(result.stdout)
 
-            # Merge using msgcat (--use-first gives priority to first file)
-            try:
-                if show_files or verbosity > 1:
+                    total_compiled += 1
                     self.stdout.write(
-                        f"\nMerging {len(existing_files)} files for {lang_code}:"
+                        self.style.SUCCESS(f"✓ Compiled {lang_code}/LC_MESSAGES/django.mo")
                     )
-                    for f in existing_files:
-                        self.stdout.write(f"  - {f.name}")
-
-                cmd = [
-                    "msgcat",
-                    "--use-first",  # First occurrence wins
-                    "--sort-output",  # Alphabetical order
-                    "-o",
-                    str(output_file),
-                ] + [str(f) for f in existing_files]
-
-                result = subprocess.run(
-                    cmd,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
 
-                if show_files and result.stdout:
-                    self.stdout.write(result.stdout)
-
-            except subprocess.CalledProcessError as e:
-                raise CommandError(
-                    f"Failed to merge .po files for {lang_code}: {e.stderr}"
-                )
-            except FileNotFoundError:
-                raise CommandError(
-                    "msgcat command not found. Please install gettext utilities:\n"
-                    "  macOS: brew install gettext\n"
-                    "  Ubuntu/Debian: apt-get install gettext\n"
-                    "  Windows: https://mlocati.github.io/articles/gettext-iconv-windows.html"
-                )
-
-            # Compile to .mo using msgfmt
-            try:
-                mo_file = lang_dir / "django.mo"
-                compile_cmd = [
-                    "msgfmt",
-                    "-o",
-                    str(mo_file),
-                    str(output_file),
-                ]
-
-                result = subprocess.run(
-                    compile_cmd,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-
-                if show_files and result.stdout:
-                    self.stdout.write(result.stdout)
+                except subprocess.CalledProcessError as e:
+                    raise CommandError(
+                        f"Failed to compile .mo file for {lang_code}: {e.stderr}"
+                    )
 
-                total_compiled += 1
+                # Memory-mapped copy for MappedDjangoTranslation (see base/translation.py)
+                entries = write_catalog(mo_file, lang_dir / "django.cat")
                 self.stdout.write(
-                    self.style.SUCCESS(f"✓ Compiled {lang_code}/LC_MESSAGES/django.mo")
-                )
-
-            except subprocess.CalledProcessError as e:
-                raise CommandError(
-                    f"Failed to compile .mo file for {lang_code}: {e.stderr}"
+                    self.style.SUCCESS(
+                        f"✓ Wrote {lang_code}/LC_MESSAGES/django.cat ({entries} entries)"
+                    )
                 )
 
         # Also compile JavaScript translations if they exist
@@ -187,6 +223,16 @@ class Command(BaseCommand):
         else:
             self.stdout.write(self.style.WARNING("No translations were compiled"))
 
+    def _pruned(self, po_file, used, out_dir, show_files):
+        """Write ``po_file`` minus unused entries to ``out_dir`` and return the new path."""
+        entries = read_po(po_file)
+        kept = prune_entries(entries, used)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        write_po(out_dir / po_file.name, kept)
+        if show_files:
+            self.stdout.write(f"  Pruned {po_file.name}: kept {len(kept)} of {len(entries)}")
+        return out_dir / po_file.name
+
     def _compile_js_translations(self, locale_dir, locales, show_files, verbosity):
         """Compile JavaScript translation files (djangojs.po -> djangojs.mo)."""
         if locales:
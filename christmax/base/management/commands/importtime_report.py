@@ -0,0 +1,134 @@
+"""
+Django management command to measure cold-start (worker boot) time per settings profile.
+
+Each run spawns a fresh interpreter with ``python -X importtime`` that does what a WSGI
+worker does before serving its first request: ``django.setup()`` plus loading the URLconf.
+The report shows the median wall time over all runs and the slowest imports of the last one.
+
+Usage:
+    python manage.py importtime_report
+    python manage.py importtime_report --profile christmax.settings.dev --profile christmax.settings.prod
+    python manage.py importtime_report --runs 5 --top 30
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+BOOT_SCRIPT = (
+    'import django; django.setup(); '
+    'from django.conf import settings; from django.urls import get_resolver; '
+    'get_resolver(settings.ROOT_URLCONF).url_patterns'
+)
+
+
+def parse_importtime(stderr):
+    """
+    Parse ``-X importtime`` output into ``(module, self_us, cumulative_us)`` tuples.
+
+    Lines look like ``import time:       123 |       4567 |   package.module``; the
+    indentation of the module name encodes nesting and is stripped here.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        parts = line[len('import time:') :].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+        except ValueError:
+            continue
+    return rows
+
+
+def top_level_totals(rows):
+    """Sum self time per top-level package (``allauth``, ``django``, ...), in microseconds."""
+    totals = defaultdict(int)
+    for module, self_us, _cumulative in rows:
+        totals[module.split('.')[0]] += self_us
+    return totals
+
+
+class Command(BaseCommand):
+    """Report cold-start time and the heaviest imports for one or more settings profiles."""
+
+    help = 'Measure worker cold-start time with python -X importtime'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--profile',
+            action='append',
+            dest='profiles',
+            help='Settings module(s) to measure. Default is the current DJANGO_SETTINGS_MODULE.',
+        )
+        parser.add_argument('--runs', type=int, default=3, help='Cold starts per profile')
+        parser.add_argument('--top', type=int, default=15, help='Number of imports to list')
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        profiles = options['profiles'] or [settings.SETTINGS_MODULE]
+        summary = []
+
+        for profile in profiles:
+            timings, rows = self._measure(profile, options['runs'])
+            median = statistics.median(timings)
+            summary.append((profile, median))
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'\n{profile}'))
+            self.stdout.write(
+                f'  cold start: median {median * 1000:.0f}ms over {len(timings)} run(s), '
+                f'{len(rows)} modules imported'
+            )
+
+            self.stdout.write('\n  slowest imports (cumulative):')
+            for module, _self_us, cumulative_us in sorted(rows, key=lambda r: -r[2])[
+                : options['top']
+            ]:
+                self.stdout.write(f'    {cumulative_us / 1000:8.1f}ms  {module}')
+
+            self.stdout.write('\n  self time by top-level package:')
+            totals = sorted(top_level_totals(rows).items(), key=lambda kv: -kv[1])
+            for package, self_us in totals[: options['top']]:
+                self.stdout.write(f'    {self_us / 1000:8.1f}ms  {package}')
+
+        if len(summary) > 1:
+            self.stdout.write(self.style.MIGRATE_HEADING('\nSummary'))
+            fastest = min(median for _, median in summary)
+            for profile, median in summary:
+                self.stdout.write(
+                    f'  {profile:<32} {median * 1000:7.0f}ms  (+{(median - fastest) * 1000:.0f}ms)'
+                )
+
+    def _measure(self, profile, runs):
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': profile}
+        # Profiles that read secrets from the environment still need to boot here
+        env.setdefault('SECRET_KEY', 'importtime-report')
+        env.setdefault('ALLOWED_HOSTS', 'localhost')
+        timings = []
+        rows = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            result = subprocess.run(  # noqa: S603
+                [sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT],
+                cwd=settings.BASE_DIR,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            timings.append(time.perf_counter() - started)
+            if result.returncode != 0:
+                tail = result.stderr.strip().splitlines()[-1:] or ['(no output)']
+                raise CommandError(f'{profile} failed to boot: {tail[0]}')
+            rows = parse_importtime(result.stderr)
+        return timings, rows
@@ -0,0 +1,40 @@
+"""
+Django management command to deliver queued email from the outbox.
+
+Run one long-lived sender next to the web workers (several are safe on PostgreSQL). It
+drains due messages over a single SMTP connection per batch, then sleeps for ``--interval``
+seconds. With ``--once`` it exits when the outbox is empty, e.g. from cron. See
+base/mail.py for retries and back-off.
+
+Usage:
+    python manage.py send_outbox
+    python manage.py send_outbox --once --batch-size 200
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from base.mail import drain
+
+
+class Command(BaseCommand):
+    """Drain the email outbox."""
+
+    help = 'Deliver queued outbox email over a reused SMTP connection'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('--batch-size', type=int, default=100, help='Messages per claim')
+        parser.add_argument('--interval', type=float, default=1.0, help='Seconds between polls')
+        parser.add_argument('--once', action='store_true', help='Exit once the outbox is empty')
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        while True:
+            sent = drain(options['batch_size'])
+            if (sent and options['verbosity']) or options['verbosity'] > 1:
+                self.stdout.write(f'Delivered {sent:,} messages')
+            if options['once']:
+                return
+            time.sleep(options['interval'])
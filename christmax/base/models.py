@@ -0,0 +1,44 @@
+from django.db import models
+
+
+class OutboxMessage(models.Model):
+    """
+    An email waiting to be handed to the SMTP server by ``manage.py send_outbox``.
+
+    ``payload`` is the fully rendered MIME message, so the sender needs no templates or
+    request context. Delivered rows are deleted. Rows that exhaust their retries stay with
+    ``next_attempt_at`` unset, as dead letters for inspection.
+    """
+
+    from_email = models.TextField()
+    recipients = models.JSONField()
+    payload = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, db_index=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name = 'outbox message'
+
+    def __str__(self):
+        return f'{", ".join(self.recipients)} (attempt {self.attempts})'
+
+
+class CounterShard(models.Model):
+    """One slice of a ``ShardedCounter`` bucket (see base/counters.py)."""
+
+    name = models.CharField(max_length=100)
+    bucket = models.CharField(max_length=50)
+    shard = models.PositiveSmallIntegerField()
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['name', 'bucket', 'shard'], name='counter_shard_unique'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.name} {self.bucket}#{self.shard}: {self.count}'
@@ -0,0 +1,65 @@
+"""
+Paginators for tables too large to ``COUNT(*)`` on every page view.
+
+``EstimatedCountPaginator`` reads the planner's row estimate for unfiltered querysets and
+caps the count of filtered ones, so the cost of a page no longer grows with the table.
+
+Settings:
+    PAGINATOR_ESTIMATE_THRESHOLD - below this many rows, count exactly (default 10,000)
+    PAGINATOR_COUNT_CAP          - filtered querysets count at most this many rows (default 10,000)
+"""
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimate_table_rows(model, using='default'):
+    """
+    Cheap row-count estimate for ``model``'s table, or None when unavailable.
+
+    PostgreSQL: planner statistics (``pg_class.reltuples``), refreshed by (auto)ANALYZE.
+    SQLite: the largest rowid, an upper bound that ignores deleted rows.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            sql = 'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass'
+            cursor.execute(sql, [table])
+        elif connection.vendor == 'sqlite':
+            quoted = connection.ops.quote_name(table)
+            cursor.execute(f'SELECT MAX(rowid) FROM {quoted}')  # noqa: S608
+        else:
+            return None
+        row = cursor.fetchone()
+    if not row or row[0] is None or row[0] < 0:  # reltuples is -1 before the first ANALYZE
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator whose ``count`` is estimated (unfiltered) or capped (filtered) on big tables."""
+
+    # True when ``count`` is not exact; templates can show "about N"
+    count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        threshold = getattr(settings, 'PAGINATOR_ESTIMATE_THRESHOLD', 10_000)
+        cap = getattr(settings, 'PAGINATOR_COUNT_CAP', 10_000)
+
+        if not queryset.query.where:
+            estimate = estimate_table_rows(queryset.model, queryset.db)
+            if estimate is not None and estimate >= threshold:
+                self.count_is_estimate = True
+                return estimate
+
+        # COUNT over a LIMITed subquery stops scanning after cap + 1 rows
+        count = queryset[: cap + 1].count()
+        if count > cap:
+            self.count_is_estimate = True
+            return cap
+        return count
@@ -0,0 +1,114 @@
+"""
+Hybrid session engine: signed cookies for anonymous players, the cache for logged-in users.
+
+Anonymous game state is small and churns on every guess. Keeping it in a signed cookie
+means it never hits a database or cache, and nothing accumulates server-side. A session
+moves to the cache (``SESSION_CACHE_ALIAS``) once it is authenticated, or once its payload
+outgrows ``SESSION_SIGNED_COOKIE_MAX_BYTES``. Cache-backed sessions can be revoked
+server-side, which a cookie cannot, and that matters once an account is attached.
+
+Creation is lazy: nothing is stored (and no cookie is set) until the session is modified,
+so pure page views never touch session storage.
+
+The two kinds of session key are told apart by shape. Signed payloads contain ``:``;
+random cache keys never do.
+
+Settings:
+    SESSION_ENGINE = 'base.sessions'
+    SESSION_CACHE_ALIAS               - cache for authenticated sessions (must be shared
+                                        between workers, e.g. Redis, in production)
+    SESSION_SIGNED_COOKIE_MAX_BYTES   - larger anonymous payloads go to the cache (default 2048)
+"""
+
+from django.conf import settings
+from django.contrib.sessions.backends import cache
+from django.contrib.sessions.backends.base import CreateError
+from django.core import signing
+
+# Shared with Django's signed_cookies engine, so its cookies stay valid after switching
+SIGNING_SALT = 'django.contrib.sessions.backends.signed_cookies'
+
+
+def is_signed_key(session_key):
+    return bool(session_key) and ':' in session_key
+
+
+class SessionStore(cache.SessionStore):
+    def load(self):
+        if not is_signed_key(self.session_key):
+            return super().load()
+        try:
+            return signing.loads(
+                self.session_key,
+                serializer=self.serializer,
+                max_age=self.get_session_cookie_age(),
+                salt=SIGNING_SALT,
+            )
+        except Exception:  # tampered, expired or undecodable: start over
+            self._session_key = None
+            return {}
+
+    def exists(self, session_key):
+        return not is_signed_key(session_key) and super().exists(session_key)
+
+    def create(self):
+        # Nothing is stored until save() knows where the data belongs
+        self._session_key = None
+        self.modified = True
+
+    def save(self, must_create=False):
+        data = self._get_session(no_load=must_create)
+        payload = self._signed_payload(data)
+        if payload is not None:
+            previous = self.session_key
+            self._session_key = payload
+            if previous and not is_signed_key(previous):
+                super().delete(previous)
+            return
+
+        if self.session_key is None or is_signed_key(self.session_key):
+            self._create_in_cache()
+        else:
+            super().save(must_create=must_create)
+
+    def delete(self, session_key=None):
+        if not is_signed_key(session_key or self.session_key):
+            super().delete(session_key)
+
+    def _signed_payload(self, data):
+        """The signed cookie value for ``data``, or None when it belongs in the cache."""
+        if '_auth_user_id' in data:
+            return None
+        payload = signing.dumps(data, compress=True, salt=SIGNING_SALT, serializer=self.serializer)
+        if len(payload) > getattr(settings, 'SESSION_SIGNED_COOKIE_MAX_BYTES', 2048):
+            return None
+        return payload
+
+    def _create_in_cache(self):
+        # cache.SessionStore.create(), minus its call back into our save()
+        for _ in range(10000):
+            self._session_key = self._get_new_session_key()
+            try:
+                super().save(must_create=True)
+            except CreateError:
+                continue
+            self.modified = True
+            return
+        raise RuntimeError('Unable to create a new session key.')
+
+    # The async API shares the sync implementation, as Django's signed_cookies engine does
+
+    async def aload(self):
+        return self.load()
+
+    async def aexists(self, session_key):
+        return self.exists(session_key)
+
+    async def acreate(self):
+        return self.create()
+
+    async def asave(self, must_create=False):
+        return self.save(must_create=must_create)
+
+    async def adelete(self, session_key=None):
+        return self.delete(session_key)
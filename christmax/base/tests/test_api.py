@@ -0,0 +1,84 @@
+"""JSON API plumbing (base.api)."""
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from base.api import ApiMiddleware
+from base.api import conditional
+from base.api import dumps
+
+
+def test_dumps_is_compact_utf8():
+    assert dumps({'idiom': '一帆風順', 'marks': [2, 0]}) == '{"idiom":"一帆風順","marks":[2,0]}'.encode()
+
+
+def test_conditional_returns_304_for_a_matching_etag():
+    built = []
+
+    def build():
+        built.append(1)
+        return HttpResponse('body')
+
+    request = RequestFactory().get('/api/v1/x/', HTTP_IF_NONE_MATCH='"v1"')
+    response = conditional(request, 'v1', build, private=True)
+    assert response.status_code == 304
+    assert response['ETag'] == '"v1"'
+    assert built == []
+
+    response = conditional(RequestFactory().get('/api/v1/x/'), 'v1', build)
+    assert response.status_code == 200
+    assert 'no-cache' in response['Cache-Control']
+
+
+def test_api_requests_skip_the_page_middleware(client, db):
+    api = client.get('/api/v1/leaderboard/')
+    page = client.get('/wordle/')
+
+    assert api.status_code == page.status_code == 200
+    # XFrameOptionsMiddleware and LocaleMiddleware only ran for the page
+    assert 'X-Frame-Options' in page.headers
+    assert 'X-Frame-Options' not in api.headers
+    assert 'Content-Language' not in api.headers
+    assert json.loads(api.content) == {'players': [], 'next': None}
+
+
+def test_middleware_passes_other_paths_through(settings):
+    settings.API_MIDDLEWARE = []
+    middleware = ApiMiddleware(lambda request: HttpResponse('page'))
+    assert middleware(RequestFactory().get('/wordle/')).content == b'page'
+
+
+def async_only_middleware(get_response):
+    async def middleware(request):
+        response = await get_response(request)
+        response['X-Async-Middleware'] = 'ran'
+        return response
+
+    return middleware
+
+
+async_only_middleware.sync_capable = False
+async_only_middleware.async_capable = True
+
+
+@pytest.mark.django_db
+def test_async_only_api_middleware_is_adapted_under_wsgi_and_asgi(settings):
+    settings.API_MIDDLEWARE = ['base.tests.test_api.async_only_middleware']
+    request = RequestFactory().get('/api/v1/leaderboard/')
+
+    def page(request):
+        return HttpResponse('page')
+
+    async def apage(request):
+        return HttpResponse('page')
+
+    response = ApiMiddleware(page)(request)
+    assert response['X-Async-Middleware'] == 'ran'
+    assert json.loads(response.content) == {'players': [], 'next': None}
+
+    response = async_to_sync(ApiMiddleware(apage))(request)
+    assert response['X-Async-Middleware'] == 'ran'
+    assert async_to_sync(ApiMiddleware(apage))(RequestFactory().get('/')).content == b'page'
@@ -0,0 +1,59 @@
+"""Tests for the benchmark harness statistics and baseline comparison."""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from benchmarks.harness import Benchmark
+from benchmarks.harness import compare
+from benchmarks.harness import load_baselines
+from benchmarks.harness import percentile
+from benchmarks.harness import Result
+from benchmarks.harness import run
+from benchmarks.harness import save_baselines
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile(samples, 99) == 99
+    assert percentile([], 50) == 0.0
+
+
+def test_run_passes_setup_state_and_counts_iterations():
+    calls = []
+    bench = Benchmark('noop', calls.append, http=False, in_process_only=False, setup=lambda: 7)
+
+    result = run(bench, iterations=5, warmup=2)
+
+    assert calls == [7] * 7
+    assert result.iterations == 5
+    assert result.p50 <= result.p95 <= result.p99
+    assert result.rps > 0
+
+
+def test_compare_flags_latency_and_throughput_regressions():
+    baseline = {'p50': 0.010, 'p95': 0.020, 'p99': 0.030, 'rps': 100.0}
+    ok = Result('flow', 10, p50=0.010, p95=0.024, p99=0.030, rps=80.0)
+    slow = Result('flow', 10, p50=0.010, p95=0.030, p99=0.040, rps=50.0)
+
+    assert compare(ok, baseline, tolerance=0.25) == []
+    assert len(compare(slow, baseline, tolerance=0.25)) == 2
+
+
+def test_baselines_round_trip(tmp_path):
+    path = tmp_path / 'baselines.json'
+    save_baselines([Result('flow', 10, p50=0.01, p95=0.02, p99=0.03, rps=100.0)], path)
+
+    assert load_baselines(path) == {'flow': {'p50': 0.01, 'p95': 0.02, 'p99': 0.03, 'rps': 100.0}}
+    assert load_baselines(tmp_path / 'missing.json') == {}
+
+
+def test_command_refuses_to_compare_without_baselines(tmp_path, monkeypatch):
+    from benchmarks import harness
+
+    monkeypatch.setattr(harness, 'BASELINES_FILE', tmp_path / 'baselines.json')
+    with pytest.raises(CommandError, match='--save-baseline'):
+        call_command('benchmark', flows=['home_anonymous_en'], stdout=StringIO())
@@ -0,0 +1,169 @@
+"""Tests for stampede-safe caching: early refresh, single flight, stale-while-revalidate."""
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory
+
+from base import caching
+from base.caching import cache_view
+from base.caching import cached
+from base.caching import get_or_compute
+from base.instrumentation import registry
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    cache.clear()
+    registry.reset()
+    yield
+    cache.clear()
+
+
+def count(name, result):
+    return registry.get_counter('django_cache_requests_total', key=name, result=result)
+
+
+def test_miss_then_hit():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return 'board'
+
+    assert get_or_compute('leaderboard:top', compute, 60) == 'board'
+    assert get_or_compute('leaderboard:top', compute, 60) == 'board'
+
+    assert len(calls) == 1
+    assert count('leaderboard', 'miss') == 1
+    assert count('leaderboard', 'hit') == 1
+
+
+def test_early_refresh_recomputes_before_expiry(monkeypatch):
+    cache.set('daily:puzzle', ('old', 10.0, time.time() + 1), 60)
+    monkeypatch.setattr(caching.random, 'random', lambda: 0.999)  # -log(0.001) * 10s >> 1s
+
+    assert get_or_compute('daily:puzzle', lambda: 'new', 60) == 'new'
+    assert count('daily', 'refresh') == 1
+
+
+def test_stale_value_served_while_another_request_refreshes():
+    cache.set('daily:puzzle', ('old', 0.1, time.time() - 1), 60)
+    cache.add('daily:puzzle' + caching.LOCK_SUFFIX, 1, 30)
+
+    assert get_or_compute('daily:puzzle', pytest.fail, 60) == 'old'
+    assert count('daily', 'stale') == 1
+
+
+def test_concurrent_misses_compute_once():
+    calls = []
+    started = threading.Event()
+
+    def slow_compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return 'stats'
+
+    results = []
+
+    def worker():
+        results.append(get_or_compute('stats:global', slow_compute, 60))
+
+    first = threading.Thread(target=worker)
+    first.start()
+    started.wait()
+    others = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in others:
+        thread.start()
+    for thread in [first, *others]:
+        thread.join()
+
+    assert results == ['stats'] * 5
+    assert len(calls) == 1
+    assert count('stats', 'wait') == 4
+
+
+def test_cached_decorator_keys_on_arguments():
+    calls = []
+
+    @cached(60, key='ranks')
+    def rank(level):
+        calls.append(level)
+        return level * 10
+
+    assert [rank(1), rank(1), rank(2)] == [10, 10, 20]
+    assert calls == [1, 2]
+
+
+def test_cache_view_serves_anonymous_from_cache_and_skips_errors():
+    calls = []
+
+    @cache_view(60, name='leaderboard_view')
+    def view(request):
+        calls.append(request.path)
+        status = 404 if request.path == '/missing/' else 200
+        return HttpResponse(f'rendered {len(calls)}', status=status)
+
+    factory = RequestFactory()
+    assert view(factory.get('/board/')).content == b'rendered 1'
+    response = view(factory.get('/board/'))
+    assert response.content == b'rendered 1'
+    assert 'Cookie' in response['Vary']
+
+    view(factory.get('/missing/'))
+    assert view(factory.get('/missing/')).status_code == 404
+    assert calls == ['/board/', '/missing/', '/missing/']
+
+
+def test_cache_view_keeps_htmx_fragments_apart_from_pages():
+    @cache_view(60)
+    def view(request):
+        return HttpResponse('fragment' if request.headers.get('HX-Request') else 'page')
+
+    factory = RequestFactory()
+    assert view(factory.get('/board/')).content == b'page'
+    assert view(factory.get('/board/', headers={'HX-Request': 'true'})).content == b'fragment'
+    assert view(factory.get('/board/')).content == b'page'
+
+
+def test_cache_view_skips_pages_with_a_csrf_token():
+    calls = []
+
+    @cache_view(60)
+    def view(request):
+        calls.append(1)
+        return HttpResponse(get_token(request))
+
+    view(RequestFactory().get('/board/'))
+    view(RequestFactory().get('/board/'))
+    assert len(calls) == 2
+
+
+@pytest.mark.django_db
+def test_cache_view_bypasses_authenticated_users(django_user_model):
+    user = django_user_model.objects.create_user(username='c', email='c@example.com')
+
+    calls = []
+
+    @cache_view(60)
+    def view(request):
+        calls.append(1)
+        return HttpResponse(request.user.username)
+
+    request = RequestFactory().get('/board/')
+    request.user = user
+    assert view(request).content == b'c'
+    assert view(request).content == b'c'
+    assert len(calls) == 2
+
+
+def test_metrics_are_exported():
+    get_or_compute('leaderboard:top', lambda: 1, 60)
+
+    assert 'django_cache_requests_total{key="leaderboard",result="miss"} 1' in (
+        registry.render_prometheus()
+    )
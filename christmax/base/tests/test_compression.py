@@ -0,0 +1,115 @@
+"""Brotli/gzip response compression (base.compression)."""
+import gzip
+
+import pytest
+from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory
+from django.urls import reverse
+
+from base import compression
+from base.compression import CompressionMiddleware
+from base.compression import negotiate
+from base.instrumentation import registry
+
+PAGE = '<p>Learn something new every day.</p>' * 100
+
+
+def respond(view, accept='gzip, deflate, br', **headers):
+    request = RequestFactory().get('/', headers={'Accept-Encoding': accept, **headers})
+    return CompressionMiddleware(view)(request)
+
+
+@pytest.mark.parametrize(
+    ('header', 'expected'),
+    [
+        ('gzip, deflate, br', 'br'),
+        ('gzip;q=1.0, br;q=0.5', 'gzip'),
+        ('br;q=0, gzip', 'gzip'),
+        ('*', 'br'),
+        ('deflate', None),
+        ('', None),
+        ('gzip;q=0', None),
+    ],
+)
+def test_negotiate(header, expected):
+    assert negotiate(header, ('br', 'gzip')) == expected
+
+
+def test_brotli_is_optional(monkeypatch):
+    monkeypatch.setattr(compression, 'brotli', None)
+    assert compression.codings() == ('gzip',)
+
+
+def test_large_text_is_gzipped(monkeypatch):
+    monkeypatch.setattr(compression, 'brotli', None)
+    registry.reset()
+
+    def view(request):
+        response = HttpResponse(PAGE)
+        response['ETag'] = '"v1"'
+        return response
+
+    response = respond(view)
+    assert response['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.content).decode() == PAGE
+    assert int(response['Content-Length']) == len(response.content) < len(PAGE) // 10
+    assert response['Vary'] == 'Accept-Encoding'
+    assert response['ETag'] == 'W/"v1"'
+    assert registry.get_counter('http_responses_compressed_total', coding='gzip') == 1
+
+
+def test_brotli_when_installed():
+    brotli = pytest.importorskip('brotli')
+    response = respond(lambda request: HttpResponse(PAGE))
+    assert response['Content-Encoding'] == 'br'
+    assert brotli.decompress(response.content).decode() == PAGE
+
+
+@pytest.mark.parametrize(
+    ('content', 'headers'),
+    [
+        ('<p>short</p>', {}),
+        (PAGE, {'Content-Type': 'image/png'}),
+        (PAGE, {'Content-Encoding': 'identity'}),
+    ],
+    ids=['below threshold', 'not text', 'already encoded'],
+)
+def test_left_alone(content, headers):
+    response = respond(lambda request: HttpResponse(content, headers=headers))
+    assert response.content == content.encode()
+    assert response.get('Content-Encoding') in (None, 'identity')
+
+
+def test_pages_with_a_csrf_token_are_not_compressed():
+    def view(request):
+        token = get_token(request)
+        return HttpResponse(f'<input name="csrfmiddlewaretoken" value="{token}">{PAGE}')
+
+    response = respond(view)
+    assert not response.has_header('Content-Encoding')
+    assert response['Vary'] == 'Accept-Encoding'
+
+
+def test_streaming_responses_are_compressed_as_they_stream(monkeypatch):
+    monkeypatch.setattr(compression, 'brotli', None)
+    response = respond(lambda request: StreamingHttpResponse(PAGE for _ in range(50)))
+    assert response['Content-Encoding'] == 'gzip'
+    assert not response.has_header('Content-Length')
+    assert gzip.decompress(b''.join(response.streaming_content)).decode() == PAGE * 50
+
+
+@pytest.mark.django_db
+def test_translation_catalog_is_compressed(client, monkeypatch):
+    monkeypatch.setattr(compression, 'brotli', None)
+    response = client.get('/zh/jsi18n/', headers={'Accept-Encoding': 'gzip'})
+    assert response['Content-Encoding'] == 'gzip'
+    assert 'gettext' in gzip.decompress(response.content).decode()
+
+
+@pytest.mark.django_db
+def test_game_page_with_forms_is_sent_uncompressed(client):
+    response = client.get(reverse('wordle:play'), headers={'Accept-Encoding': 'gzip'})
+    assert 'csrfmiddlewaretoken' in response.content.decode()
+    assert not response.has_header('Content-Encoding')
@@ -0,0 +1,70 @@
+"""Sharded counters (base.counters)."""
+import threading
+
+import pytest
+from django.core.cache import cache
+
+from base.counters import ShardedCounter
+from base.models import CounterShard
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_increments_spread_over_shards():
+    counter = ShardedCounter('puzzle:1', shards=4)
+    for _ in range(200):
+        counter.increment('3')
+    counter.increment('X', amount=5)
+
+    assert counter.aggregate() == {'3': 200, 'X': 5}
+    shards = CounterShard.objects.filter(name='puzzle:1', bucket='3')
+    assert shards.count() == 4
+    assert sorted(shards.values_list('shard', flat=True)) == [0, 1, 2, 3]
+
+
+@pytest.mark.django_db
+def test_counts_are_cached_for_ttl(django_assert_num_queries):
+    counter = ShardedCounter('puzzle:2', ttl=60)
+    counter.increment('4')
+    with django_assert_num_queries(1):
+        assert counter.counts() == {'4': 1}
+        counter.counts()
+
+    counter.increment('4')
+    assert counter.counts() == {'4': 1}
+    assert counter.aggregate() == {'4': 2}
+
+
+@pytest.mark.django_db
+def test_percentages():
+    counter = ShardedCounter('quiz:7', ttl=0)
+    assert counter.percentages() == {}
+    counter.increment('a', amount=3)
+    counter.increment('b')
+    assert counter.percentages() == {'a': 75.0, 'b': 25.0}
+
+
+@pytest.mark.django_db
+def test_counters_are_independent():
+    ShardedCounter('puzzle:3').increment('1')
+    ShardedCounter('puzzle:4').increment('1')
+    assert ShardedCounter('puzzle:3').aggregate() == {'1': 1}
+
+    ShardedCounter('puzzle:3').clear()
+    assert ShardedCounter('puzzle:3').aggregate() == {}
+    assert ShardedCounter('puzzle:4').aggregate() == {'1': 1}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_first_increments_lose_nothing():
+    counter = ShardedCounter('puzzle:5', shards=1)
+    threads = [threading.Thread(target=counter.increment, args=('2',)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.aggregate() == {'2': 8}
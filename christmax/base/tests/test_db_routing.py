@@ -0,0 +1,117 @@
+"""
+Tests for read-replica routing and read-your-writes stickiness.
+
+The test profile configures two in-memory SQLite databases, ``default`` and ``replica``,
+with no replication between them; rows are copied by hand so each test can tell which
+database answered a query.
+"""
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test import override_settings
+
+from base.db_routing import PIN_COOKIE
+from base.db_routing import ReplicaPinningMiddleware
+from base.db_routing import clear_pin
+from base.db_routing import is_pinned
+from base.db_routing import pin_to_primary
+from users.models import Profile
+
+User = get_user_model()
+
+pytestmark = [
+    pytest.mark.django_db(databases=['default', 'replica']),
+    pytest.mark.usefixtures('replica_routing'),
+]
+
+
+@pytest.fixture
+def replica_routing():
+    clear_pin()
+    with override_settings(DATABASE_REPLICAS=['replica'], REPLICA_READ_MODELS=['users.profile']):
+        yield
+    clear_pin()
+
+
+@pytest.fixture
+def replicated_user():
+    """A user written to the primary and 'replicated' with a lagging display name."""
+    user = User.objects.create_user(username='player', email='player@example.com', password='x')
+    Profile.objects.filter(user=user).update(display_name='primary')
+    user.save(using='replica')
+    Profile.objects.using('replica').filter(user=user).update(display_name='replica')
+    clear_pin()
+    return user
+
+
+def test_profile_reads_go_to_replica(replicated_user):
+    assert Profile.objects.get(user=replicated_user).display_name == 'replica'
+
+
+def test_unrouted_models_read_from_primary(replicated_user):
+    User.objects.using('replica').filter(pk=replicated_user.pk).update(first_name='stale')
+    assert User.objects.get(pk=replicated_user.pk).first_name == ''
+
+
+def test_writes_go_to_primary_and_pin_reads(replicated_user):
+    profile = Profile.objects.get(user=replicated_user)
+    profile.display_name = 'updated'
+    profile.save()
+
+    assert is_pinned()
+    assert Profile.objects.get(user=replicated_user).display_name == 'updated'
+    assert Profile.objects.using('replica').get(user=replicated_user).display_name == 'replica'
+
+
+def test_pin_expires(replicated_user):
+    pin_to_primary(seconds=0.01)
+    time.sleep(0.02)
+    assert Profile.objects.get(user=replicated_user).display_name == 'replica'
+
+
+def test_routing_disabled_without_replicas(replicated_user):
+    with override_settings(DATABASE_REPLICAS=[]):
+        assert Profile.objects.get(user=replicated_user).display_name == 'primary'
+
+
+def test_middleware_sets_pin_cookie_after_write(replicated_user):
+    def view(request):
+        Profile.objects.filter(user=replicated_user).update(display_name='written')
+        return HttpResponse()
+
+    response = ReplicaPinningMiddleware(view)(RequestFactory().post('/'))
+
+    assert PIN_COOKIE in response.cookies
+    assert not is_pinned()  # context is restored once the request is done
+
+
+def test_middleware_pins_following_request_from_cookie(replicated_user):
+    seen = {}
+
+    def view(request):
+        seen['name'] = Profile.objects.get(user=replicated_user).display_name
+        return HttpResponse()
+
+    request = RequestFactory().get('/')
+    request.COOKIES[PIN_COOKIE] = f'{time.time() + 5:.3f}'
+    response = ReplicaPinningMiddleware(view)(request)
+
+    assert seen['name'] == 'primary'
+    assert PIN_COOKIE not in response.cookies
+
+
+def test_middleware_ignores_garbage_cookie(replicated_user):
+    seen = {}
+
+    def view(request):
+        seen['name'] = Profile.objects.get(user=replicated_user).display_name
+        return HttpResponse()
+
+    request = RequestFactory().get('/')
+    request.COOKIES[PIN_COOKIE] = 'not-a-timestamp'
+    ReplicaPinningMiddleware(view)(request)
+
+    assert seen['name'] == 'replica'
@@ -0,0 +1,29 @@
+"""Partial responses for htmx requests (base.htmx)."""
+from django.test import RequestFactory
+from django.views.generic import TemplateView
+
+from base.htmx import HtmxTemplateMixin
+from base.htmx import is_htmx
+
+
+class Board(HtmxTemplateMixin, TemplateView):
+    template_name = 'page.html'
+    partial_template_name = 'fragment.html'
+
+
+def test_is_htmx():
+    factory = RequestFactory()
+    assert is_htmx(factory.get('/', headers={'HX-Request': 'true'}))
+    assert not is_htmx(factory.get('/'))
+    # Back/forward after an htmx swap asks for the whole page
+    assert not is_htmx(
+        factory.get('/', headers={'HX-Request': 'true', 'HX-History-Restore-Request': 'true'})
+    )
+
+
+def test_mixin_picks_the_partial_and_varies_on_htmx():
+    factory = RequestFactory()
+    for headers, template in [({}, 'page.html'), ({'HX-Request': 'true'}, 'fragment.html')]:
+        response = Board.as_view()(factory.get('/', headers=headers))
+        assert response.template_name == [template]
+        assert response['Vary'] == 'HX-Request'
@@ -4,6 +4,10 @@ from django.urls import Resolver404
 from django.urls import reverse
 from django.utils.translation import override
 
+from base import i18n_urls
+from base.i18n_urls import language_urls
+from base.i18n_urls import url_for
+
 
 def _resolved_home_path(path: str, client):
     try:
@@ -34,3 +38,56 @@ def test_url_name_conflicts():
     with override('zh'):
         chinese_url = reverse('home_zh')
     assert english_url != chinese_url
+
+
+# Per-language URL map --------------------------------------------------------
+
+def test_language_urls_per_language():
+    assert language_urls('en')['settings'] == '/settings/'
+    assert language_urls('zh')['settings'] == '/zh/settings/'
+    assert language_urls('zh')['home'] == '/zh/'
+
+
+def test_language_urls_unknown_code_falls_back_to_default():
+    assert language_urls('ZH') is language_urls('en')
+    assert language_urls(None) is language_urls('en')
+
+
+def test_language_urls_do_not_reverse_after_first_use(monkeypatch):
+    language_urls('en')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('reverse() called on a warm map')
+
+    monkeypatch.setattr(i18n_urls, 'reverse', fail)
+    assert i18n_urls.language_urls('zh')['account_login'] == '/zh/accounts/login/'
+
+
+def test_url_for_prefers_middleware_language(rf):
+    request = rf.get('/accounts/login/')
+    request.LANGUAGE_CODE = 'zh'
+    assert url_for(request, 'home') == '/zh/'
+    assert url_for(rf.get('/zh/accounts/login/'), 'home') == '/zh/'
+
+
+def test_language_urls_rebuilt_when_languages_change(settings):
+    language_urls('en')
+    settings.LANGUAGES = [('en', 'English')]
+    assert language_urls('zh') is language_urls('en')
+
+
+def test_navbar_links_follow_language(client):
+    html = client.get('/zh/').content.decode('utf-8')
+    assert 'class="navbar-brand" href="/zh/"' in html
+    assert 'href="/zh/accounts/login/"' in html
+
+
+def test_language_switcher_lists_every_language(client, settings):
+    settings.LANGUAGES = [*settings.LANGUAGES, ('fr', 'French')]
+    assert [(code, home) for code, _name, home in i18n_urls.language_choices()] == [
+        ('en', '/'), ('zh', '/zh/'), ('fr', '/fr/')
+    ]
+
+    html = client.get('/').content.decode('utf-8')
+    assert '<option value="fr" data-home="/fr/"' in html
+    assert "'/zh/'" not in html  # the switcher script reads prefixes from the options
@@ -0,0 +1,157 @@
+"""Translation usage analysis and catalog pruning (base.i18n_usage)."""
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from base.i18n_usage import prune_entries
+from base.i18n_usage import python_messages
+from base.i18n_usage import read_po
+from base.i18n_usage import template_messages
+from base.i18n_usage import used_messages
+from base.i18n_usage import write_po
+
+PO = '''# Header comment
+msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+#: forms.py:1
+msgid "Used"
+msgstr "已用"
+
+msgid "Unused"
+msgstr "未用"
+
+msgctxt "action"
+msgid "Remove"
+msgstr "移除"
+
+#, fuzzy
+msgid "Fuzzy"
+msgstr "模糊"
+
+msgid "One apple"
+msgid_plural "%(n)s apples"
+msgstr[0] "%(n)s 個蘋果"
+
+msgid ""
+"Long "
+"message"
+msgstr ""
+'''
+
+
+def test_python_messages():
+    source = '''
+from django.utils.translation import gettext_lazy as _
+from django.utils import translation
+
+a = _("Plain")
+b = translation.ngettext("One apple", "%(n)s apples", n)
+c = pgettext_lazy("action", "Remove")
+d = _(variable)
+e = npgettext("ctx", "one", "many", 2)
+f = other("Not translated")
+'''
+    assert python_messages(source) == {
+        (None, 'Plain'),
+        (None, 'One apple'),
+        ('action', 'Remove'),
+        ('ctx', 'one'),
+    }
+
+
+def test_template_messages():
+    source = (
+        '{% load i18n %}{% translate "Sign In" %}{% trans "It\'s" context "menu" %}'
+        '{% blocktranslate trimmed count n=items|length %}\n  One {{ n }}\n'
+        '{% plural %}{{ n }} items{% endblocktranslate %}'
+    )
+    assert template_messages(source) == {
+        (None, 'Sign In'),
+        ('menu', "It's"),
+        (None, 'One %(n)s'),
+    }
+
+
+def test_read_po(tmp_path):
+    (tmp_path / 'test.po').write_text(PO, encoding='utf-8')
+    entries = {(e.context, e.msgid): e for e in read_po(tmp_path / 'test.po')}
+
+    assert set(entries) == {
+        (None, ''),
+        (None, 'Used'),
+        (None, 'Unused'),
+        ('action', 'Remove'),
+        (None, 'Fuzzy'),
+        (None, 'One apple'),
+        (None, 'Long message'),
+    }
+    assert entries[None, 'Used'].translated
+    assert entries[None, 'Used'].text.startswith('#: forms.py:1')
+    assert not entries[None, 'Fuzzy'].translated
+    assert not entries[None, 'Long message'].translated
+    assert entries[None, 'One apple'].translated
+
+
+def test_prune_keeps_header_and_used_entries(tmp_path):
+    (tmp_path / 'test.po').write_text(PO, encoding='utf-8')
+    kept = prune_entries(
+        read_po(tmp_path / 'test.po'), {(None, 'Used'), ('action', 'Remove'), (None, 'Remove')}
+    )
+    write_po(tmp_path / 'pruned.po', kept)
+
+    assert [(e.context, e.msgid) for e in read_po(tmp_path / 'pruned.po')] == [
+        (None, ''),
+        (None, 'Used'),
+        ('action', 'Remove'),
+    ]
+    assert '"Content-Type: text/plain; charset=UTF-8\\n"' in (tmp_path / 'pruned.po').read_text()
+
+
+def test_used_messages_reads_project_templates_and_settings():
+    base_dir = Path(settings.BASE_DIR)
+    used = used_messages(
+        [
+            base_dir / 'base' / 'templates' / 'includes' / 'navbar.html',
+            base_dir / 'christmax' / 'settings' / 'base.py',
+        ]
+    )
+    assert (None, 'Sign In') in used
+    assert (None, 'Traditional Chinese') in used
+
+
+def test_analyze_translations_report(monkeypatch):
+    navbar = Path(settings.BASE_DIR) / 'base' / 'templates' / 'includes' / 'navbar.html'
+    monkeypatch.setattr(
+        'base.management.commands.analyze_translations.source_files', lambda: [navbar]
+    )
+    out = StringIO()
+    call_command('analyze_translations', locale=['zh'], show_missing=True, stdout=out)
+    report = out.getvalue()
+
+    assert 'Language: zh' in report
+    assert 'app.po' in report
+    assert 'Project strings translated: 100.0% (0 missing)' in report
+
+
+def test_compile_translations_prune_cleans_up_after_a_failure(monkeypatch, tmp_path):
+    import subprocess
+    import tempfile
+
+    def fail(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd, stderr='boom')
+
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    monkeypatch.setattr('base.management.commands.compile_translations.used_messages', set)
+    monkeypatch.setattr('base.management.commands.compile_translations.subprocess.run', fail)
+    with pytest.raises(CommandError, match='Failed to merge') as failure:
+        call_command('compile_translations', locales=['zh'], prune=True, stdout=StringIO())
+
+    # Checked while the traceback is alive: it would keep a leaked directory's finalizer waiting
+    assert failure.traceback
+    assert list(tmp_path.iterdir()) == []
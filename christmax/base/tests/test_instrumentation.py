@@ -0,0 +1,132 @@
+"""Tests for per-view request instrumentation, the metrics endpoint and query budgets."""
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from base.instrumentation import Histogram
+from base.instrumentation import log_linear_bounds
+from base.instrumentation import query_budget
+from base.instrumentation import registry
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+@pytest.fixture
+def staff_user(db):
+    return User.objects.create_user(
+        username='staff', email='staff@example.com', password='testpass123', is_staff=True
+    )
+
+
+@pytest.fixture
+def regular_user(db):
+    return User.objects.create_user(
+        username='player', email='player@example.com', password='testpass123'
+    )
+
+
+# Histogram ==================================================================
+
+def test_log_linear_bounds_are_increasing_with_bounded_error():
+    bounds = log_linear_bounds(0.001, 10.0, sub_buckets=4)
+    assert list(bounds) == sorted(set(bounds))
+    for lower, upper in zip(bounds, bounds[1:], strict=False):
+        assert (upper - lower) / lower <= 0.25 + 1e-9
+
+
+def test_histogram_cumulative_counts():
+    histogram = Histogram((1, 2, 4))
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+
+    assert list(histogram.cumulative()) == [(1, 2), (2, 2), (4, 3), (float('inf'), 4)]
+    assert histogram.sum == 14.5
+    assert histogram.count == 4
+
+
+# Middleware =================================================================
+
+def test_middleware_records_per_view_metrics(client, db):
+    client.get(reverse('home'))
+
+    latency = registry.get_histogram('django_request_latency_seconds', view='home')
+    queries = registry.get_histogram('django_request_queries', view='home')
+    render = registry.get_histogram('django_template_render_seconds', view='home')
+    assert latency.count == 1
+    assert queries.count == 1
+    assert render.count == 1
+    assert render.sum <= latency.sum
+
+
+def test_middleware_counts_queries_for_authenticated_view(client, regular_user):
+    client.force_login(regular_user)
+    client.get(reverse('settings'))
+
+    queries = registry.get_histogram('django_request_queries', view='settings')
+    db_time = registry.get_histogram('django_request_db_seconds', view='settings')
+    assert queries.sum > 0
+    assert db_time.count == 1
+
+
+# Metrics endpoint ===========================================================
+
+def test_metrics_endpoint_requires_staff(client, regular_user):
+    response = client.get('/metrics/')
+    assert response.status_code == 302
+
+    client.force_login(regular_user)
+    response = client.get('/metrics/')
+    assert response.status_code == 302
+
+
+def test_metrics_endpoint_renders_prometheus_text(client, staff_user):
+    client.get(reverse('home'))
+    client.force_login(staff_user)
+    response = client.get('/metrics/')
+    body = response.content.decode()
+
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+    assert '# TYPE django_request_latency_seconds histogram' in body
+    assert 'django_request_latency_seconds_bucket{view="home",le="+Inf"} 1' in body
+    assert 'django_request_queries_count{view="home"} 1' in body
+
+
+# Query budgets ==============================================================
+
+def test_query_budget_fails_when_exceeded(db):
+    with pytest.raises(AssertionError, match='budget is 0'), query_budget('home', budget=0):
+        User.objects.count()
+
+
+def test_home_view_within_query_budget(client, db):
+    with query_budget('home'):
+        client.get(reverse('home'))
+
+
+def test_settings_view_within_query_budget(client, regular_user):
+    client.force_login(regular_user)
+    with query_budget('settings'):
+        response = client.get(reverse('settings'))
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('url_name', ['account_login', 'account_signup'])
+def test_allauth_entrance_views_within_query_budget(client, db, url_name):
+    with query_budget(url_name):
+        response = client.get(reverse(url_name))
+    assert response.status_code == 200
+
+
+def test_allauth_email_view_within_query_budget(client, regular_user):
+    client.force_login(regular_user)
+    with query_budget('account_email'):
+        response = client.get(reverse('account_email'))
+    assert response.status_code == 200
@@ -0,0 +1,211 @@
+"""Email outbox backend and sender (base.mail)."""
+import socket
+import socketserver
+import threading
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.utils import timezone
+
+from base.instrumentation import registry
+from base.mail import claim_batch
+from base.mail import drain
+from base.models import OutboxMessage
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply('220 localhost stand-in')
+        while line := self.rfile.readline():
+            command = line.decode().strip()
+            verb = command.split(' ', 1)[0].upper()
+            if verb in ('EHLO', 'HELO'):
+                self.reply('250 localhost')
+            elif verb == 'RCPT':
+                address = command.split(':', 1)[1].strip('<> ')
+                code = server.reject.get(address)
+                self.reply(f'{code} rejected' if code else '250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = b''
+                while (chunk := self.rfile.readline()) != b'.\r\n':
+                    data += chunk[1:] if chunk.startswith(b'..') else chunk
+                if server.drop_after is not None and len(server.messages) >= server.drop_after:
+                    return  # hang up mid-transaction
+                server.messages.append(data)
+                self.reply('250 queued')
+            elif verb == 'QUIT':
+                self.reply('221 bye')
+                return
+            else:  # MAIL, RSET, NOOP
+                self.reply('250 OK')
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    """Just enough of an SMTP server to receive, refuse or drop messages."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _SMTPHandler)
+        self.messages = []
+        self.reject = {}
+        self.connections = 0
+        self.drop_after = None
+
+
+@pytest.fixture
+def smtp_server(settings):
+    server = SMTPStandIn()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    settings.OUTBOX_EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    settings.EMAIL_HOST = '127.0.0.1'
+    settings.EMAIL_PORT = server.server_address[1]
+    settings.EMAIL_USE_TLS = settings.EMAIL_USE_SSL = False
+    settings.EMAIL_TIMEOUT = 5
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def outbox(settings):
+    settings.EMAIL_BACKEND = 'base.mail.OutboxEmailBackend'
+    registry.reset()
+
+
+def _queue(*recipients, subject='Verify your email'):
+    for recipient in recipients:
+        mail.send_mail(subject, 'Click the link.', 'noreply@example.com', [recipient])
+
+
+@pytest.mark.django_db
+def test_send_mail_only_enqueues(outbox, smtp_server):
+    assert mail.send_mail('Hi', 'Body', 'noreply@example.com', ['a@example.com']) == 1
+
+    row = OutboxMessage.objects.get()
+    assert row.recipients == ['a@example.com']
+    assert b'Subject: Hi' in bytes(row.payload)
+    assert smtp_server.connections == 0
+    assert registry.get_counter('django_outbox_messages_total', result='queued') == 1
+
+
+@pytest.mark.django_db
+def test_drain_reuses_one_connection(outbox, smtp_server):
+    _queue('a@example.com', 'b@example.com', 'c@example.com', subject='驗證電郵')
+
+    assert drain(batch_size=10) == 3
+    assert smtp_server.connections == 1
+    assert len(smtp_server.messages) == 3
+    assert b'Subject: =?utf-8?' in smtp_server.messages[0]
+    assert not OutboxMessage.objects.exists()
+    assert registry.get_counter('django_outbox_messages_total', result='sent') == 3
+
+
+@pytest.mark.django_db
+def test_temporary_rejection_retries_with_backoff(outbox, smtp_server):
+    smtp_server.reject['busy@example.com'] = 451
+    _queue('busy@example.com', 'ok@example.com')
+
+    assert drain() == 1
+    row = OutboxMessage.objects.get()
+    assert row.attempts == 1
+    assert 'SMTPRecipientsRefused' in row.last_error
+    assert row.next_attempt_at > timezone.now() + timedelta(seconds=25)
+    assert registry.get_counter('django_outbox_messages_total', result='retry') == 1
+
+
+@pytest.mark.django_db
+def test_permanent_rejection_becomes_dead_letter(outbox, smtp_server):
+    smtp_server.reject['nobody@example.com'] = 550
+    _queue('nobody@example.com')
+
+    assert drain() == 0
+    row = OutboxMessage.objects.get()
+    assert row.next_attempt_at is None
+    assert registry.get_counter('django_outbox_messages_total', result='failed') == 1
+
+
+@pytest.mark.django_db
+def test_dead_letter_after_max_attempts(outbox, smtp_server, settings):
+    settings.OUTBOX_MAX_ATTEMPTS = 2
+    smtp_server.reject['busy@example.com'] = 451
+    _queue('busy@example.com')
+
+    drain()
+    OutboxMessage.objects.update(next_attempt_at=timezone.now())
+    drain()
+    row = OutboxMessage.objects.get()
+    assert row.attempts == 2
+    assert row.next_attempt_at is None
+
+
+@pytest.mark.django_db
+def test_dropped_connection_is_reopened(outbox, smtp_server):
+    smtp_server.drop_after = 1
+    _queue('a@example.com', 'b@example.com', 'c@example.com')
+
+    assert drain() == 1
+    assert smtp_server.connections >= 2
+    assert OutboxMessage.objects.filter(attempts=1).count() == 2
+
+
+@pytest.mark.django_db
+def test_server_down_reschedules_batch(outbox, settings):
+    with socket.socket() as unused:
+        unused.bind(('127.0.0.1', 0))
+        port = unused.getsockname()[1]
+    settings.OUTBOX_EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    settings.EMAIL_HOST, settings.EMAIL_PORT, settings.EMAIL_TIMEOUT = '127.0.0.1', port, 1
+    _queue('a@example.com', 'b@example.com')
+
+    assert drain() == 0
+    assert OutboxMessage.objects.filter(attempts=1, next_attempt_at__isnull=False).count() == 2
+
+
+@pytest.mark.django_db
+def test_claimed_messages_are_leased(outbox):
+    _queue('a@example.com', 'b@example.com')
+
+    assert len(claim_batch(10)) == 2
+    assert claim_batch(10) == []
+
+
+@pytest.mark.django_db
+def test_send_outbox_command(outbox, smtp_server):
+    _queue('a@example.com')
+    call_command('send_outbox', once=True, verbosity=0)
+    assert len(smtp_server.messages) == 1
+
+
+@pytest.fixture
+def admin_client(client, db):
+    admin = get_user_model().objects.create_superuser(
+        username='mailadmin', email='mailadmin@example.com', password='testpass123'
+    )
+    client.force_login(admin)
+    return client
+
+
+@pytest.mark.django_db
+def test_admin_retry_action(outbox, admin_client):
+    _queue('a@example.com')
+    OutboxMessage.objects.update(next_attempt_at=None, attempts=8)
+    row = OutboxMessage.objects.get()
+
+    assert admin_client.get('/admin/base/outboxmessage/').status_code == 200
+    admin_client.post(
+        '/admin/base/outboxmessage/', {'action': 'retry_now', '_selected_action': [row.pk]}
+    )
+    row.refresh_from_db()
+    assert row.next_attempt_at is not None
@@ -0,0 +1,112 @@
+"""Tests for the hybrid (signed cookie / cache) session engine and batched session cleanup."""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from base.sessions import SessionStore
+from base.sessions import is_signed_key
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def _clear_session_cache():
+    caches[settings.SESSION_CACHE_ALIAS].clear()
+
+
+def cached(session_key):
+    return caches[settings.SESSION_CACHE_ALIAS].get(SessionStore.cache_key_prefix + session_key)
+
+
+def test_anonymous_session_lives_in_signed_cookie():
+    session = SessionStore()
+    session['game'] = {'guesses': ['crane', 'slate']}
+    session.save()
+
+    assert is_signed_key(session.session_key)
+    assert SessionStore(session.session_key)['game'] == {'guesses': ['crane', 'slate']}
+    assert not SessionStore().exists(session.session_key)
+
+
+def test_tampered_cookie_starts_a_new_session():
+    session = SessionStore()
+    session['game'] = 'state'
+    session.save()
+    tampered = SessionStore(session.session_key[:-1] + 'x')
+
+    assert 'game' not in tampered
+    assert tampered.session_key is None
+
+
+def test_large_anonymous_payload_moves_to_cache(settings):
+    settings.SESSION_SIGNED_COOKIE_MAX_BYTES = 64
+    session = SessionStore()
+    session['game'] = {'board': ['abcde'] * 50}
+    session.save()
+
+    assert not is_signed_key(session.session_key)
+    assert cached(session.session_key) == {'game': {'board': ['abcde'] * 50}}
+
+
+def test_login_moves_session_to_cache_and_keeps_game_state():
+    session = SessionStore()
+    session['game'] = 'in progress'
+    session.save()
+
+    session.cycle_key()  # what login() does
+    session['_auth_user_id'] = '1'
+    session.save()
+
+    assert not is_signed_key(session.session_key)
+    assert cached(session.session_key) == {'game': 'in progress', '_auth_user_id': '1'}
+
+    session.flush()  # logout
+    assert session.session_key is None
+
+
+@pytest.mark.django_db
+def test_page_view_does_not_create_a_session(client):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get('/')
+
+    assert response.status_code == 200
+    assert settings.SESSION_COOKIE_NAME not in response.cookies
+    assert not any('django_session' in q['sql'] for q in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_authenticated_client_session_is_cache_backed(client):
+    user = User.objects.create_user(username='sess', email='sess@example.com', password='pw-12345')
+    client.force_login(user)
+    session_key = client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    assert not is_signed_key(session_key)
+    assert cached(session_key)['_auth_user_id'] == str(user.pk)
+    assert client.get('/settings/').status_code == 200
+
+
+@pytest.mark.django_db
+def test_cleanup_sessions_deletes_expired_rows_in_batches():
+    now = timezone.now()
+    for i in range(5):
+        Session.objects.create(
+            session_key=f'expired{i:04d}', session_data='', expire_date=now - timedelta(days=1)
+        )
+    Session.objects.create(session_key='live0000', session_data='', expire_date=now + timedelta(1))
+
+    out = StringIO()
+    with CaptureQueriesContext(connection) as ctx:
+        call_command('cleanup_sessions', batch_size=2, stdout=out)
+
+    assert list(Session.objects.values_list('session_key', flat=True)) == ['live0000']
+    assert sum(q['sql'].startswith('DELETE') for q in ctx.captured_queries) == 3
+    assert 'Deleted 5 expired database sessions' in out.getvalue()
@@ -0,0 +1,121 @@
+"""Tests for the settings profiles and the cold-start import report."""
+import importlib
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from base.management.commands.importtime_report import parse_importtime
+from base.management.commands.importtime_report import top_level_totals
+
+DEV_ONLY_APPS = {'debug_toolbar', 'django_extensions'}
+TOOLBAR_MIDDLEWARE = 'debug_toolbar.middleware.DebugToolbarMiddleware'
+
+
+def _load_profile(name, monkeypatch, **environ):
+    monkeypatch.setenv('SECRET_KEY', 'test-secret')
+    monkeypatch.setenv('ALLOWED_HOSTS', 'example.com')
+    monkeypatch.setenv('CACHE_URL', 'rediscache://cache:6379/1')
+    for key, value in environ.items():
+        monkeypatch.setenv(key, value)
+    importlib.reload(importlib.import_module('christmax.settings.base'))
+    return importlib.reload(importlib.import_module(f'christmax.settings.{name}'))
+
+
+def test_prod_profile_skips_dev_tooling(monkeypatch):
+    prod = _load_profile('prod', monkeypatch)
+
+    assert not DEV_ONLY_APPS & set(prod.INSTALLED_APPS)
+    assert TOOLBAR_MIDDLEWARE not in prod.MIDDLEWARE
+    assert prod.DEBUG is False
+    assert prod.SECRET_KEY == 'test-secret'
+    assert prod.ALLOWED_HOSTS == ['example.com']
+
+
+def test_prod_profile_requires_a_shared_cache(monkeypatch):
+    prod = _load_profile('prod', monkeypatch)
+    assert prod.CACHES['default']['BACKEND'] == 'django.core.cache.backends.redis.RedisCache'
+
+    monkeypatch.delenv('CACHE_URL')
+    with pytest.raises(ImproperlyConfigured, match='CACHE_URL'):
+        importlib.reload(prod)
+
+
+def test_dev_profile_pairs_toolbar_app_with_middleware(monkeypatch):
+    dev = _load_profile('dev', monkeypatch)
+
+    assert DEV_ONLY_APPS <= set(dev.INSTALLED_APPS)
+    assert TOOLBAR_MIDDLEWARE in dev.MIDDLEWARE
+    assert dev.MIDDLEWARE[0] == 'base.instrumentation.InstrumentationMiddleware'
+
+
+def test_dev_profile_reads_local_env_before_committed_defaults(monkeypatch):
+    import environ
+
+    _load_profile('dev', monkeypatch)
+    read = []
+    read_env = environ.Env.read_env
+    monkeypatch.setattr(
+        environ.Env,
+        'read_env',
+        classmethod(lambda cls, path=None, **kw: read.append(path.name) or read_env(path, **kw)),
+    )
+    importlib.reload(importlib.import_module('christmax.settings.dev'))
+
+    # read_env only sets missing variables, so the first file read wins
+    assert read == ['.env', '.env.dev']
+
+
+def test_sqlite_database_is_project_relative_and_tuned(monkeypatch):
+    from django.conf import settings
+
+    prod = _load_profile('prod', monkeypatch, DATABASE_URL='sqlite:///db.sqlite3')
+    database = prod.DATABASES['default']
+
+    assert database['NAME'] == settings.BASE_DIR / 'db.sqlite3'
+    assert 'PRAGMA journal_mode=WAL' in database['OPTIONS']['init_command']
+    assert database['OPTIONS']['transaction_mode'] == 'IMMEDIATE'
+    assert database['CONN_MAX_AGE'] == 60
+
+
+def test_postgres_persistent_connections_with_health_checks(monkeypatch):
+    prod = _load_profile(
+        'prod',
+        monkeypatch,
+        DATABASE_URL='postgres://app:secret@db:5432/christmax',
+        CONN_MAX_AGE='300',
+    )
+    database = prod.DATABASES['default']
+
+    assert database['ENGINE'] == 'django.db.backends.postgresql'
+    assert database['CONN_MAX_AGE'] == 300
+    assert database['CONN_HEALTH_CHECKS'] is True
+    assert 'pool' not in database['OPTIONS']
+
+
+def test_postgres_native_pool_disables_persistent_connections(monkeypatch):
+    prod = _load_profile(
+        'prod',
+        monkeypatch,
+        DATABASE_URL='postgres://app:secret@db:5432/christmax',
+        DATABASE_POOL='True',
+        DATABASE_POOL_MAX_SIZE='20',
+    )
+    database = prod.DATABASES['default']
+
+    assert database['OPTIONS']['pool'] == {'min_size': 2, 'max_size': 20, 'timeout': 10}
+    assert database['CONN_MAX_AGE'] == 0
+
+
+def test_parse_importtime_rows_and_totals():
+    stderr = '\n'.join([
+        'import time: self [us] | cumulative | imported package',
+        'import time:       100 |        100 |     allauth.utils',
+        'import time:        50 |        150 |   allauth',
+        'import time:       300 |        300 | django',
+        'Traceback noise that is not importtime output',
+    ])
+
+    rows = parse_importtime(stderr)
+
+    assert rows == [('allauth.utils', 100, 100), ('allauth', 50, 150), ('django', 300, 300)]
+    assert top_level_totals(rows) == {'allauth': 150, 'django': 300}
@@ -0,0 +1,128 @@
+"""Memory-mapped translation catalogs (base.translation)."""
+import os
+import struct
+
+import pytest
+from django.utils import translation
+from django.utils.translation import trans_real
+
+from base.translation import MappedCatalog
+from base.translation import MappedDjangoTranslation
+from base.translation import build_catalog
+from base.translation import load_mapped_translation
+from base.translation import write_catalog
+
+HEADER = 'Content-Type: text/plain; charset=UTF-8\nPlural-Forms: nplurals=1; plural=0;\n'
+
+
+def _write_mo(path, messages):
+    """Minimal GNU .mo writer, so the tests don't need msgfmt."""
+    ids = sorted(messages)
+    keys = b''.join(k.encode() + b'\0' for k in ids)
+    values = b''.join(messages[k].encode() + b'\0' for k in ids)
+    start = 7 * 4 + 16 * len(ids)
+    key_table, value_table = [], []
+    offset = 0
+    for k in ids:
+        key_table += [len(k.encode()), start + offset]
+        offset += len(k.encode()) + 1
+    offset = 0
+    for k in ids:
+        value_table += [len(messages[k].encode()), start + len(keys) + offset]
+        offset += len(messages[k].encode()) + 1
+    header = struct.pack('<7I', 0x950412DE, 0, len(ids), 28, 28 + 8 * len(ids), 0, 0)
+    path.write_bytes(
+        header
+        + struct.pack(f'<{len(key_table)}I', *key_table)
+        + struct.pack(f'<{len(value_table)}I', *value_table)
+        + keys
+        + values
+    )
+
+
+def _mapped(tmp_path, catalog):
+    path = tmp_path / 'django.cat'
+    path.write_bytes(build_catalog(catalog))
+    return MappedCatalog(path)
+
+
+def test_every_key_found_and_unknown_keys_missing(tmp_path):
+    catalog = {f'message {i}': f'translation {i}' for i in range(3000)}
+    catalog[''] = HEADER
+    catalog[('%(n)s apple', 0)] = '%(n)s 個蘋果'
+    catalog['menu\x04Open'] = '開啟'
+    mapped = _mapped(tmp_path, catalog)
+
+    assert len(mapped) == len(catalog)
+    assert all(mapped[key] == value for key, value in catalog.items())
+    assert dict(mapped.items()) == catalog
+    assert 'message 3000' not in mapped
+    assert mapped.get(('%(n)s apple', 1)) is None
+    with pytest.raises(KeyError):
+        mapped['Message 1']
+
+
+def test_empty_catalog(tmp_path):
+    mapped = _mapped(tmp_path, {})
+    assert len(mapped) == 0
+    assert mapped.get('anything', 'default') == 'default'
+
+
+def test_copy_shares_the_mapping(tmp_path):
+    mapped = _mapped(tmp_path, {'a': 'b'})
+    assert mapped.copy() is mapped
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'django.cat'
+    path.write_bytes(b'\x00' * 64)
+    with pytest.raises(ValueError, match='not a version'):
+        MappedCatalog(path)
+
+
+def test_write_catalog_from_mo(tmp_path):
+    _write_mo(tmp_path / 'django.mo', {'': HEADER, 'Hello': '你好'})
+    assert write_catalog(tmp_path / 'django.mo', tmp_path / 'django.cat') == 2
+    assert MappedCatalog(tmp_path / 'django.cat')['Hello'] == '你好'
+    assert not (tmp_path / 'django.cat.tmp').exists()
+
+
+@pytest.fixture
+def locale_dir(tmp_path):
+    directory = tmp_path / 'zh' / 'LC_MESSAGES'
+    directory.mkdir(parents=True)
+    return directory
+
+
+def test_stale_catalog_ignored(tmp_path, locale_dir):
+    _write_mo(locale_dir / 'django.mo', {'': HEADER, 'Hello': '你好'})
+    write_catalog(locale_dir / 'django.mo', locale_dir / 'django.cat')
+    assert load_mapped_translation(tmp_path, 'django', 'zh') is not None
+
+    mo_mtime = os.stat(locale_dir / 'django.cat').st_mtime_ns + 1_000_000_000
+    os.utime(locale_dir / 'django.mo', ns=(mo_mtime, mo_mtime))
+    assert load_mapped_translation(tmp_path, 'django', 'zh') is None
+    assert load_mapped_translation(tmp_path, 'django', 'fr') is None
+
+
+def test_plural_forms_from_header(tmp_path, locale_dir):
+    (locale_dir / 'django.cat').write_bytes(
+        build_catalog({'': HEADER, ('%(n)s apple', 0): '%(n)s 個蘋果'})
+    )
+    mapped = load_mapped_translation(tmp_path, 'django', 'zh')
+    assert mapped.plural(5) == 0
+    assert mapped._info['content-type'] == 'text/plain; charset=UTF-8'
+
+
+def test_translation_backend_reads_mapped_catalog(tmp_path, locale_dir, settings):
+    (locale_dir / 'django.cat').write_bytes(
+        build_catalog({'': HEADER, 'Settings': '設定（映射）', ('%s apple', 0): '%s 個蘋果'})
+    )
+    settings.LOCALE_PATHS = [tmp_path]
+
+    assert trans_real.DjangoTranslation is MappedDjangoTranslation
+    with translation.override('zh'):
+        assert translation.gettext('Settings') == '設定（映射）'
+        assert translation.ngettext('%s apple', '%s apples', 3) == '%s 個蘋果'
+        # Strings not in the mapped catalog still come from the other catalogs
+        assert translation.gettext('Not translated') == 'Not translated'
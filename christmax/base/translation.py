@@ -0,0 +1,242 @@
+"""
+Memory-mapped translation catalogs shared between workers.
+
+Django parses every ``django.mo`` into a dict in each worker. Our merged catalog (project,
+allauth and Django core strings) is thousands of entries per language, held once per
+process. ``compile_translations`` also writes a ``django.cat`` next to each ``django.mo``.
+It is laid out to be read in place:
+
+    header   magic, version, entry count, bucket count
+    buckets  one uint32 displacement per bucket
+    slots    (key offset, key length, value offset, value length) per entry
+    strings  UTF-8 keys and values, sorted by key
+
+Lookups use a minimal perfect hash (hash and displace). A key's bucket comes from
+``crc32(key)``. Its slot comes from mixing ``crc32`` and ``adler32`` with the bucket's
+displacement, which is chosen at build time so that no two keys share a slot. One lookup
+costs two C hashes, a few integer operations and one key comparison. Nothing is parsed at
+startup. The file is mapped read-only, so all workers share the same page-cache pages.
+
+``MappedDjangoTranslation`` loads ``LOCALE_PATHS`` catalogs this way. A catalog is skipped
+when it is older than its ``django.mo`` (e.g. after a bare ``compilemessages``). Enabled by
+``TRANSLATION_MMAP_CATALOGS`` (default True). See ``BaseConfig.ready()``.
+"""
+
+import gettext
+import mmap
+import os
+import struct
+import zlib
+
+from django.conf import settings
+from django.utils.translation import to_locale
+from django.utils.translation import trans_real
+
+MAGIC = b'DJTC'
+VERSION = 1
+HEADER = struct.Struct('<4sIII')
+DISPLACEMENT = struct.Struct('<I')
+SLOT = struct.Struct('<IIII')
+# Average keys per bucket: higher packs the displacement table tighter but builds slower
+BUCKET_SIZE = 4
+
+_missing = object()
+_MASK64 = (1 << 64) - 1
+
+
+def encode_key(key):
+    """Catalog keys are msgids, or (msgid, plural index) tuples for plural forms."""
+    if isinstance(key, tuple):
+        msgid, index = key
+        return f'{msgid}\x00{index}'.encode()
+    return key.encode()
+
+
+def _hashes(key):
+    crc = zlib.crc32(key)
+    return crc, crc | zlib.adler32(key) << 32
+
+
+def _slot(hash64, displacement, size):
+    # MurmurHash3's 64-bit finalizer over the key hash, seeded by the displacement
+    h = hash64 ^ (displacement * 0x9E3779B97F4A7C15) & _MASK64
+    h = ((h ^ h >> 33) * 0xFF51AFD7ED558CCD) & _MASK64
+    h = ((h ^ h >> 33) * 0xC4CEB9FE1A85EC53) & _MASK64
+    return (h ^ h >> 33) % size
+
+
+def build_catalog(catalog):
+    """Serialize a ``GNUTranslations._catalog`` dict to the mapped catalog format."""
+    entries = sorted((encode_key(key), value.encode()) for key, value in catalog.items())
+    size = len(entries)
+    bucket_count = max(1, -(-size // BUCKET_SIZE))
+
+    buckets = [[] for _ in range(bucket_count)]
+    for index, (key, _value) in enumerate(entries):
+        crc, hash64 = _hashes(key)
+        buckets[crc % bucket_count].append((index, hash64))
+
+    displacements = [0] * bucket_count
+    slots = [None] * size
+    # Place the largest buckets first, while most slots are still free
+    for bucket in sorted(range(bucket_count), key=lambda b: -len(buckets[b])):
+        members = buckets[bucket]
+        if not members:
+            break
+        for displacement in range(size * 64 + 1):
+            taken = {_slot(hash64, displacement, size) for _index, hash64 in members}
+            if len(taken) == len(members) and all(slots[s] is None for s in taken):
+                break
+        else:
+            raise ValueError('Could not build a perfect hash for this catalog')
+        displacements[bucket] = displacement
+        for index, hash64 in members:
+            slots[_slot(hash64, displacement, size)] = index
+
+    strings_start = HEADER.size + DISPLACEMENT.size * bucket_count + SLOT.size * size
+    pool = bytearray()
+    positions = []
+    for key, value in entries:
+        key_offset = strings_start + len(pool)
+        pool += key
+        value_offset = strings_start + len(pool)
+        pool += value
+        positions.append((key_offset, len(key), value_offset, len(value)))
+
+    out = bytearray(HEADER.pack(MAGIC, VERSION, size, bucket_count))
+    for displacement in displacements:
+        out += DISPLACEMENT.pack(displacement)
+    for index in slots:
+        out += SLOT.pack(*positions[index])
+    return bytes(out + pool)
+
+
+def write_catalog(mo_path, cat_path):
+    """Convert a compiled ``.mo`` file to a mapped catalog at ``cat_path``."""
+    with open(mo_path, 'rb') as fp:
+        catalog = gettext.GNUTranslations(fp)._catalog
+    tmp_path = f'{cat_path}.tmp'
+    with open(tmp_path, 'wb') as fp:
+        fp.write(build_catalog(catalog))
+    # Workers may have the old file mapped; replace it rather than rewrite it in place
+    os.replace(tmp_path, cat_path)
+    return len(catalog)
+
+
+class MappedCatalog:
+    """Read-only, dict-like view of a mapped catalog, usable in Django's TranslationCatalog."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._size, self._bucket_count = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a version {VERSION} translation catalog')
+        self._slots_start = HEADER.size + DISPLACEMENT.size * self._bucket_count
+
+    def _lookup(self, key):
+        if not self._size:
+            return _missing
+        key = encode_key(key)
+        crc, hash64 = _hashes(key)
+        (displacement,) = DISPLACEMENT.unpack_from(
+            self._map, HEADER.size + DISPLACEMENT.size * (crc % self._bucket_count)
+        )
+        slot = _slot(hash64, displacement, self._size)
+        key_offset, key_length, value_offset, value_length = SLOT.unpack_from(
+            self._map, self._slots_start + SLOT.size * slot
+        )
+        if self._map[key_offset : key_offset + key_length] != key:
+            return _missing
+        return self._map[value_offset : value_offset + value_length].decode()
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is _missing else value
+
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._lookup(key) is not _missing
+
+    def __len__(self):
+        return self._size
+
+    def items(self):
+        for slot in range(self._size):
+            key_offset, key_length, value_offset, value_length = SLOT.unpack_from(
+                self._map, self._slots_start + SLOT.size * slot
+            )
+            key = self._map[key_offset : key_offset + key_length].decode()
+            msgid, nul, index = key.partition('\x00')
+            value = self._map[value_offset : value_offset + value_length].decode()
+            yield ((msgid, int(index)) if nul else key), value
+
+    def keys(self):
+        for key, _value in self.items():
+            yield key
+
+    def copy(self):
+        # Immutable, so TranslationCatalog can share it instead of copying it into a dict
+        return self
+
+
+class MappedTranslation:
+    """The parts of a GNUTranslations that ``DjangoTranslation.merge()`` reads."""
+
+    _fallback = None
+
+    def __init__(self, catalog):
+        self._catalog = catalog
+        self._info = {}
+        self.plural = lambda n: int(n != 1)
+        for line in catalog.get('', '').splitlines():
+            name, sep, value = line.partition(':')
+            if sep:
+                self._info[name.strip().lower()] = value.strip()
+        plural_forms = self._info.get('plural-forms', '')
+        if 'plural=' in plural_forms:
+            self.plural = gettext.c2py(plural_forms.split('plural=', 1)[1].rstrip(';'))
+
+
+# One mapping per file per process, shared by every DjangoTranslation that uses it
+_catalogs = {}
+
+
+def load_mapped_translation(localedir, domain, locale):
+    """A MappedTranslation for ``localedir``, or None when there is no up-to-date catalog."""
+    directory = os.path.join(localedir, locale, 'LC_MESSAGES')
+    cat_path = os.path.join(directory, f'{domain}.cat')
+    try:
+        cat_mtime = os.stat(cat_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    try:
+        if os.stat(os.path.join(directory, f'{domain}.mo')).st_mtime_ns > cat_mtime:
+            return None
+    except FileNotFoundError:
+        pass
+    cache_key = (cat_path, cat_mtime)
+    if cache_key not in _catalogs:
+        _catalogs[cache_key] = MappedTranslation(MappedCatalog(cat_path))
+    return _catalogs[cache_key]
+
+
+class MappedDjangoTranslation(trans_real.DjangoTranslation):
+    """DjangoTranslation that reads ``LOCALE_PATHS`` catalogs from mapped files when present."""
+
+    def _add_local_translations(self):
+        locale = to_locale(self.language())
+        for localedir in reversed(settings.LOCALE_PATHS):
+            translation = load_mapped_translation(localedir, self.domain, locale)
+            self.merge(translation or self._new_gnu_trans(localedir))
+
+
+def install():
+    """Make ``django.utils.translation`` build MappedDjangoTranslation objects."""
+    trans_real.DjangoTranslation = MappedDjangoTranslation
+    trans_real._translations = {}
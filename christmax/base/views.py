@@ -1,8 +1,24 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
 from django.views.generic import TemplateView
 
+from base.instrumentation import registry
+
 
 class HomeView(TemplateView):
     template_name = "_dev/home.html"
 
     def get_context_data(self, **kwargs):
         return super().get_context_data(**kwargs)
+
+
+@method_decorator(staff_member_required, name='dispatch')
+class MetricsView(View):
+    """Staff-only Prometheus scrape endpoint for the in-process request metrics."""
+
+    def get(self, request):
+        return HttpResponse(
+            registry.render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8'
+        )
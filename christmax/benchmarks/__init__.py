@@ -0,0 +1,6 @@
+"""
+Offline benchmark suite.
+
+Benchmarks are registered with ``benchmarks.harness.benchmark`` in the modules of this
+package and run with ``python manage.py benchmark`` (see ``docs/performance.md``).
+"""
@@ -0,0 +1,50 @@
+"""
+The JSON API against the HTML pages it parallels, for the same game state.
+
+    wordle_board_html      GET /wordle/ (full middleware stack, template render)
+    wordle_board_api       GET /api/v1/wordle/ (API middleware chain, JSON)
+    wordle_board_api_304   the same with If-None-Match: the client already has this state
+    wordle_guess_html      POST /wordle/guess/ and follow the redirect to the board
+    wordle_guess_api       POST /api/v1/wordle/guess/, which answers with the new state
+Each session has two guesses on the board before timing starts.
+"""
+
+from benchmarks.harness import benchmark
+
+GUESSES = ('slate', 'round')
+
+
+def _two_guesses(session):
+    session.get('/api/v1/wordle/')
+    for guess in GUESSES:
+        session.post('/api/v1/wordle/guess/', {'guess': guess})
+
+
+def _etag(session):
+    _two_guesses(session)
+    return session.get('/api/v1/wordle/').headers['ETag']
+
+
+@benchmark('wordle_board_html', setup=_two_guesses)
+def wordle_board_html(session, _state):
+    session.get('/wordle/')
+
+
+@benchmark('wordle_board_api', setup=_two_guesses)
+def wordle_board_api(session, _state):
+    session.get('/api/v1/wordle/')
+
+
+@benchmark('wordle_board_api_304', setup=_etag)
+def wordle_board_api_304(session, etag):
+    session.get('/api/v1/wordle/', headers={'If-None-Match': etag})
+
+
+@benchmark('wordle_guess_html', setup=_two_guesses)
+def wordle_guess_html(session, _state):
+    session.post('/wordle/guess/', {'guess': 'tiger'}, follow=True)
+
+
+@benchmark('wordle_guess_api', setup=_two_guesses)
+def wordle_guess_api(session, _state):
+    session.post('/api/v1/wordle/guess/', {'guess': 'tiger'})
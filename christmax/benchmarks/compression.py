@@ -0,0 +1,53 @@
+"""
+Response compression (base/compression.py) and streamed dumps.
+
+    home_gzip           GET / with Accept-Encoding: gzip (compare home_anonymous_en)
+    jsi18n_gzip         GET /jsi18n/ with Accept-Encoding: gzip
+    leaderboard_export  staff GET /api/v1/leaderboard/export/, read to the end, for
+                        ``EXPORT_PLAYERS`` players
+    leaderboard_export_gzip  the same, compressed as it streams
+"""
+
+from django.contrib.auth import get_user_model
+
+from benchmarks.harness import benchmark
+from users.models import Profile
+
+GZIP = {'Accept-Encoding': 'gzip'}
+EXPORT_PLAYERS = 2000
+
+
+@benchmark('home_gzip')
+def home_gzip(session):
+    session.get('/', headers=GZIP)
+
+
+@benchmark('jsi18n_gzip')
+def jsi18n_gzip(session):
+    session.get('/jsi18n/', headers=GZIP)
+
+
+def _staff_and_players(session):
+    User = get_user_model()  # noqa: N806
+    for i in range(EXPORT_PLAYERS - Profile.objects.count()):
+        user = User.objects.create_user(username=f'exported{i}', email=f'exported{i}@example.com')
+        Profile.objects.filter(user=user).update(display_name=f'Exported {i}', experience_points=i)
+    staff, _created = User.objects.get_or_create(
+        username='export-staff', defaults={'email': 'export-staff@example.com', 'is_staff': True}
+    )
+    session.force_login(staff)
+
+
+def _read(response):
+    for _chunk in response.streaming_content:
+        pass
+
+
+@benchmark('leaderboard_export', in_process_only=True, setup=_staff_and_players)
+def leaderboard_export(session, _state):
+    _read(session.get('/api/v1/leaderboard/export/'))
+
+
+@benchmark('leaderboard_export_gzip', in_process_only=True, setup=_staff_and_players)
+def leaderboard_export_gzip(session, _state):
+    _read(session.get('/api/v1/leaderboard/export/', headers=GZIP))
@@ -0,0 +1,67 @@
+"""
+Connection setup cost per request: fresh connection vs persistent vs native pool.
+
+Each iteration is what the ORM does around one request: make sure a connection is
+usable, run a trivial query, then hand the connection back as ``request_finished`` does.
+The benchmarks use their own connection wrapper over the configured default database,
+so they measure the real server (or SQLite file) rather than the in-memory test DB.
+"""
+
+import copy
+import tempfile
+from pathlib import Path
+
+from django.db import connections
+
+from benchmarks.harness import SkipBenchmark
+from benchmarks.harness import benchmark
+
+_tmpdir = None
+
+
+def _wrapper(**overrides):
+    default = connections['default']
+    settings_dict = copy.deepcopy(default.settings_dict)
+    if default.vendor == 'sqlite' and default.is_in_memory_db():
+        global _tmpdir
+        _tmpdir = _tmpdir or tempfile.TemporaryDirectory()
+        settings_dict['NAME'] = Path(_tmpdir.name) / 'connections.sqlite3'
+    settings_dict.update(overrides)
+    return default.__class__(settings_dict, alias='benchmark')
+
+
+def _request_cycle(wrapper):
+    with wrapper.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    # What django.db.close_old_connections() does on request_finished
+    wrapper.close_if_unusable_or_obsolete()
+
+
+@benchmark('db_connection_fresh', http=False, setup=lambda: _wrapper(CONN_MAX_AGE=0))
+def db_connection_fresh(wrapper):
+    """CONN_MAX_AGE=0: connect (and run init commands) on every request."""
+    _request_cycle(wrapper)
+
+
+@benchmark(
+    'db_connection_persistent',
+    http=False,
+    setup=lambda: _wrapper(CONN_MAX_AGE=600, CONN_HEALTH_CHECKS=True),
+)
+def db_connection_persistent(wrapper):
+    """CONN_MAX_AGE>0 with health checks: one connection per worker thread."""
+    _request_cycle(wrapper)
+
+
+def _pooled():
+    if connections['default'].vendor != 'postgresql':
+        raise SkipBenchmark('native pooling needs PostgreSQL')
+    options = copy.deepcopy(connections['default'].settings_dict['OPTIONS'])
+    options.setdefault('pool', {'min_size': 1, 'max_size': 2})
+    return _wrapper(CONN_MAX_AGE=0, OPTIONS=options)
+
+
+@benchmark('db_connection_pooled', http=False, setup=_pooled)
+def db_connection_pooled(wrapper):
+    """psycopg pool: closing returns the connection to the pool instead of the server."""
+    _request_cycle(wrapper)
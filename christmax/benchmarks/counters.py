@@ -0,0 +1,71 @@
+"""
+Write contention on one counter bucket: a single row vs sharded rows (base/counters.py).
+
+Each iteration is ``WRITERS`` threads adding ``INCREMENTS`` each to the same bucket, as
+players finishing the daily puzzle at once would. Their req/s x 200 is increments per second:
+    counter_single_row    ShardedCounter(shards=1): every writer updates the same row
+    counter_sharded       ShardedCounter(shards=16): writers pick a row at random
+On PostgreSQL the single row serializes on its row lock and sharding removes that wait.
+On SQLite every write takes the database lock, so the two should be about equal. The
+SQLite runs use a database file, as in production, rather than the in-memory test DB.
+"""
+
+import copy
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.db import connections
+
+from base.counters import ShardedCounter
+from base.models import CounterShard
+from benchmarks.harness import benchmark
+
+WRITERS = 8
+INCREMENTS = 25
+
+_tmpdir = None
+
+
+def _database():
+    """The alias the writer threads use: the test database, or an SQLite file."""
+    default = connections['default']
+    if default.vendor != 'sqlite':
+        return 'default'
+    global _tmpdir
+    if _tmpdir is None:
+        _tmpdir = tempfile.TemporaryDirectory()
+        settings_dict = copy.deepcopy(default.settings_dict)
+        settings_dict['NAME'] = Path(_tmpdir.name) / 'counters.sqlite3'
+        connections.settings['counters'] = settings_dict
+        with connections['counters'].schema_editor() as editor:
+            editor.create_model(CounterShard)
+    return 'counters'
+
+
+def _writers(shards):
+    def setup():
+        counter = ShardedCounter(f'benchmark:{shards}', shards=shards, using=_database())
+        counter.clear()
+        return counter, ThreadPoolExecutor(WRITERS)
+
+    return setup
+
+
+def _contend(counter, pool):
+    def write():
+        for _ in range(INCREMENTS):
+            counter.increment('3')
+
+    for future in [pool.submit(write) for _ in range(WRITERS)]:
+        future.result()
+
+
+@benchmark('counter_single_row', http=False, setup=_writers(1))
+def counter_single_row(state):
+    _contend(*state)
+
+
+@benchmark('counter_sharded', http=False, setup=_writers(16))
+def counter_sharded(state):
+    _contend(*state)
@@ -0,0 +1,112 @@
+"""End-to-end user flows: home pages, email signup, login + settings, Google login."""
+
+import itertools
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+
+from benchmarks.harness import benchmark
+
+PASSWORD = 'bench-pass-9f3k2'  # noqa: S105
+
+_sequence = itertools.count()
+
+
+def _unique_email(prefix):
+    # Dots and plus signs exercise generate_username_from_email's sanitizing
+    return f'{prefix}.user+{next(_sequence)}@example.com'
+
+
+@benchmark('home_anonymous_en')
+def home_anonymous_en(session):
+    session.get('/')
+
+
+@benchmark('home_anonymous_zh')
+def home_anonymous_zh(session):
+    session.get('/zh/')
+
+
+@benchmark('signup_email')
+def signup_email(session):
+    session.post(
+        '/accounts/signup/',
+        {'email': _unique_email('signup'), 'password1': PASSWORD, 'password2': PASSWORD},
+    )
+    session.logout()
+
+
+def _create_login_user(session):
+    email = _unique_email('login')
+    session.post(
+        '/accounts/signup/', {'email': email, 'password1': PASSWORD, 'password2': PASSWORD}
+    )
+    session.logout()
+    return email
+
+
+@benchmark('login_then_settings', setup=_create_login_user)
+def login_then_settings(session, email):
+    # Follows the adapter's redirect to /settings/, which renders the dashboard
+    session.post('/accounts/login/', {'login': email, 'password': PASSWORD}, follow=True)
+    session.logout()
+
+
+def _google_setup():
+    from allauth.socialaccount.models import SocialApp
+
+    SocialApp.objects.get_or_create(
+        provider='google', defaults={'name': 'Google', 'client_id': 'bench', 'secret': 'bench'}
+    )
+
+
+def _google_request():
+    from django.contrib.auth.models import AnonymousUser
+    from django.contrib.messages.middleware import MessageMiddleware
+    from django.contrib.sessions.middleware import SessionMiddleware
+    from django.test import RequestFactory
+
+    request = RequestFactory().get('/accounts/google/login/callback/')
+    SessionMiddleware(lambda r: None).process_request(request)
+    MessageMiddleware(lambda r: None).process_request(request)
+    request.user = AnonymousUser()
+    return request
+
+
+@benchmark('google_login_first', http=False, in_process_only=True, setup=_google_setup)
+def google_login_first(_state):
+    """Mocked OAuth callback after the token exchange: auto-signup of a new Google user."""
+    _google_callback(_unique_email('google'))
+
+
+def _google_returning_setup():
+    _google_setup()
+    email = _unique_email('returning')
+    _google_callback(email)
+    return email
+
+
+@benchmark('google_login_repeat', http=False, in_process_only=True, setup=_google_returning_setup)
+def google_login_repeat(email):
+    """Mocked OAuth callback for a user whose Google account is already connected."""
+    _google_callback(email)
+
+
+def _google_callback(email):
+    from allauth.socialaccount.adapter import get_adapter
+    from allauth.socialaccount.helpers import complete_social_login
+
+    request = _google_request()
+    provider = get_adapter().get_provider(request, 'google')
+    response = {
+        'sub': email,
+        'email': email,
+        'email_verified': True,
+        'given_name': 'Bench',
+        'family_name': 'User',
+    }
+    # Skip outbound mail so the flow measures only our callback path
+    with mock.patch('allauth.account.adapter.DefaultAccountAdapter.send_mail'):
+        sociallogin = provider.sociallogin_from_response(request, response)
+        complete_social_login(request, sociallogin)
+    assert get_user_model().objects.filter(email=email).exists()
@@ -0,0 +1,171 @@
+"""
+Benchmark registry, timing loop, statistics and baseline comparison.
+
+A benchmark is a function that performs one iteration of a flow. HTTP flows receive a
+client-like ``session`` (Django's test ``Client`` in-process, or ``HttpSession`` against a
+running server); plain benchmarks receive nothing.
+"""
+
+import json
+import math
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urljoin
+
+BASELINES_FILE = Path(__file__).resolve().parent / 'baselines.json'
+
+REGISTRY = {}
+
+
+class SkipBenchmark(Exception):
+    """Raised by a benchmark's setup when it cannot run in this environment."""
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: object
+    http: bool
+    # Requires in-process access (mocks, ORM); skipped when driving a remote server
+    in_process_only: bool
+    # Called once (with the session for HTTP flows); its return value is passed to each call
+    setup: object = None
+
+
+def benchmark(name, *, http=True, in_process_only=False, setup=None):
+    """Register the decorated function as benchmark ``name``."""
+
+    def decorator(func):
+        REGISTRY[name] = Benchmark(name, func, http, in_process_only, setup)
+        return func
+
+    return decorator
+
+
+@dataclass
+class Result:
+    name: str
+    iterations: int
+    p50: float
+    p95: float
+    p99: float
+    rps: float
+
+    def as_row(self):
+        return (
+            f'{self.name:<28} n={self.iterations:<6} '
+            f'p50={self.p50 * 1000:8.2f}ms p95={self.p95 * 1000:8.2f}ms '
+            f'p99={self.p99 * 1000:8.2f}ms {self.rps:9.1f} req/s'
+        )
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of ``samples`` (``pct`` in 0..100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run(bench, iterations, session_factory=None, warmup=3):
+    """Time ``iterations`` calls of ``bench`` and summarize the latencies."""
+    args = []
+    if bench.http:
+        args.append(session_factory())
+    if bench.setup:
+        args.append(bench.setup(*args))
+
+    for _ in range(warmup):
+        bench.func(*args)
+
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        bench.func(*args)
+        samples.append(time.perf_counter() - t0)
+    total = time.perf_counter() - started
+
+    return Result(
+        name=bench.name,
+        iterations=iterations,
+        p50=percentile(samples, 50),
+        p95=percentile(samples, 95),
+        p99=percentile(samples, 99),
+        rps=iterations / total if total else 0.0,
+    )
+
+
+def load_baselines(path=BASELINES_FILE):
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baselines(results, path=BASELINES_FILE):
+    path = Path(path)
+    baselines = load_baselines(path)
+    for result in results:
+        baselines[result.name] = {
+            k: v for k, v in asdict(result).items() if k not in ('name', 'iterations')
+        }
+    path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+
+
+def compare(result, baseline, tolerance):
+    """
+    Return a list of regression messages for ``result`` against its ``baseline``.
+
+    p95 may grow and throughput may drop by at most ``tolerance`` (0.25 = 25%).
+    """
+    regressions = []
+    if result.p95 > baseline['p95'] * (1 + tolerance):
+        regressions.append(
+            f'{result.name}: p95 {result.p95 * 1000:.2f}ms > '
+            f'baseline {baseline["p95"] * 1000:.2f}ms (+{tolerance:.0%})'
+        )
+    if result.rps < baseline['rps'] * (1 - tolerance):
+        regressions.append(
+            f'{result.name}: {result.rps:.1f} req/s < '
+            f'baseline {baseline["rps"]:.1f} req/s (-{tolerance:.0%})'
+        )
+    return regressions
+
+
+class HttpSession:
+    """
+    Minimal client for a running server, mirroring the test ``Client`` API used by flows.
+
+    Sends the CSRF cookie back as ``X-CSRFToken`` so POSTs pass ``CsrfViewMiddleware``.
+    """
+
+    def __init__(self, base_url):
+        import requests
+
+        self.base_url = base_url.rstrip('/') + '/'
+        self.http = requests.Session()
+
+    def _url(self, path):
+        return urljoin(self.base_url, path.lstrip('/'))
+
+    def get(self, path, follow=False, headers=None):
+        return self.http.get(self._url(path), allow_redirects=follow, headers=headers)
+
+    def post(self, path, data=None, follow=False, headers=None):
+        token = self.http.cookies.get('csrftoken')
+        if token is None:
+            self.http.get(self._url(path))
+            token = self.http.cookies.get('csrftoken', '')
+        return self.http.post(
+            self._url(path),
+            data=data,
+            allow_redirects=follow,
+            headers={'X-CSRFToken': token, 'Referer': self._url(path), **(headers or {})},
+        )
+
+    def logout(self):
+        self.http.cookies.clear()
@@ -0,0 +1,56 @@
+"""
+htmx partial responses against the full pages they replace, per interaction.
+
+    wordle_board_htmx      GET /wordle/ with HX-Request: the game without the page
+    wordle_guess_htmx      POST /wordle/guess/ with HX-Request: the new row and its keys
+    wordle_hint_htmx       POST /wordle/hint/ with HX-Request: the hint message
+    leaderboard_page       GET /leaderboard/: the page with the first slice
+    leaderboard_more_htmx  GET /leaderboard/?after= with HX-Request: the next slice's rows
+Compare the Wordle flows with wordle_board_html and wordle_guess_html (benchmarks/api.py),
+which set up the same two guesses. The leaderboard flows need ``LEADERBOARD_PLAYERS``
+profiles, which they create in-process.
+"""
+
+from django.contrib.auth import get_user_model
+
+from benchmarks.api import _two_guesses
+from benchmarks.harness import benchmark
+from users import leaderboard
+from users.models import Profile
+from users.views import LEADERBOARD_PAGE_SIZE
+
+HTMX = {'HX-Request': 'true'}
+LEADERBOARD_PLAYERS = 100
+
+
+@benchmark('wordle_board_htmx', setup=_two_guesses)
+def wordle_board_htmx(session, _state):
+    session.get('/wordle/', headers=HTMX)
+
+
+@benchmark('wordle_guess_htmx', setup=_two_guesses)
+def wordle_guess_htmx(session, _state):
+    session.post('/wordle/guess/', {'guess': 'tiger'}, headers=HTMX)
+
+
+@benchmark('wordle_hint_htmx', setup=_two_guesses)
+def wordle_hint_htmx(session, _state):
+    session.post('/wordle/hint/', headers=HTMX)
+
+
+def _players(_session):
+    User = get_user_model()  # noqa: N806
+    for i in range(LEADERBOARD_PLAYERS - Profile.objects.count()):
+        user = User.objects.create_user(username=f'ranked{i}', email=f'ranked{i}@example.com')
+        Profile.objects.filter(user=user).update(display_name=f'Ranked {i}', experience_points=i)
+    return leaderboard.players(None, LEADERBOARD_PAGE_SIZE)[1]
+
+
+@benchmark('leaderboard_page', in_process_only=True, setup=_players)
+def leaderboard_page(session, _cursor):
+    session.get('/leaderboard/')
+
+
+@benchmark('leaderboard_more_htmx', in_process_only=True, setup=_players)
+def leaderboard_more_htmx(session, cursor):
+    session.get(f'/leaderboard/?after={cursor}', headers=HTMX)
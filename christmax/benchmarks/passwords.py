@@ -0,0 +1,37 @@
+"""
+Password verification throughput with the preferred hasher (``PASSWORD_HASHERS[0]``).
+
+Both benchmarks report logins per second per core as their req/s:
+    password_check_inline  one verification per iteration on the calling thread
+    password_check_pool    one verification per CPU per iteration, all on the hashing pool;
+                           req/s x CPUs is the worker's total login capacity
+Near-equal numbers mean hashing scales across cores (the hasher releases the GIL).
+"""
+
+import os
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.hashers import verify_password
+
+from benchmarks.harness import benchmark
+from users import hashing
+
+PASSWORD = 'correct horse battery staple'
+
+
+def _encoded():
+    return make_password(PASSWORD)
+
+
+@benchmark('password_check_inline', http=False, setup=_encoded)
+def password_check_inline(encoded):
+    verify_password(PASSWORD, encoded)
+
+
+@benchmark('password_check_pool', http=False, setup=_encoded)
+def password_check_pool(encoded):
+    futures = [
+        hashing.submit(verify_password, PASSWORD, encoded) for _ in range(os.cpu_count() or 1)
+    ]
+    for future in futures:
+        future.result()
@@ -0,0 +1,87 @@
+"""
+Wordle scoring and guess validation: Latin words vs four-character idioms.
+
+Each iteration handles the same fixed sample of 1,000 guess/answer pairs:
+    wordle_score_latin      engine.score on two five-letter words
+    wordle_score_idiom      IdiomDictionary.score on two dictionary positions
+    wordle_score_idiom_sounds  the same plus syllable and tone feedback
+    wordle_validate_latin   words.is_valid_guess
+    wordle_validate_idiom   idioms.is_valid_guess
+req/s is thousands of pairs per second.
+
+wordle_hint_search is one uncached hint search per iteration, cycling through the candidate
+sets a player can face after an off-book first guess ("crane").
+"""
+
+import itertools
+import random
+
+from benchmarks.harness import benchmark
+from wordle import idioms
+from wordle import solver
+from wordle import words
+from wordle.engine import score
+
+PAIRS = 1000
+
+
+def _sample(population):
+    rng = random.Random('benchmark')
+    return [(rng.choice(population), rng.choice(population)) for _ in range(PAIRS)]
+
+
+def _latin():
+    return _sample(sorted(words.accepted()))
+
+
+def _idiom_positions():
+    return _sample(range(len(idioms.dictionary())))
+
+
+def _idiom_text():
+    dictionary = idioms.dictionary()
+    return [(dictionary.idiom(g), dictionary.idiom(a)) for g, a in _idiom_positions()]
+
+
+@benchmark('wordle_score_latin', http=False, setup=_latin)
+def wordle_score_latin(pairs):
+    for guess, answer in pairs:
+        score(guess, answer)
+
+
+@benchmark('wordle_score_idiom', http=False, setup=_idiom_positions)
+def wordle_score_idiom(pairs):
+    dictionary = idioms.dictionary()
+    for guess, answer in pairs:
+        dictionary.score(guess, answer)
+
+
+@benchmark('wordle_score_idiom_sounds', http=False, setup=_idiom_positions)
+def wordle_score_idiom_sounds(pairs):
+    dictionary = idioms.dictionary()
+    for guess, answer in pairs:
+        dictionary.score(guess, answer)
+        dictionary.sound_score(guess, answer)
+
+
+@benchmark('wordle_validate_latin', http=False, setup=_latin)
+def wordle_validate_latin(pairs):
+    for guess, _answer in pairs:
+        words.is_valid_guess(guess)
+
+
+@benchmark('wordle_validate_idiom', http=False, setup=_idiom_text)
+def wordle_validate_idiom(pairs):
+    for guess, _answer in pairs:
+        idioms.is_valid_guess(guess)
+
+
+def _candidate_sets():
+    current = solver.solver()
+    feedback = {current.feedback('crane', answer) for answer in current.answers}
+    return itertools.cycle([current.candidates([('crane', value)]) for value in sorted(feedback)])
+
+
+@benchmark('wordle_hint_search', http=False, setup=_candidate_sets)
+def wordle_hint_search(candidate_sets):
+    solver.search.__wrapped__(next(candidate_sets))
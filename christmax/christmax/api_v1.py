@@ -0,0 +1,20 @@
+"""Version 1 of the JSON API, mounted at /api/v1/ and served through base.api.ApiMiddleware."""
+
+from django.urls import path
+
+from users.api import LeaderboardApi
+from users.api import LeaderboardExportApi
+from wordle.api import GuessApi
+from wordle.api import PuzzleApi
+from wordle.views import IDIOMS
+
+app_name = 'api-v1'
+
+urlpatterns = [
+    path('wordle/', PuzzleApi.as_view(), name='wordle'),
+    path('wordle/guess/', GuessApi.as_view(), name='wordle-guess'),
+    path('idioms/', PuzzleApi.as_view(mode=IDIOMS), name='idioms'),
+    path('idioms/guess/', GuessApi.as_view(mode=IDIOMS), name='idioms-guess'),
+    path('leaderboard/', LeaderboardApi.as_view(), name='leaderboard'),
+    path('leaderboard/export/', LeaderboardExportApi.as_view(), name='leaderboard-export'),
+]
@@ -1,176 +0,0 @@
-from pathlib import Path
-from django.utils.translation import gettext_lazy as _
-
-# Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
-
-
-# Quick-start development settings - unsuitable for production
-# See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
-
-# SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-^!niike5=g&wyld!6v6(v(lo%v7+^nkeo@!=)36-&%(jrl_%km'
-
-# SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
-
-ALLOWED_HOSTS = []
-
-if DEBUG:
-    ALLOWED_HOSTS.append('*')
-
-# Application definition
-
-INSTALLED_APPS = [
-    'django.contrib.admin',
-    'django.contrib.auth',
-    'django.contrib.contenttypes',
-    'django.contrib.sessions',
-    'django.contrib.messages',
-    'django.contrib.staticfiles',
-    'allauth',
-    'allauth.account',
-    'allauth.socialaccount',
-    'allauth.socialaccount.providers.google',
-    'base',
-    'users',
-]
-
-if DEBUG:
-    INSTALLED_APPS += ['debug_toolbar', 'django_extensions']
-
-MIDDLEWARE = [
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
-    'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
-    'django.middleware.locale.LocaleMiddleware',
-    'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'allauth.account.middleware.AccountMiddleware',
-]
-
-ROOT_URLCONF = 'christmax.urls'
-
-TEMPLATES = [
-    {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [
-            BASE_DIR / 'base' / 'templates',
-            BASE_DIR / 'users' / 'templates',  # for overriding allauth default login.html etc
-        ],
-        'APP_DIRS': True,
-        'OPTIONS': {
-            'context_processors': [
-                'django.template.context_processors.request',
-                'django.contrib.auth.context_processors.auth',
-                'django.contrib.messages.context_processors.messages',
-            ]
-        },
-    }
-]
-
-AUTHENTICATION_BACKENDS = [
-    # 'django.contrib.auth.backends.ModelBackend',
-    'users.backends.AdminUsernameBackend',
-    # `allauth` specific authentication methods, such as login by email
-    'allauth.account.auth_backends.AuthenticationBackend',
-]
-
-WSGI_APPLICATION = 'christmax.wsgi.application'
-
-
-# Database
-# https://docs.djangoproject.com/en/5.2/ref/settings/#databases
-
-DATABASES = {'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': BASE_DIR / 'db.sqlite3'}}
-
-
-# Password validation
-# https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
-
-AUTH_PASSWORD_VALIDATORS = [
-    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
-    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
-    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
-    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
-]
-
-
-# Internationalization
-# https://docs.djangoproject.com/en/5.2/topics/i18n/
-
-LANGUAGE_CODE = 'en'
-
-LANGUAGES = [('en', _('English')), ('zh', _('Traditional Chinese'))]
-
-LOCALE_PATHS = [BASE_DIR / 'base' / 'locale']
-
-TIME_ZONE = 'UTC'
-
-USE_I18N = True
-
-USE_TZ = True
-
-
-# Static files (CSS, JavaScript, Images)
-# https://docs.djangoproject.com/en/5.2/howto/static-files/
-
-STATIC_URL = 'static/'
-STATICFILES_DIRS = [BASE_DIR / 'base' / 'static']
-
-# Default primary key field type
-# https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
-
-DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
-
-# Custom User Model
-AUTH_USER_MODEL = 'users.User'
-
-# Debug toolbar
-INTERNAL_IPS = ['127.0.0.1']
-
-# ============================================================================
-# Django Allauth - Email-based Authentication
-# ============================================================================
-ACCOUNT_LOGOUT_REDIRECT_URL = '/accounts/login/'
-LOGIN_REDIRECT_URL = '/accounts/email/'
-
-ACCOUNT_ADAPTER = 'users.custom_allauth.MyAccountAdapter'
-SOCIALACCOUNT_ADAPTER = 'users.custom_allauth.MySocialAccountAdapter'
-
-SOCIALACCOUNT_PROVIDERS = {
-    # github not used, as email may not return subject to user settings
-    # 'github': {
-    #     'SCOPE': [
-    #         'read:user',
-    #         'user:email',
-    #     ],
-    # },
-    'google': {'SCOPE': ['profile', 'email'], 'AUTH_PARAMS': {'access_type': 'online'}}
-}
-# NOTE: Admin still uses username login (django.contrib.auth.backends.ModelBackend)
-# Regular users use email login (allauth.account.auth_backends.AuthenticationBackend)
-
-ACCOUNT_AUTHENTICATION_METHOD = 'email'      # Regular users login with email
-ACCOUNT_EMAIL_REQUIRED = True                 # Email is mandatory
-ACCOUNT_USERNAME_REQUIRED = False             # Username auto-generated from email
-ACCOUNT_UNIQUE_EMAIL = True                   # One email = one account
-SOCIALACCOUNT_AUTO_SIGNUP = True              # Auto-create account from social auth
-ACCOUNT_EMAIL_VERIFICATION = 'optional'       # Email verification encouraged but not mandatory
-
-# Email Backend
-if DEBUG:
-    # Development: Print emails to console
-    EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
-else:
-    # Production: Use SMTP (configure these in production .env)
-    EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
-    # EMAIL_HOST = 'smtp.gmail.com'
-    # EMAIL_PORT = 587
-    # EMAIL_USE_TLS = True
-    # EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')
-    # EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')
-    # DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@example.com')
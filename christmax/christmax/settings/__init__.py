@@ -0,0 +1 @@
+"""Settings profiles; see ``base.py`` for which one to pick."""
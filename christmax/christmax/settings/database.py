@@ -0,0 +1,61 @@
+"""
+DATABASES construction from ``DATABASE_URL``, with per-engine tuning.
+
+Not a settings profile itself; imported by ``base.py``.
+
+PostgreSQL:
+    DATABASE_POOL=True      use Django's native psycopg pool (needs ``psycopg[pool]``);
+                            connections are returned to the pool at the end of a request
+    DATABASE_POOL_MIN_SIZE / DATABASE_POOL_MAX_SIZE / DATABASE_POOL_TIMEOUT
+    CONN_MAX_AGE=60         without the pool: keep each worker's connection open this long
+    CONN_HEALTH_CHECKS=True ping a reused connection before the first query of a request
+
+SQLite (single-node deployments):
+    WAL journal so readers never block the writer, IMMEDIATE transactions so concurrent
+    writers queue on the busy timeout instead of failing with "database is locked".
+    SQLITE_BUSY_TIMEOUT=20  seconds a writer waits for the lock
+"""
+
+from pathlib import Path
+
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',  # durable with WAL, fsync only at checkpoints
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',  # 20MB page cache per connection
+    'PRAGMA mmap_size=134217728',  # 128MB memory-mapped reads
+)
+
+
+def database_config(env, var, default, base_dir):
+    """Parse the URL in ``var`` and apply connection tuning for its engine."""
+    config = env.db(var, default=default)
+    engine = config['ENGINE']
+
+    if engine.endswith('sqlite3'):
+        name = str(config['NAME'])
+        if name != ':memory:' and not Path(name).is_absolute():
+            # sqlite:///db.sqlite3 is relative to the project, not the working directory
+            config['NAME'] = Path(base_dir) / name
+        config.setdefault('OPTIONS', {}).update({
+            'init_command': ';'.join(SQLITE_PRAGMAS),
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': env.int('SQLITE_BUSY_TIMEOUT', default=20),
+        })
+        config['CONN_MAX_AGE'] = env.int('CONN_MAX_AGE', default=60)
+
+    elif engine.endswith('postgresql'):
+        options = config.setdefault('OPTIONS', {})
+        if env.bool('DATABASE_POOL', default=False):
+            options['pool'] = {
+                'min_size': env.int('DATABASE_POOL_MIN_SIZE', default=2),
+                'max_size': env.int('DATABASE_POOL_MAX_SIZE', default=10),
+                'timeout': env.int('DATABASE_POOL_TIMEOUT', default=10),
+            }
+            # Django refuses persistent connections on top of a pool
+            config['CONN_MAX_AGE'] = 0
+        else:
+            config['CONN_MAX_AGE'] = env.int('CONN_MAX_AGE', default=60)
+            config['CONN_HEALTH_CHECKS'] = env.bool('CONN_HEALTH_CHECKS', default=True)
+
+    return config
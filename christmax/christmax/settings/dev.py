@@ -0,0 +1,36 @@
+"""Local development profile: DEBUG on, debug toolbar and django-extensions loaded."""
+
+from pathlib import Path
+
+import environ
+
+# Committed development defaults. read_env never overrides a variable that is already set, so
+# the local christmax/.env is read first and both yield to the process environment.
+_project_dir = Path(__file__).resolve().parent.parent.parent
+environ.Env.read_env(_project_dir / '.env')
+environ.Env.read_env(_project_dir / '.env.dev')
+
+from .base import *
+from .base import INSTALLED_APPS
+from .base import MIDDLEWARE
+from .base import env
+
+DEBUG = env.bool('DEBUG', default=True)
+
+ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=['*'])
+
+INSTALLED_APPS = [*INSTALLED_APPS, 'debug_toolbar', 'django_extensions']
+
+# Right after the API branch, so the toolbar sees the rest of the stack but not JSON calls
+_api = MIDDLEWARE.index('base.api.ApiMiddleware') + 1
+MIDDLEWARE = [
+    *MIDDLEWARE[:_api],
+    'debug_toolbar.middleware.DebugToolbarMiddleware',
+    *MIDDLEWARE[_api:],
+]
+
+# Debug toolbar
+INTERNAL_IPS = ['127.0.0.1']
+
+# Development: Print emails to console
+EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
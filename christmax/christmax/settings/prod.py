@@ -0,0 +1,29 @@
+"""
+Production profile: only the apps and middleware the site needs to serve requests.
+
+Dev tooling (debug toolbar, django-extensions) is never imported, which keeps worker
+boot, and therefore autoscaling, fast. Compare profiles with ``manage.py importtime_report``.
+
+Required environment: SECRET_KEY, ALLOWED_HOSTS, DATABASE_URL (see settings/database.py),
+and CACHE_URL pointing at a cache shared by all workers (logged-in sessions live there).
+Email is only queued by the web workers; run ``manage.py send_outbox`` alongside them.
+Static files are collected (``manage.py collectstatic``) into STATIC_ROOT with content hashes
+in their names, so they can be served with far-future cache headers.
+"""
+
+from .base import *
+from .base import BASE_DIR
+from .base import env
+
+DEBUG = False
+
+ALLOWED_HOSTS = env.list('ALLOWED_HOSTS')
+
+# No locmem fallback: logged-in sessions live in this cache, and every worker must see them
+CACHES = {'default': env.cache('CACHE_URL')}
+
+STATIC_ROOT = env.path('STATIC_ROOT', default=BASE_DIR / 'staticfiles')
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'},
+}
@@ -0,0 +1,18 @@
+"""Test-suite profile: the dev app set, minus the costs that only slow tests down."""
+
+from .dev import *
+from .dev import DATABASES
+
+# A second database stands in for the replica. Both are in-memory SQLite for tests (Django
+# names them per alias, so they stay separate). Routing is off unless a test enables
+# DATABASE_REPLICAS, so everything else behaves as with a single database.
+DATABASES = {
+    'default': DATABASES['default'],
+    'replica': {**DATABASES['default'], 'NAME': BASE_DIR / 'db_replica.sqlite3'},
+}
+DATABASE_REPLICAS = []
+
+# PBKDF2 at production cost dominates every test that creates or logs in a user
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
@@ -24,10 +24,14 @@ from django.views.i18n import JavaScriptCatalog
 from django.views.generic import TemplateView
 
 from base.views import HomeView
+from base.views import MetricsView
+from users.views import LeaderboardView
 from users.views import SettingsView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
+    path('api/v1/', include('christmax.api_v1')),
     # Django-allauth URLs (outside i18n_patterns to avoid duplicate registration)
 ]
 
@@ -36,7 +40,9 @@ urlpatterns += i18n_patterns(
     path('', HomeView.as_view(), name='home'),
     path('', HomeView.as_view(), name='home_zh'),
     path('settings/', SettingsView.as_view(), name='settings'),
+    path('leaderboard/', LeaderboardView.as_view(), name='leaderboard'),
     path('accounts/', include('allauth.urls')),
+    path('wordle/', include('wordle.urls')),
     # require login or redirect to login page
     # path('accounts/profile/', TemplateView.as_view(template_name="profile.html"), name='profile'),
     prefix_default_language=False,
@@ -11,6 +11,7 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'christmax.settings')
+# Production entrypoint: dev settings (DEBUG, debug toolbar) only via manage.py
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'christmax.settings.prod')
 
 application = get_wsgi_application()
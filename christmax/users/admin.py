@@ -2,6 +2,10 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 
+from base.admin import CachedAllValuesFieldListFilter
+from base.admin import LargeTableAdminMixin
+from base.admin import csv_export_action
+
 from .models import Profile, User
 
 
@@ -16,9 +20,13 @@ class ProfileInline(admin.StackedInline):
     fields = ('display_name', 'player_level', 'experience_points', 'created_at', 'updated_at')
     readonly_fields = ('created_at', 'updated_at')
 
+    def get_queryset(self, request):
+        # Profile.__str__ reads the user; join it instead of a second query per change view
+        return super().get_queryset(request).select_related('user')
+
 
 @admin.register(User)
-class UserAdmin(BaseUserAdmin):
+class UserAdmin(LargeTableAdminMixin, BaseUserAdmin):
     """Custom User admin - extends Django's UserAdmin.
 
     Uses username for Django admin login (standard approach).
@@ -29,6 +37,12 @@ class UserAdmin(BaseUserAdmin):
     list_filter = ('is_staff', 'is_superuser', 'is_active', 'date_joined')
     search_fields = ('username', 'email', 'first_name', 'last_name')
     ordering = ('-date_joined',)
+    actions = (
+        csv_export_action(
+            'id', 'username', 'email', 'first_name', 'last_name', 'is_active', 'date_joined',
+            'last_login',
+        ),
+    )
 
     # Show profile inline when editing a user
     inlines = (ProfileInline,)
@@ -51,13 +65,24 @@ class UserAdmin(BaseUserAdmin):
 
 
 @admin.register(Profile)
-class ProfileAdmin(admin.ModelAdmin):
+class ProfileAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     """Admin interface for Profile - standalone view."""
 
     list_display = ('user', 'display_name', 'player_level', 'experience_points', 'created_at')
-    list_filter = ('player_level', 'created_at')
+    list_filter = (('player_level', CachedAllValuesFieldListFilter), 'created_at')
+    list_select_related = ('user',)
     search_fields = ('user__username', 'user__email', 'display_name')
     readonly_fields = ('created_at', 'updated_at')
+    # Walks profile_xp_rank_idx, so deep "Show more" pages stay index scans
+    ordering = ('-experience_points', 'id')
+    actions = (
+        csv_export_action(
+            'id', 'user__username', 'display_name', 'player_level', 'experience_points',
+            'created_at',
+        ),
+    )
+    # A <select> listing every user does not render at millions of rows
+    raw_id_fields = ('user',)
 
     fieldsets = (
         (_('User'), {'fields': ('user',)}),
@@ -0,0 +1,67 @@
+"""
+Leaderboard slices for the JSON API (/api/v1/leaderboard/).
+
+Slices come from users/leaderboard.py: ``next`` is the keyset cursor of the following slice
+(``?after=``). Each slice is rendered once per ``LEADERBOARD_CACHE_TTL`` through
+``get_or_compute``, and its ETag is a digest of the body. A client polling an unchanged
+slice gets a 304.
+
+Staff can download the whole board from /api/v1/leaderboard/export/ as one JSON array. It is
+streamed from a database cursor, so memory stays flat however many players there are.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.http import HttpResponse
+
+from base.api import ApiError
+from base.api import ApiView
+from base.api import StreamingApiResponse
+from base.api import conditional
+from base.api import dumps
+from base.caching import get_or_compute
+from users import leaderboard
+
+MAX_LIMIT = 100
+
+
+def _cursor(value):
+    """``'<xp>.<profile id>'`` -> ``(xp, id)``."""
+    try:
+        return leaderboard.parse_cursor(value)
+    except ValueError as e:
+        raise ApiError('invalid_cursor', 'after must look like <xp>.<id>') from e
+
+
+def leaderboard_slice(after, limit):
+    """The JSON body and ETag for ``limit`` players after the ``after`` cursor (or the top)."""
+    players, next_cursor = leaderboard.players(after, limit)
+    body = dumps({'players': players, 'next': next_cursor})
+    return body, hashlib.md5(body, usedforsecurity=False).hexdigest()
+
+
+class LeaderboardApi(ApiView):
+    def get(self, request):
+        after = _cursor(request.GET['after']) if request.GET.get('after') else None
+        try:
+            limit = min(int(request.GET.get('limit', 50)), MAX_LIMIT)
+        except ValueError as e:
+            raise ApiError('invalid_limit', 'limit must be a number') from e
+        if limit < 1:
+            raise ApiError('invalid_limit', 'limit must be at least 1')
+        body, etag = get_or_compute(
+            f'leaderboard:{leaderboard.format_cursor(after)}:{limit}',
+            lambda: leaderboard_slice(after, limit),
+            getattr(settings, 'LEADERBOARD_CACHE_TTL', 10),
+        )
+        return conditional(
+            request, etag, lambda: HttpResponse(body, content_type='application/json')
+        )
+
+
+class LeaderboardExportApi(ApiView):
+    def get(self, request):
+        if not request.user.is_staff:
+            raise ApiError('forbidden', 'Staff only', status=403)
+        return StreamingApiResponse(leaderboard.everyone())
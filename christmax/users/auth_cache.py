@@ -0,0 +1,131 @@
+"""
+Shared cache of logged-in users, loaded together with their profile.
+
+``AuthenticationMiddleware`` loads ``request.user`` with one query on every request, and
+reading ``user.profile`` (level, XP) costs a second one. The backends in users/backends.py
+load users through ``load_user()``, which fetches ``User`` plus ``Profile`` with one
+``select_related`` query and keeps the result in ``AUTH_USER_CACHE_ALIAS``. With the
+cache-backed sessions in base/sessions.py, a warm authenticated page view runs no auth
+queries at all.
+
+Entries are keyed by user id, so all of a user's sessions share one entry. Django still
+checks the session's password hash against the cached user, so a password change logs
+other sessions out as before. Saving or deleting a user or profile drops the entry, at once
+and again on commit, so a concurrent request cannot re-cache the old row.
+
+``QuerySet.update()`` sends no signals, so bulk updates call ``forget_all_users()``. It
+replaces the epoch stored with every entry, and the epoch is read in the same ``get_many``
+round trip as the user. ``AUTH_USER_CACHE_TIMEOUT`` bounds staleness from any other raw
+writes.
+
+Invalidation only works if every process shares the cache: a management command that
+deactivates users must reach the entries the web workers read. A process-local backend
+(``locmemcache://``, the dev and test default) is therefore refused, and users are loaded
+from the database on every request, still with their profile in one query.
+"""
+
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+KEY_PREFIX = 'users:auth:'
+EPOCH_KEY = 'users:auth-epoch'
+
+
+# Backends whose entries other processes can't see, or invalidate
+PROCESS_LOCAL_BACKENDS = (LocMemCache,)
+
+
+def _cache():
+    """The cache for users, or None when the configured one isn't shared between processes."""
+    cache = caches[getattr(settings, 'AUTH_USER_CACHE_ALIAS', 'default')]
+    return None if isinstance(cache, PROCESS_LOCAL_BACKENDS) else cache
+
+
+def _timeout():
+    return getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 300)
+
+
+def _users():
+    return get_user_model()._default_manager.select_related('profile')
+
+
+def _cached(values, key):
+    """The user cached under ``key`` if it was stored in the current epoch, else None."""
+    entry = values.get(key)
+    if entry is not None and entry[0] == values.get(EPOCH_KEY):
+        return entry[1]
+    return None
+
+
+def _epoch(cache, values):
+    # No epoch (first use or evicted): start a new one, so older entries can't match it
+    epoch = values.get(EPOCH_KEY)
+    if epoch is None:
+        cache.add(EPOCH_KEY, time.time_ns(), None)
+        epoch = cache.get(EPOCH_KEY)
+    return epoch
+
+
+def load_user(user_id):
+    """The user with ``user_id`` and its profile, from the cache when possible."""
+    cache = _cache()
+    if cache is None:
+        return _users().filter(pk=user_id).first()
+    key = f'{KEY_PREFIX}{user_id}'
+    values = cache.get_many([key, EPOCH_KEY])
+    user = _cached(values, key)
+    if user is None:
+        user = _users().filter(pk=user_id).first()
+        if user is not None:
+            cache.set(key, (_epoch(cache, values), user), _timeout())
+    return user
+
+
+async def aload_user(user_id):
+    cache = _cache()
+    if cache is None:
+        return await _users().filter(pk=user_id).afirst()
+    key = f'{KEY_PREFIX}{user_id}'
+    values = await cache.aget_many([key, EPOCH_KEY])
+    user = _cached(values, key)
+    if user is None:
+        user = await _users().filter(pk=user_id).afirst()
+        if user is not None:
+            await cache.aset(key, (_epoch(cache, values), user), _timeout())
+    return user
+
+
+def forget_users(user_ids):
+    cache = _cache()
+    keys = [f'{KEY_PREFIX}{user_id}' for user_id in user_ids]
+    if cache is not None and keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def forget_all_users():
+    """Invalidate every cached user, e.g. after a ``QuerySet.update()`` on users."""
+    cache = _cache()
+    if cache is not None:
+        cache.set(EPOCH_KEY, time.time_ns(), None)
+        transaction.on_commit(lambda: cache.set(EPOCH_KEY, time.time_ns(), None))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def _user_changed(sender, instance, **kwargs):
+    forget_users([instance.pk])
+
+
+@receiver(post_save, sender='users.Profile')
+@receiver(post_delete, sender='users.Profile')
+def _profile_changed(sender, instance, **kwargs):
+    forget_users([instance.user_id])
@@ -1,10 +1,30 @@
+from allauth.account import auth_backends
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
 from django.urls import resolve, Resolver404
 
+from users import auth_cache
+
 User = get_user_model()
 
-class AdminUsernameBackend(ModelBackend):
+
+class CachedUserMixin:
+    """Load ``request.user`` with its profile through the shared cache (users.auth_cache)."""
+
+    def get_user(self, user_id):
+        user = auth_cache.load_user(user_id)
+        return user if user is not None and self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        user = await auth_cache.aload_user(user_id)
+        return user if user is not None and self.user_can_authenticate(user) else None
+
+
+class AuthenticationBackend(CachedUserMixin, auth_backends.AuthenticationBackend):
+    """allauth's email login, with cached user loading."""
+
+
+class AdminUsernameBackend(CachedUserMixin, ModelBackend):
     """
     Allow authentication with username OR email.
     ONLY for staff users accessing admin pages.
@@ -18,7 +38,7 @@ class AdminUsernameBackend(ModelBackend):
             user = User.objects.get(username=username)
         except User.DoesNotExist:
             try:
-                user = User.objects.get(email=username)
+                user = User.objects.get_by_email(username)
             except User.DoesNotExist:
                 return None
 
@@ -26,14 +46,36 @@ class AdminUsernameBackend(ModelBackend):
             if not user.is_staff:
                 return None
 
-            if request and hasattr(request, 'path'):
-                try:
-                    resolved = resolve(request.path)
-                    if resolved.namespace == 'admin':
-                        return user
-                except Resolver404:
-                    pass
+            if self._is_admin_request(request):
+                return user
+
+            return None
+
+        return None
 
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        """Async authenticate(); the password is verified on the hashing pool (users.hashing)."""
+        if username is None or password is None:
             return None
 
+        try:
+            user = await User.objects.aget(username=username)
+        except User.DoesNotExist:
+            try:
+                user = await User.objects.aget_by_email(username)
+            except User.DoesNotExist:
+                return None
+
+        if await user.acheck_password(password) and user.is_staff:
+            if self._is_admin_request(request):
+                return user
+
         return None
+
+    def _is_admin_request(self, request):
+        if request and hasattr(request, 'path'):
+            try:
+                return resolve(request.path).namespace == 'admin'
+            except Resolver404:
+                pass
+        return False
@@ -1,12 +1,16 @@
-import re
 import logging
 from allauth.account.adapter import DefaultAccountAdapter
 from allauth.socialaccount.adapter import DefaultSocialAccountAdapter
-
-logger = logging.getLogger(__name__)
 from django.contrib.auth import get_user_model
 
-User = get_user_model()
+from base.i18n_urls import url_for
+
+from users.usernames import UsernameAllocator
+from users.usernames import username_base
+
+# Adapters are imported lazily by allauth's get_adapter(); keep module import cheap and
+# free of app-registry access so it never runs (or fails) during worker boot.
+logger = logging.getLogger(__name__)
 
 
 def generate_username_from_email(user):
@@ -17,16 +21,10 @@ def generate_username_from_email(user):
     if not username:
         email = user_email(user)
         if email:
-            local_part = email.split('@')[0]
-            base_username = re.sub(r'[^\w]', '_', local_part)[:150]
-
-            username = base_username
-            counter = 1
-            while User.objects.filter(username=username).exclude(pk=user.pk).exists():
-                username = f'{base_username}_{counter}'
-                counter += 1
-
-            user_username(user, username)
+            # One query for every taken base/base_N name instead of one probe per suffix
+            allocator = UsernameAllocator()
+            allocator.prefetch([username_base(email)])
+            user_username(user, allocator.allocate(username_base(email)))
 
 
 class MyAccountAdapter(DefaultAccountAdapter):
@@ -34,15 +32,11 @@ class MyAccountAdapter(DefaultAccountAdapter):
 
     def get_login_redirect_url(self, request):
         """Override redirect after regular login."""
-        if request.path.startswith('/zh/'):
-            return '/zh/settings/'
-        return '/settings/'
+        return url_for(request, 'settings')
 
     def get_logout_redirect_url(self, request):
         """Override redirect after logout to preserve language."""
-        if request.path.startswith('/zh/'):
-            return '/zh/'
-        return '/'
+        return url_for(request, 'home')
 
     def populate_username(self, request, user):
         generate_username_from_email(user)
@@ -61,14 +55,15 @@ class MySocialAccountAdapter(DefaultSocialAccountAdapter):
 
         # Log social login attempt
         logger.info(
-            f'Social login callback from {provider}: '
-            f'uid={sociallogin.account.uid}, '
-            f'email={email}, '
-            f'is_existing={sociallogin.is_existing}'
+            'Social login callback from %s: uid=%s, email=%s, is_existing=%s',
+            provider,
+            sociallogin.account.uid,
+            email,
+            sociallogin.is_existing,
         )
 
         if not email:
-            logger.error(f'Social login from {provider} missing email - blocking signup')
+            logger.error('Social login from %s missing email - blocking signup', provider)
             from django.contrib import messages
             from allauth.exceptions import ImmediateHttpResponse
             from django.shortcuts import redirect
@@ -78,20 +73,57 @@ class MySocialAccountAdapter(DefaultSocialAccountAdapter):
                 f'Your {provider.title()} account must provide an email address to sign up. '
                 f'Please check your {provider.title()} account settings.',
             )
-            raise ImmediateHttpResponse(redirect('/accounts/login/'))
+            raise ImmediateHttpResponse(redirect(url_for(request, 'account_login')))
 
         if not sociallogin.is_existing and request.user.is_anonymous:
-            try:
-                user = User.objects.get(email=email)
-
-                sociallogin.connect(request, user)
-                logger.info(f'Linked {provider} account to existing user: {email}')
-            except User.DoesNotExist:
-                logger.info(f'New user signup from {provider}: {email}')
-            except User.MultipleObjectsReturned:
-                logger.error(f'Multiple users found with email: {email}')
+            self.link_existing_user(request, sociallogin, email)
         return super().pre_social_login(request, sociallogin)
 
+    def link_existing_user(self, request, sociallogin, email):
+        """
+        Connect ``sociallogin`` to the user who owns ``email``, if there is one.
+
+        A single query fetches the user together with whether the address is verified and
+        whether they already have an account with this provider. The row is locked
+        (``select_for_update``) only here, on the branch that may write, so two concurrent
+        callbacks cannot both connect.
+        """
+        from allauth.account.models import EmailAddress
+        from allauth.socialaccount.models import SocialAccount
+        from django.db import transaction
+        from django.db.models import Exists
+        from django.db.models import OuterRef
+
+        provider = sociallogin.account.provider
+        User = get_user_model()
+        with transaction.atomic():
+            user = (
+                User.objects.select_for_update()
+                .with_email(email)
+                .annotate(
+                    email_verified=Exists(
+                        # allauth stores EmailAddress.email lowercased
+                        EmailAddress.objects.filter(
+                            user=OuterRef('pk'), email=email.lower(), verified=True
+                        )
+                    ),
+                    has_provider_account=Exists(
+                        SocialAccount.objects.filter(user=OuterRef('pk'), provider=provider)
+                    ),
+                )
+                .first()
+            )
+            if user is None:
+                logger.info('New user signup from %s: %s', provider, email)
+                return
+            sociallogin.connect(request, user)
+
+        if not user.email_verified:
+            logger.warning('Linked %s account to %s, whose email is unverified', provider, email)
+        if user.has_provider_account:
+            logger.warning('%s now has more than one %s account', email, provider)
+        logger.info('Linked %s account to existing user: %s', provider, email)
+
     def populate_user(self, request, sociallogin, data):
         user = super().populate_user(request, sociallogin, data)
 
@@ -117,15 +149,11 @@ class MySocialAccountAdapter(DefaultSocialAccountAdapter):
 
     def get_login_redirect_url(self, request):
         """Override redirect after social login."""
-        if request.path.startswith('/zh/'):
-            return '/zh/settings/'
-        return '/settings/'
+        return url_for(request, 'settings')
 
     def get_logout_redirect_url(self, request):
         """Override redirect after logout to preserve language."""
-        if request.path.startswith('/zh/'):
-            return '/zh/'
-        return '/'
+        return url_for(request, 'home')
 
     def is_auto_signup_allowed(self, request, sociallogin):
         """
@@ -147,7 +175,9 @@ class MySocialAccountAdapter(DefaultSocialAccountAdapter):
         """
         # Log error
         logger.error(
-            f'Social auth error from {provider_id}: {error}',
+            'Social auth error from %s: %s',
+            provider_id,
+            error,
             exc_info=exception,
             extra={'extra_context': extra_context},
         )
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with costs from settings (ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM).
+
+    Keeps Django's ``argon2`` algorithm name, so changing a cost upgrades existing hashes on
+    the next login instead of invalidating them. Parallelism defaults to 1: concurrency comes
+    from the hashing pool (users.hashing), not from threads inside one hash.
+    """
+
+    @property
+    def time_cost(self):
+        return getattr(settings, 'ARGON2_TIME_COST', 3)
+
+    @property
+    def memory_cost(self):
+        return getattr(settings, 'ARGON2_MEMORY_COST', 64 * 1024)  # KiB
+
+    @property
+    def parallelism(self):
+        return getattr(settings, 'ARGON2_PARALLELISM', 1)
@@ -0,0 +1,106 @@
+"""
+Async password checks on a bounded thread pool, with back-pressure.
+
+Django's own ``acheck_password`` hashes on the event loop thread, stalling every other
+request the loop serves. ``acheck_password`` here awaits a small pool of threads instead;
+both ``hashlib.pbkdf2_hmac`` and argon2-cffi release the GIL, so they hash in parallel.
+Synchronous checks (``User.check_password``, under WSGI, in forms and management commands)
+stay inline: the calling thread would only block on the pool, so a hop frees nothing.
+
+At most ``PASSWORD_HASHING_WORKERS`` hashes run at once, and at most
+``PASSWORD_HASHING_QUEUE`` more may wait for a thread. Beyond that ``acheck_password`` fails
+fast with ``PasswordHashingBusy`` instead of piling more CPU work onto a saturated worker.
+
+Only the async entry points reach the pool: ``User.acheck_password`` and
+``AdminUsernameBackend.aauthenticate`` (via ``django.contrib.auth.aauthenticate``). The admin
+and allauth login views are synchronous, so no login page goes through it yet; an async
+login view would have to answer ``PasswordHashingBusy`` itself.
+
+Hash upgrades are transparent: a correct password stored with an outdated hasher or cost
+is re-hashed with the preferred one (see ``PASSWORD_HASHERS``) and saved.
+
+Settings:
+    PASSWORD_HASHING_WORKERS - concurrent hashes (default: CPU count)
+    PASSWORD_HASHING_QUEUE   - checks allowed to wait for a thread (default: 4 x workers)
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.hashers import verify_password
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from base.instrumentation import registry
+
+registry.describe(
+    'django_password_hashing_rejected_total', 'Password checks rejected by a full hashing queue'
+)
+
+_lock = threading.Lock()
+_pool = None
+_slots = None
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the hashing pool and its queue are full."""
+
+
+def _get_pool():
+    global _pool, _slots
+    with _lock:
+        if _pool is None:
+            workers = getattr(settings, 'PASSWORD_HASHING_WORKERS', 0) or os.cpu_count() or 1
+            queue = getattr(settings, 'PASSWORD_HASHING_QUEUE', None)
+            queue = 4 * workers if queue is None else queue
+            _slots = threading.BoundedSemaphore(workers + queue)
+            _pool = ThreadPoolExecutor(workers, thread_name_prefix='password-hashing')
+        return _pool, _slots
+
+
+@receiver(setting_changed)
+def _reset_pool(setting, **kwargs):
+    global _pool, _slots
+    if setting in ('PASSWORD_HASHING_WORKERS', 'PASSWORD_HASHING_QUEUE'):
+        with _lock:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = _slots = None
+
+
+def submit(func, *args):
+    """Run ``func(*args)`` on the hashing pool; raise PasswordHashingBusy when it is full."""
+    pool, slots = _get_pool()
+    if not slots.acquire(blocking=False):
+        registry.increment('django_password_hashing_rejected_total', {})
+        raise PasswordHashingBusy
+    try:
+        future = pool.submit(func, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _future: slots.release())
+    return future
+
+
+def _upgrade(user, encoded):
+    user.password = encoded
+    # Hash upgrades are not password changes (no password_changed signal)
+    user._password = None
+
+
+async def acheck_password(user, raw_password):
+    """
+    Verify ``raw_password`` for ``user`` on the pool, upgrading the stored hash if needed; the
+    event loop awaits the pool instead of hashing.
+    """
+    future = submit(verify_password, raw_password, user.password)
+    is_correct, must_update = await asyncio.wrap_future(future)
+    if is_correct and must_update:
+        _upgrade(user, await asyncio.wrap_future(submit(make_password, raw_password)))
+        await user.asave(update_fields=['password'])
+    return is_correct
@@ -0,0 +1,54 @@
+"""
+Leaderboard slices, shared by the page (users.views) and the JSON API (users.api).
+
+Players are ordered by experience points, then profile id, along ``profile_xp_rank_idx``.
+Slices are keyset-paginated: a slice's ``next`` cursor (``'<xp>.<profile id>'``, passed back
+as ``?after=``) starts the following one, so deep pages never pay for an OFFSET.
+``everyone()`` walks the whole board through a database cursor, for dumps.
+"""
+
+from django.db.models import Q
+
+from users.models import Profile
+
+
+def parse_cursor(value):
+    """``'<xp>.<profile id>'`` -> ``(xp, id)``; raises ValueError."""
+    xp, profile_id = (int(part) for part in value.split('.'))
+    return xp, profile_id
+
+
+def format_cursor(after):
+    return f'{after[0]}.{after[1]}' if after else 'top'
+
+
+def players(after, limit):
+    """
+    ``limit`` players after the ``after`` cursor (or from the top) as ``{name, level, xp}``
+    dicts, and the cursor of the next slice (None after the last).
+    """
+    profiles = Profile.objects.order_by('-experience_points', 'id')
+    if after:
+        xp, profile_id = after
+        profiles = profiles.filter(
+            Q(experience_points__lt=xp) | Q(experience_points=xp, id__gt=profile_id)
+        )
+    rows = list(
+        profiles.values_list('id', 'display_name', 'player_level', 'experience_points')[:limit]
+    )
+    last = rows[-1] if len(rows) == limit else None
+    return (
+        [{'name': name, 'level': level, 'xp': xp} for _id, name, level, xp in rows],
+        f'{last[3]}.{last[0]}' if last else None,
+    )
+
+
+def everyone(chunk_size=2000):
+    """Every player, best first, fetched ``chunk_size`` rows at a time."""
+    rows = (
+        Profile.objects.order_by('-experience_points', 'id')
+        .values_list('display_name', 'player_level', 'experience_points')
+        .iterator(chunk_size=chunk_size)
+    )
+    for name, level, xp in rows:
+        yield {'name': name, 'level': level, 'xp': xp}
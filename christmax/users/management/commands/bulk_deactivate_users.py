@@ -0,0 +1,77 @@
+"""
+Django management command to deactivate a cohort of accounts.
+
+Reads emails from the ``email`` column of a CSV file and deactivates the matching users
+with one ``UPDATE ... WHERE email IN (...)`` per chunk: no per-user save(), no signals.
+Deactivated users can no longer log in, and their existing sessions stop authenticating
+(the auth cache is invalidated explicitly, see users/auth_cache.py).
+
+Usage:
+    python manage.py bulk_deactivate_users cohort.csv
+    python manage.py bulk_deactivate_users cohort.csv --dry-run
+    python manage.py bulk_deactivate_users cohort.csv --reactivate
+"""
+
+import csv
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from users.auth_cache import forget_all_users
+from users.management.commands.bulk_provision_users import chunked
+
+
+def set_active(emails, active=False, chunk_size=1000, dry_run=False):
+    """Set ``is_active`` for the users with ``emails``; return the number of rows matched."""
+    User = get_user_model()
+    total = 0
+    for chunk in chunked(emails, chunk_size):
+        users = User.objects.filter(email__in=chunk).exclude(is_active=active)
+        total += users.count() if dry_run else users.update(is_active=active)
+    if total and not dry_run:
+        forget_all_users()
+    return total
+
+
+class Command(BaseCommand):
+    """Bulk-deactivate (or reactivate) accounts listed in a CSV file."""
+
+    help = 'Deactivate the users whose emails are listed in a CSV file'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('csv_file', help='Path to a CSV file with an "email" column')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Emails per UPDATE')
+        parser.add_argument('--reactivate', action='store_true', help='Set is_active=True instead')
+        parser.add_argument('--dry-run', action='store_true', help='Only count matching users')
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        User = get_user_model()
+        try:
+            csv_file = open(options['csv_file'], newline='', encoding='utf-8')  # noqa: SIM115
+        except OSError as e:
+            raise CommandError(f'Cannot read {options["csv_file"]}: {e}') from e
+
+        with csv_file:
+            reader = csv.DictReader(csv_file)
+            if 'email' not in (reader.fieldnames or []):
+                raise CommandError('The CSV file needs an "email" column')
+            emails = (
+                User.objects.normalize_email(row['email'].strip())
+                for row in reader
+                if row.get('email')
+            )
+            count = set_active(
+                emails,
+                active=options['reactivate'],
+                chunk_size=options['chunk_size'],
+                dry_run=options['dry_run'],
+            )
+
+        action = 'reactivate' if options['reactivate'] else 'deactivate'
+        if options['dry_run']:
+            self.stdout.write(f'Would {action} {count:,} users')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{action.title()}d {count:,} users'))
@@ -0,0 +1,170 @@
+"""
+Django management command to create a whole cohort of accounts from a CSV file.
+
+``User.save()`` probes the database once per username candidate and fires two post_save
+handlers per user. This command streams the CSV in chunks instead; per chunk it runs one
+query each to find existing emails and usernames, hashes passwords in a process pool, and
+``bulk_create``s the users, their profiles and their allauth ``EmailAddress`` rows inside
+one transaction.
+
+CSV columns: ``email`` (required), ``username``, ``first_name``, ``last_name``,
+``display_name``, ``password``. A row without a password gets an unusable one, so the
+student sets it with "forgot password" or signs in with Google. Emails that already have
+an account are skipped and reported.
+
+Usage:
+    python manage.py bulk_provision_users cohort.csv
+    python manage.py bulk_provision_users cohort.csv --verified --chunk-size 2000
+    python manage.py bulk_provision_users cohort.csv --workers 0    # hash in-process
+"""
+
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from allauth.account.models import EmailAddress
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import transaction
+
+from users.models import Profile
+from users.usernames import UsernameAllocator
+from users.usernames import username_base
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _init_worker(settings_module):
+    # Spawned workers start without Django configured; forked ones already have it
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+
+    django.setup()
+
+
+def hash_passwords(passwords, executor=None):
+    """Hash ``passwords`` (None -> unusable), across ``executor``'s processes if given."""
+    if executor is None:
+        return [make_password(p) for p in passwords]
+    return list(executor.map(make_password, passwords, chunksize=64))
+
+
+def provision(rows, chunk_size=1000, verified=False, executor=None, stdout=None):
+    """Create users, profiles and email addresses for ``rows``; return (created, skipped)."""
+    User = get_user_model()
+    allocator = UsernameAllocator()
+    seen_emails = set()
+    created = skipped = 0
+
+    for chunk in chunked(rows, chunk_size):
+        entries = []
+        for row in chunk:
+            email = User.objects.normalize_email((row.get('email') or '').strip())
+            if not email or email.lower() in seen_emails:
+                skipped += 1
+                continue
+            seen_emails.add(email.lower())
+            entries.append((email, row))
+
+        existing = set(
+            User.objects.filter(email__in=[email for email, _row in entries]).values_list(
+                'email', flat=True
+            )
+        )
+        skipped += sum(email in existing for email, _row in entries)
+        entries = [(email, row) for email, row in entries if email not in existing]
+        if not entries:
+            continue
+
+        bases = [(row.get('username') or '').strip() or username_base(e) for e, row in entries]
+        allocator.prefetch(bases)
+        hashes = hash_passwords([row.get('password') or None for _e, row in entries], executor)
+
+        users = [
+            User(
+                email=email,
+                username=allocator.allocate(base),
+                first_name=(row.get('first_name') or '').strip(),
+                last_name=(row.get('last_name') or '').strip(),
+                password=password,
+            )
+            for (email, row), base, password in zip(entries, bases, hashes, strict=True)
+        ]
+        with transaction.atomic():
+            users = User.objects.bulk_create(users)
+            Profile.objects.bulk_create(
+                Profile(user=user, display_name=(row.get('display_name') or '').strip()[:20])
+                for user, (_email, row) in zip(users, entries, strict=True)
+            )
+            EmailAddress.objects.bulk_create(
+                EmailAddress(user=user, email=user.email, primary=True, verified=verified)
+                for user in users
+            )
+        created += len(users)
+        if stdout:
+            stdout.write(f'  created {created:,} (skipped {skipped:,})')
+
+    return created, skipped
+
+
+class Command(BaseCommand):
+    """Bulk-create accounts from a CSV file."""
+
+    help = 'Create users, profiles and email addresses from a CSV file in bulk'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('csv_file', help='Path to the CSV file')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Rows per transaction')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count(),
+            help='Password hashing processes (0 hashes in-process)',
+        )
+        parser.add_argument(
+            '--verified',
+            action='store_true',
+            help='Mark the email addresses verified (the school vouches for them)',
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        try:
+            csv_file = open(options['csv_file'], newline='', encoding='utf-8')  # noqa: SIM115
+        except OSError as e:
+            raise CommandError(f'Cannot read {options["csv_file"]}: {e}') from e
+
+        with csv_file:
+            reader = csv.DictReader(csv_file)
+            if 'email' not in (reader.fieldnames or []):
+                raise CommandError('The CSV file needs an "email" column')
+
+            executor = None
+            if options['workers']:
+                executor = ProcessPoolExecutor(
+                    max_workers=options['workers'],
+                    initializer=_init_worker,
+                    initargs=(settings.SETTINGS_MODULE,),
+                )
+            try:
+                created, skipped = provision(
+                    reader,
+                    chunk_size=options['chunk_size'],
+                    verified=options['verified'],
+                    executor=executor,
+                    stdout=self.stdout,
+                )
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f'Created {created:,} users, skipped {skipped:,}'))
@@ -0,0 +1,154 @@
+"""
+Django management command to seed a large user table and show query plans.
+
+Seeds N users with profiles (bulk inserts, no signals) into a throwaway test database,
+then prints EXPLAIN output and the median time of each hot query: leaderboard ranking,
+ProfileAdmin filters, UserAdmin ordering and search, username prefix probes, and email
+lookups (the ``LOWER(email)`` index against an unindexable ``iexact``).
+Run it against PostgreSQL (DATABASE_URL) to see the trigram and prefix indexes in use.
+
+Usage:
+    python manage.py explain_user_queries                  # 1,000,000 users
+    python manage.py explain_user_queries --users 100000
+    python manage.py explain_user_queries --current-db     # seed the configured database
+"""
+
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.test.utils import setup_databases
+from django.test.utils import teardown_databases
+from django.utils import timezone
+
+from users.models import Profile
+
+User = get_user_model()
+
+SEED_PREFIX = 'seed_user'
+
+
+def seed(count, batch_size=10_000, stdout=None):
+    """Bulk-insert ``count`` users and their profiles with realistic spreads."""
+    rng = random.Random(42)  # noqa: S311
+    password = make_password('seed-password')  # one hash for everyone, hashing is not measured
+    now = timezone.now()
+    start = User.objects.count()
+
+    for offset in range(start, start + count, batch_size):
+        size = min(batch_size, start + count - offset)
+        users = []
+        for i in range(offset, offset + size):
+            joined = now - timedelta(minutes=rng.randint(0, 3 * 365 * 24 * 60))
+            users.append(
+                User(
+                    username=f'{SEED_PREFIX}_{i}',
+                    email=f'{SEED_PREFIX}_{i}@example.com',
+                    first_name=f'First{i % 5000}',
+                    last_name=f'Last{i % 7919}',
+                    password=password,
+                    date_joined=joined,
+                )
+            )
+        users = User.objects.bulk_create(users, batch_size=batch_size)
+        profiles = []
+        for user in users:
+            xp = int(rng.paretovariate(1.5) * 100)
+            profiles.append(
+                Profile(
+                    user=user,
+                    experience_points=xp,
+                    player_level=min(1 + xp // 500, 99),
+                    display_name=f'player{user.pk}'[:20],
+                )
+            )
+        Profile.objects.bulk_create(profiles, batch_size=batch_size)
+        if stdout:
+            stdout.write(f'  seeded {offset + size:,}/{start + count:,}')
+
+
+def hot_queries():
+    """The queries the indexes in migrations 0002 and 0003 exist for, by name."""
+    now = timezone.now()
+    top = Profile.objects.order_by('-experience_points', 'id').values('experience_points', 'id')
+    cursor = top[49] if top.count() > 49 else {'experience_points': 0, 'id': 0}
+    return {
+        'leaderboard top 50': Profile.objects.order_by('-experience_points', 'id')[:50],
+        'leaderboard keyset page': Profile.objects.filter(
+            Q(experience_points__lt=cursor['experience_points'])
+            | Q(experience_points=cursor['experience_points'], id__gt=cursor['id'])
+        ).order_by('-experience_points', 'id')[:50],
+        'admin profile level filter': Profile.objects.filter(player_level=3).order_by(
+            '-experience_points'
+        )[:100],
+        'admin profile created_at (past 7 days)': Profile.objects.filter(
+            created_at__gte=now - timedelta(days=7)
+        ).order_by('-created_at')[:100],
+        'admin user ordering': User.objects.order_by('-date_joined')[:100],
+        'admin user date_joined (past 7 days)': User.objects.filter(
+            date_joined__gte=now - timedelta(days=7)
+        ).order_by('-date_joined')[:100],
+        'admin user search icontains': User.objects.filter(
+            Q(username__icontains='user_4242')
+            | Q(email__icontains='user_4242')
+            | Q(first_name__icontains='user_4242')
+            | Q(last_name__icontains='user_4242')
+        )[:100],
+        'username prefix probe': User.objects.filter(
+            username__startswith=f'{SEED_PREFIX}_4242'
+        ).values_list('id', 'username'),
+        'email lookup (any case)': User.objects.with_email(f'{SEED_PREFIX}_4242@Example.com'),
+        'email lookup iexact (unindexed)': User.objects.filter(
+            email__iexact=f'{SEED_PREFIX}_4242@Example.com'
+        ),
+    }
+
+
+def median_time(queryset, runs=5):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        list(queryset.all())
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+class Command(BaseCommand):
+    """Seed users/profiles and print EXPLAIN plans and timings for the hot queries."""
+
+    help = 'Seed a large user table and show query plans for ranking, admin and lookup queries'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('--users', type=int, default=1_000_000, help='Users to seed')
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument(
+            '--current-db',
+            action='store_true',
+            help='Seed the configured database instead of a throwaway test database',
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        old_config = None
+        if not options['current_db']:
+            old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'})
+        try:
+            self.stdout.write(f'Seeding {options["users"]:,} users...')
+            seed(options['users'], options['batch_size'], self.stdout)
+            self._explain()
+        finally:
+            if old_config is not None:
+                teardown_databases(old_config, verbosity=0)
+
+    def _explain(self):
+        for name, queryset in hot_queries().items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f'\n{name}'))
+            self.stdout.write(f'  median {median_time(queryset) * 1000:.2f}ms')
+            for line in queryset.explain().splitlines():
+                self.stdout.write(f'  {line}')
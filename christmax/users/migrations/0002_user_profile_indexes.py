@@ -0,0 +1,101 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:53
+
+from django.db import migrations, models
+
+# PostgreSQL-only indexes, kept out of model state because SQLite can't build them.
+# Admin `icontains` search compiles to UPPER(col::text) LIKE UPPER('%term%'), which only
+# a trigram GIN index on the same expression can serve. Username allocation probes
+# `username LIKE 'base%'`; under a non-C collation that needs varchar_pattern_ops, and
+# INCLUDE (id) lets the probe (which excludes the user's own pk) be an index-only scan.
+#
+# On PostgreSQL every index is built CONCURRENTLY, so users and profiles stay writable
+# while large tables are indexed; that can't run in a transaction, hence atomic = False.
+# A concurrent build that fails leaves an INVALID index behind: drop it and migrate again.
+TRIGRAM_COLUMNS = [
+    ('users_user', 'username'),
+    ('users_user', 'email'),
+    ('users_user', 'first_name'),
+    ('users_user', 'last_name'),
+    ('users_profile', 'display_name'),
+]
+
+
+def _postgres_index_sql():
+    statements = ['CREATE EXTENSION IF NOT EXISTS pg_trgm']
+    for table, column in TRIGRAM_COLUMNS:
+        statements.append(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {table}_{column}_trgm '
+            f'ON {table} USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+    statements.append(
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS users_user_username_prefix '
+        'ON users_user (username varchar_pattern_ops) INCLUDE (id)'
+    )
+    return statements
+
+
+def create_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in _postgres_index_sql():
+        schema_editor.execute(sql)
+
+
+def drop_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in TRIGRAM_COLUMNS:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {table}_{column}_trgm')
+    schema_editor.execute('DROP INDEX CONCURRENTLY IF EXISTS users_user_username_prefix')
+
+
+class AddIndexConcurrently(migrations.AddIndex):
+    """AddIndex that builds CONCURRENTLY on PostgreSQL (needs a non-atomic migration)."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.add_index(model, self.index, concurrently=True)
+        else:
+            schema_editor.add_index(model, self.index)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.remove_index(model, self.index, concurrently=True)
+        else:
+            schema_editor.remove_index(model, self.index)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='profile',
+            index=models.Index(fields=['-experience_points', 'id'], name='profile_xp_rank_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='profile',
+            index=models.Index(fields=['player_level', '-experience_points'], name='profile_level_xp_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='profile',
+            index=models.Index(fields=['-created_at'], name='profile_created_at_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(fields=['-date_joined'], name='user_date_joined_idx'),
+        ),
+        migrations.RunPython(create_postgres_indexes, drop_postgres_indexes),
+    ]
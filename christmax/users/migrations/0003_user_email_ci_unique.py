@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:22
+
+import django.db.models.functions.text
+import users.models
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models import F
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    """Lowercase stored emails; refuse (rather than merge accounts) if two differ only in case."""
+    User = apps.get_model('users', 'User')
+    duplicates = list(
+        User.objects.values(email_lower=Lower('email'))
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    if duplicates:
+        raise RuntimeError(
+            'Users whose emails differ only in case must be merged or renamed first: '
+            + ', '.join(sorted(duplicates))
+        )
+    User.objects.exclude(email=Lower('email')).update(email=Lower(F('email')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_user_profile_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', users.models.UserManager()),
+            ],
+        ),
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='user_email_ci_unique', violation_error_message='A user with that email already exists.'),
+        ),
+    ]
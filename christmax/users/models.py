@@ -1,9 +1,41 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import UserManager as DjangoUserManager
 from django.db import models
+from django.db.models.functions import Lower
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
+from users import hashing
+
+
+class UserQuerySet(models.QuerySet):
+    def with_email(self, email):
+        """Users whose email matches ``email`` in any case, through the ``LOWER(email)`` index."""
+        return self.alias(email_lower=Lower('email')).filter(email_lower=email.lower())
+
+
+class UserManager(DjangoUserManager.from_queryset(UserQuerySet)):
+    """
+    Emails are stored lowercased, as allauth stores and queries its EmailAddress rows.
+
+    Look users up with ``get_by_email()`` (or ``with_email()``), never ``get(email=...)``:
+    it matches rows written before normalization and uses the case-insensitive unique index.
+    """
+
+    @classmethod
+    def normalize_email(cls, email):
+        return super().normalize_email(email).strip().lower()
+
+    def get_by_email(self, email):
+        return self.with_email(email).get()
+
+    async def aget_by_email(self, email):
+        return await self.with_email(email).aget()
+
+    def get_by_natural_key(self, username):
+        return self.get_by_email(username)
+
 
 class User(AbstractUser):
     """
@@ -34,16 +66,33 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']  # Required for createsuperuser (beyond email)
 
+    objects = UserManager()
+
     class Meta:
         verbose_name = _('user')
         verbose_name_plural = _('users')
         db_table = 'users_user'  # Explicit table name
+        indexes = [
+            # UserAdmin default ordering and date_joined filter
+            models.Index(fields=['-date_joined'], name='user_date_joined_idx'),
+            # Trigram (admin icontains search) and username prefix indexes are
+            # PostgreSQL-only; see migration 0002_user_profile_indexes.
+        ]
+        constraints = [
+            # Case-insensitive uniqueness, and the index UserManager.get_by_email() uses
+            models.UniqueConstraint(
+                Lower('email'),
+                name='user_email_ci_unique',
+                violation_error_message=_('A user with that email already exists.'),
+            ),
+        ]
 
     def __str__(self):
         return self.email
 
     def save(self, *args, **kwargs):
-        """Auto-generate username from email if not provided."""
+        """Normalize the email; auto-generate username from email if not provided."""
+        self.email = User.objects.normalize_email(self.email)
         if not self.username:
             # Generate username from email: john.doe@example.com → john_doe
             local_part = self.email.split('@')[0]
@@ -60,6 +109,10 @@ class User(AbstractUser):
 
         super().save(*args, **kwargs)
 
+    async def acheck_password(self, raw_password):
+        """Verify on the bounded hashing pool; see users.hashing."""
+        return await hashing.acheck_password(self, raw_password)
+
 
 class Profile(models.Model):
     """
@@ -88,6 +141,13 @@ class Profile(models.Model):
         verbose_name = _('profile')
         verbose_name_plural = _('profiles')
         db_table = 'users_profile'
+        indexes = [
+            # Leaderboards: ORDER BY experience_points DESC, id (stable tie-break, keyset paging)
+            models.Index(fields=['-experience_points', 'id'], name='profile_xp_rank_idx'),
+            # ProfileAdmin filters and sorting
+            models.Index(fields=['player_level', '-experience_points'], name='profile_level_xp_idx'),
+            models.Index(fields=['-created_at'], name='profile_created_at_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.email}'s profile"
@@ -95,14 +155,17 @@ class Profile(models.Model):
 
 # Signals for auto-creating profiles
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
-    """Automatically create Profile when User is created."""
+def create_user_profile(sender, instance, created, using, **kwargs):
+    """Automatically create Profile when User is created (on the same database)."""
     if created:
-        Profile.objects.create(user=instance)
+        Profile.objects.using(using).create(user=instance)
 
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Save profile when user is saved."""
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
+def save_user_profile(sender, instance, created, using, update_fields, **kwargs):
+    """Save the profile along with a full save of its user, if it was loaded."""
+    # Creation just inserted it; partial saves (last_login, password upgrades) never touch
+    # it; and an unloaded profile has no changes to save, so don't SELECT it just to UPDATE
+    if created or update_fields is not None or not User.profile.is_cached(instance):
+        return
+    instance.profile.save(using=using)
@@ -0,0 +1,200 @@
+"""Tests for the large-table admin: constant query counts, estimated counts, keyset pages."""
+import csv
+
+import pytest
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from base.admin import CURSOR_VAR
+from base.admin import decode_cursor
+from users.admin import ProfileAdmin
+from users.admin import UserAdmin
+from users.models import Profile
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def admin_client(client, db):
+    admin = User.objects.create_superuser(
+        username='bigadmin', email='bigadmin@example.com', password='testpass123'
+    )
+    client.force_login(admin)
+    return client
+
+
+def make_users(count, start=0):
+    for i in range(start, start + count):
+        user = User.objects.create_user(username=f'player{i}', email=f'player{i}@example.com')
+        user.profile.experience_points = i * 10
+        user.profile.player_level = 1 + i % 3
+        user.profile.save()
+
+
+def changelist_queries(client, url):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == 200
+    return ctx.captured_queries
+
+
+@pytest.mark.parametrize(
+    'url_name', ['admin:users_user_changelist', 'admin:users_profile_changelist']
+)
+def test_changelist_query_count_does_not_grow_with_rows(admin_client, url_name):
+    url = reverse(url_name)
+    make_users(3)
+    changelist_queries(admin_client, url)  # warm the cached list filter choices
+    few = len(changelist_queries(admin_client, url))
+
+    make_users(30, start=3)
+    many = len(changelist_queries(admin_client, url))
+
+    assert many == few
+    assert many <= 8
+
+
+def test_changelist_skips_full_count(admin_client):
+    make_users(5)
+    queries = changelist_queries(admin_client, reverse('admin:users_user_changelist'))
+
+    # One COUNT for the paginator; show_full_result_count=False drops the second one
+    assert sum('COUNT(' in q['sql'] for q in queries) == 1
+
+
+def test_large_unfiltered_table_uses_estimate(admin_client, settings):
+    settings.PAGINATOR_ESTIMATE_THRESHOLD = 1
+    make_users(5)
+    queries = changelist_queries(admin_client, reverse('admin:users_user_changelist'))
+    response = admin_client.get(reverse('admin:users_user_changelist'))
+
+    assert not any('COUNT(' in q['sql'] for q in queries)
+    assert 'about' in response.content.decode()
+
+
+def test_filtered_count_is_capped(admin_client, settings):
+    settings.PAGINATOR_COUNT_CAP = 3
+    make_users(10)
+    response = admin_client.get(reverse('admin:users_profile_changelist'), {'player_level': 1})
+
+    assert response.context['cl'].result_count == 3
+    assert response.context['cl'].paginator.count_is_estimate
+
+
+def test_profile_level_filter_choices_are_cached(admin_client):
+    make_users(6)
+    url = reverse('admin:users_profile_changelist')
+    admin_client.get(url)
+    queries = changelist_queries(admin_client, url)
+
+    assert not any('DISTINCT' in q['sql'] for q in queries)
+
+
+@pytest.mark.parametrize(
+    ('admin_class', 'url_name'),
+    [
+        (UserAdmin, 'admin:users_user_changelist'),
+        (ProfileAdmin, 'admin:users_profile_changelist'),
+    ],
+)
+def test_keyset_pages_walk_every_row_once(admin_client, monkeypatch, admin_class, url_name):
+    monkeypatch.setattr(admin_class, 'list_per_page', 4)
+    make_users(10)
+    url = reverse(url_name)
+
+    seen = []
+    response = admin_client.get(url)
+    while True:
+        cl = response.context['cl']
+        seen.extend(obj.pk for obj in cl.result_list)
+        if not cl.next_page_url:
+            break
+        assert CURSOR_VAR in cl.next_page_url
+        response = admin_client.get(url + cl.next_page_url)
+
+    ordering = cl.keyset_ordering(response.wsgi_request)
+    expected = list(cl.model.objects.order_by(*ordering).values_list('pk', flat=True))
+    assert seen == expected
+
+
+def test_keyset_pages_keep_microseconds(admin_client, monkeypatch):
+    monkeypatch.setattr(UserAdmin, 'list_per_page', 2)
+    make_users(6)
+    # Every page boundary falls inside the same millisecond
+    joined = User.objects.get(username='player0').date_joined.replace(microsecond=123000)
+    for i, user in enumerate(User.objects.filter(username__startswith='player')):
+        User.objects.filter(pk=user.pk).update(date_joined=joined.replace(microsecond=123000 + i))
+    url = reverse('admin:users_user_changelist')
+
+    seen = []
+    response = admin_client.get(url)
+    while True:
+        cl = response.context['cl']
+        seen.extend(obj.pk for obj in cl.result_list)
+        if not cl.next_page_url:
+            break
+        response = admin_client.get(url + cl.next_page_url)
+
+    assert sorted(seen) == sorted(User.objects.values_list('pk', flat=True))
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_keyset_page_skips_offset(admin_client, monkeypatch):
+    monkeypatch.setattr(ProfileAdmin, 'list_per_page', 4)
+    make_users(10)
+    url = reverse('admin:users_profile_changelist')
+    next_page = admin_client.get(url).context['cl'].next_page_url
+
+    queries = changelist_queries(admin_client, url + next_page)
+
+    assert not any('OFFSET' in q['sql'] for q in queries)
+
+
+def test_sort_and_filter_links_drop_the_cursor(admin_client, monkeypatch):
+    monkeypatch.setattr(UserAdmin, 'list_per_page', 2)
+    make_users(5)
+    url = reverse('admin:users_user_changelist')
+    next_page = admin_client.get(url).context['cl'].next_page_url
+    cl = admin_client.get(url + next_page).context['cl']
+
+    assert CURSOR_VAR not in cl.get_query_string({'o': '1'})
+
+
+def test_invalid_cursor_is_rejected(admin_client):
+    response = admin_client.get(reverse('admin:users_user_changelist'), {CURSOR_VAR: 'garbage'})
+
+    assert response.status_code == 302
+    assert response.url.endswith('?e=1')
+    with pytest.raises(IncorrectLookupParameters, match='Invalid cursor'):
+        decode_cursor('garbage', User, ['-date_joined', '-pk'])
+
+
+def test_csv_export_streams_the_selected_rows(admin_client):
+    make_users(5)
+    Profile.objects.filter(user__username='player1').update(display_name='=HYPERLINK("x")')
+    response = admin_client.post(
+        reverse('admin:users_profile_changelist'),
+        {'action': 'export_as_csv', 'select_across': '1', 'index': '0', '_selected_action': '0'},
+    )
+
+    assert response.streaming
+    assert response['Content-Disposition'] == 'attachment; filename="profiles.csv"'
+    rows = list(csv.reader(b''.join(response.streaming_content).decode().splitlines()))
+    assert rows[0] == [
+        'id', 'user__username', 'display_name', 'player_level', 'experience_points', 'created_at'
+    ]
+    assert [row[1] for row in rows[1:]] == [
+        'player4', 'player3', 'player2', 'player1', 'bigadmin', 'player0'
+    ]
+    assert rows[4][2] == '\'=HYPERLINK("x")'  # not a live formula in a spreadsheet
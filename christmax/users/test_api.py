@@ -0,0 +1,71 @@
+"""Leaderboard slices of the JSON API (users.api)."""
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+
+from users.models import Profile
+
+User = get_user_model()
+
+
+@pytest.fixture
+def players(db):
+    cache.clear()
+    for i, xp in enumerate([50, 300, 300, 10, 120]):
+        user = User.objects.create_user(username=f'p{i}', email=f'p{i}@example.com')
+        Profile.objects.filter(user=user).update(display_name=f'Player {i}', experience_points=xp)
+
+
+def page(client, **params):
+    response = client.get(reverse('api-v1:leaderboard'), params)
+    return response, json.loads(response.content) if response.status_code == 200 else None
+
+
+def test_keyset_pages_cover_everyone_once(client, players):
+    seen = []
+    response, data = page(client, limit=2)
+    while True:
+        seen += [(player['name'], player['xp']) for player in data['players']]
+        if not data['next']:
+            break
+        response, data = page(client, limit=2, after=data['next'])
+    assert seen == [
+        ('Player 1', 300),
+        ('Player 2', 300),
+        ('Player 4', 120),
+        ('Player 0', 50),
+        ('Player 3', 10),
+    ]
+
+
+def test_unchanged_slice_is_not_modified(client, players, django_assert_num_queries):
+    response, _data = page(client, limit=3)
+    with django_assert_num_queries(0):
+        again = client.get(
+            reverse('api-v1:leaderboard'), {'limit': 3}, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+    assert again.status_code == 304
+
+
+@pytest.mark.parametrize('params', [{'after': 'nope'}, {'limit': 'x'}, {'limit': '0'}])
+def test_bad_parameters(client, players, params):
+    response = client.get(reverse('api-v1:leaderboard'), params)
+    assert response.status_code == 400
+    assert json.loads(response.content)['error'].startswith('invalid_')
+
+
+def test_export_streams_every_player(client, players, django_user_model):
+    assert client.get(reverse('api-v1:leaderboard-export')).status_code == 403
+
+    staff = django_user_model.objects.create_user(
+        username='staff', email='staff@example.com', is_staff=True
+    )
+    client.force_login(staff)
+    response = client.get(reverse('api-v1:leaderboard-export'))
+    assert response.streaming
+    data = json.loads(b''.join(response.streaming_content))
+    assert [player['xp'] for player in data] == [300, 300, 120, 50, 10, 0]
+    assert data[0] == {'name': 'Player 1', 'level': 1, 'xp': 300}
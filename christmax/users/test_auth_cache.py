@@ -0,0 +1,94 @@
+"""Cached request-user loading (users.auth_cache, users.backends)."""
+from io import StringIO
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from users import auth_cache
+from users.auth_cache import aload_user
+from users.auth_cache import load_user
+from users.backends import AuthenticationBackend
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def shared_locmem(monkeypatch):
+    """Let the test profile's locmem cache stand in for a shared one."""
+    monkeypatch.setattr(auth_cache, 'PROCESS_LOCAL_BACKENDS', ())
+
+
+@pytest.fixture
+def user(db):
+    cache.clear()
+    return User.objects.create_user(username='kid', email='kid@example.com', password='pw-12345')
+
+
+def test_user_and_profile_load_once(user, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert load_user(user.pk).profile.user_id == user.pk
+    with django_assert_num_queries(0):
+        assert load_user(user.pk).profile.user_id == user.pk
+
+
+def test_warm_authenticated_page_runs_no_auth_queries(user, client):
+    client.force_login(user, backend='users.backends.AuthenticationBackend')
+    client.get('/')
+    with CaptureQueriesContext(connection) as ctx:
+        assert client.get('/').status_code == 200
+    assert not [q for q in ctx.captured_queries if 'users_' in q['sql']]
+
+
+def test_saving_user_or_profile_forgets_entry(user):
+    load_user(user.pk)
+    user.first_name = 'Kit'
+    user.save()
+    assert load_user(user.pk).first_name == 'Kit'
+
+    user.profile.display_name = 'kitty'
+    user.profile.save()
+    assert load_user(user.pk).profile.display_name == 'kitty'
+
+    user.delete()
+    assert load_user(user.pk) is None
+
+
+def test_bulk_deactivation_invalidates_cached_users(user, tmp_path):
+    backend = AuthenticationBackend()
+    assert backend.get_user(user.pk) == user
+
+    path = tmp_path / 'cohort.csv'
+    path.write_text('email\nkid@example.com\n', encoding='utf-8')
+    call_command('bulk_deactivate_users', str(path), stdout=StringIO())
+
+    assert backend.get_user(user.pk) is None
+
+
+def test_evicted_epoch_does_not_revive_old_entries(user):
+    load_user(user.pk)
+    User.objects.filter(pk=user.pk).update(first_name='Raw')
+    cache.delete('users:auth-epoch')
+    assert load_user(user.pk).first_name == 'Raw'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_load(user):
+    loaded = async_to_sync(aload_user)(user.pk)
+    assert loaded.profile.user_id == user.pk
+    assert async_to_sync(AuthenticationBackend().aget_user)(user.pk) == loaded
+
+
+def test_process_local_cache_is_refused(user, monkeypatch, django_assert_num_queries):
+    # Another process (e.g. bulk_deactivate_users) could never invalidate its entries
+    monkeypatch.setattr(auth_cache, 'PROCESS_LOCAL_BACKENDS', (LocMemCache,))
+    with django_assert_num_queries(1):
+        assert load_user(user.pk).profile.user_id == user.pk
+    with django_assert_num_queries(1):
+        assert load_user(user.pk).profile.user_id == user.pk
+    assert cache.get(f'users:auth:{user.pk}') is None
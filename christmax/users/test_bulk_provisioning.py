@@ -0,0 +1,122 @@
+"""Tests for the bulk provisioning/deactivation commands and the username allocator."""
+from io import StringIO
+
+import pytest
+from allauth.account.models import EmailAddress
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from users.models import Profile
+from users.usernames import UsernameAllocator
+from users.usernames import username_base
+
+User = get_user_model()
+
+
+def write_csv(tmp_path, lines, name='cohort.csv'):
+    path = tmp_path / name
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def test_username_base_matches_signup_rule():
+    assert username_base('john.doe+class@example.com') == 'john_doe_class'
+
+
+@pytest.mark.django_db
+def test_allocator_avoids_existing_and_batch_duplicates():
+    User.objects.create_user(username='amy', email='amy@example.com')
+    User.objects.create_user(username='amy_1', email='amy1@example.com')
+    allocator = UsernameAllocator()
+    allocator.prefetch(['amy', 'bob'])
+
+    assert [allocator.allocate(b) for b in ['amy', 'amy', 'bob']] == ['amy_2', 'amy_3', 'bob']
+
+
+@pytest.mark.django_db
+def test_provision_default_chunk_size_on_sqlite(tmp_path):
+    # One chunk of 1000 new bases; a single OR of 1000 prefix terms overflows SQLite
+    rows = [f'pupil{i}@example.com' for i in range(1000)]
+    path = write_csv(tmp_path, ['email', *rows])
+    call_command('bulk_provision_users', path, workers=0, stdout=StringIO())
+
+    assert User.objects.filter(username__startswith='pupil').count() == 1000
+
+
+@pytest.mark.django_db
+def test_provision_creates_users_profiles_and_email_addresses(tmp_path):
+    User.objects.create_user(username='taken', email='taken@example.com')
+    path = write_csv(
+        tmp_path,
+        [
+            'email,first_name,last_name,display_name,password',
+            'alice@example.com,Alice,Liddell,alice,s3cret-pass',
+            'taken@Example.com,,,,',
+            'taken@example.com,Dup,,,',
+            'bob.smith@example.com,Bob,,,',
+            'alice@example.com,Again,,,',
+        ],
+    )
+    out = StringIO()
+    call_command('bulk_provision_users', path, workers=0, verified=True, stdout=out)
+
+    alice = User.objects.get(email='alice@example.com')
+    bob = User.objects.get(email='bob.smith@example.com')
+    assert alice.check_password('s3cret-pass')
+    assert not bob.has_usable_password()
+    assert bob.username == 'bob_smith'
+    assert alice.profile.display_name == 'alice'
+    assert Profile.objects.filter(user=bob).exists()
+    assert EmailAddress.objects.filter(user=alice, primary=True, verified=True).exists()
+    assert User.objects.filter(email__iexact='taken@example.com').count() == 1
+    assert 'Created 2 users, skipped 3' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_provision_query_count_does_not_grow_with_rows(tmp_path):
+    def run(count, start):
+        rows = [f'student{i}@example.com' for i in range(start, start + count)]
+        path = write_csv(tmp_path, ['email', *rows], name=f'c{start}.csv')
+        with CaptureQueriesContext(connection) as ctx:
+            call_command('bulk_provision_users', path, workers=0, stdout=StringIO())
+        return len(ctx.captured_queries)
+
+    # A few queries per chunk (more only where SQLite's parameter limit splits an INSERT)
+    assert run(5, 0) <= 8
+    assert run(200, 100) <= 12
+    assert User.objects.count() == 205
+
+
+@pytest.mark.django_db(transaction=True)
+def test_provision_hashes_in_worker_processes(tmp_path):
+    path = write_csv(tmp_path, ['email,password', 'pool@example.com,pool-pass-123'])
+    call_command('bulk_provision_users', path, workers=2, stdout=StringIO())
+
+    assert User.objects.get(email='pool@example.com').check_password('pool-pass-123')
+
+
+def test_provision_requires_email_column(tmp_path):
+    path = write_csv(tmp_path, ['name', 'alice'])
+    with pytest.raises(CommandError, match='email'):
+        call_command('bulk_provision_users', path, workers=0)
+
+
+@pytest.mark.django_db
+def test_deactivate_uses_one_update_per_chunk(tmp_path):
+    for i in range(6):
+        User.objects.create_user(username=f'kid{i}', email=f'kid{i}@example.com')
+    path = write_csv(tmp_path, ['email', *[f'kid{i}@example.com' for i in range(4)]])
+
+    with CaptureQueriesContext(connection) as ctx:
+        call_command('bulk_deactivate_users', path, chunk_size=2, stdout=StringIO())
+
+    assert [q['sql'].split()[0] for q in ctx.captured_queries] == ['UPDATE', 'UPDATE']
+    assert User.objects.filter(is_active=False).count() == 4
+
+    out = StringIO()
+    call_command('bulk_deactivate_users', path, reactivate=True, dry_run=True, stdout=out)
+    assert 'Would reactivate 4 users' in out.getvalue()
+    assert User.objects.filter(is_active=False).count() == 4
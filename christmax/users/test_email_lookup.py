@@ -0,0 +1,56 @@
+"""Email normalization and case-insensitive lookups (UserManager.get_by_email)."""
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+from django.urls import reverse
+
+from users.backends import AdminUsernameBackend
+
+User = get_user_model()
+
+
+@pytest.fixture
+def amy(db):
+    return User.objects.create_user(username='amy', email=' Amy@Example.COM ', password='pw-12345')
+
+
+def test_email_is_lowercased_on_write(amy):
+    assert amy.email == 'amy@example.com'
+    amy.email = 'AMY@example.com'
+    amy.save()
+    assert User.objects.values_list('email', flat=True).get() == 'amy@example.com'
+
+
+def test_get_by_email_ignores_case(amy):
+    assert User.objects.get_by_email('AMY@EXAMPLE.com') == amy
+    # A row written around save() (raw update, bulk tools) is still found
+    User.objects.filter(pk=amy.pk).update(email='Amy@Example.com')
+    assert User.objects.get_by_email('amy@example.com') == amy
+    with pytest.raises(User.DoesNotExist):
+        User.objects.get_by_email('bob@example.com')
+
+
+def test_email_lookup_uses_lower_index(amy):
+    assert 'user_email_ci_unique' in User.objects.with_email('Amy@Example.com').explain()
+
+
+def test_case_duplicates_are_rejected(amy):
+    with pytest.raises(ValidationError, match='already exists'):
+        User(username='amy2', email='AMY@example.com').validate_constraints()
+    with pytest.raises(IntegrityError):
+        User.objects.bulk_create([User(username='amy3', email='AMY@example.com')])
+
+
+def test_login_with_mixed_case_email(client, amy):
+    client.post(reverse('account_login'), {'login': 'AMY@example.com', 'password': 'pw-12345'})
+    assert client.session.get('_auth_user_id') == str(amy.pk)
+
+
+def test_admin_backend_finds_staff_by_email_in_any_case(rf, amy):
+    User.objects.filter(pk=amy.pk).update(is_staff=True)
+    request = rf.post(reverse('admin:login'))
+    user = AdminUsernameBackend().authenticate(
+        request, username='Amy@Example.com', password='pw-12345'
+    )
+    assert user == amy
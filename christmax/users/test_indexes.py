@@ -0,0 +1,41 @@
+"""Tests for the ranking/admin indexes and the query-plan benchmark command."""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from users.models import Profile
+
+
+@pytest.mark.django_db
+def test_ranking_and_admin_indexes_exist():
+    with connection.cursor() as cursor:
+        profile_indexes = connection.introspection.get_constraints(cursor, 'users_profile')
+        user_indexes = connection.introspection.get_constraints(cursor, 'users_user')
+
+    assert profile_indexes['profile_xp_rank_idx']['columns'] == ['experience_points', 'id']
+    assert profile_indexes['profile_level_xp_idx']['columns'] == [
+        'player_level',
+        'experience_points',
+    ]
+    assert 'profile_created_at_idx' in profile_indexes
+    assert 'user_date_joined_idx' in user_indexes
+
+
+@pytest.mark.django_db
+def test_leaderboard_query_uses_rank_index():
+    plan = Profile.objects.order_by('-experience_points', 'id')[:50].explain()
+    assert 'profile_xp_rank_idx' in plan
+
+
+@pytest.mark.django_db
+def test_explain_user_queries_seeds_and_reports():
+    out = StringIO()
+    call_command('explain_user_queries', users=30, batch_size=10, current_db=True, stdout=out)
+
+    assert Profile.objects.count() == 30
+    report = out.getvalue()
+    assert 'leaderboard top 50' in report
+    assert 'username prefix probe' in report
+    assert 'email lookup (any case)' in report
@@ -0,0 +1,53 @@
+"""Leaderboard page and its htmx slices (users.views.LeaderboardView)."""
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+
+from users import views
+from users.models import Profile
+
+User = get_user_model()
+HTMX = {'HX-Request': 'true'}
+
+
+@pytest.fixture
+def players(db, monkeypatch):
+    cache.clear()
+    monkeypatch.setattr(views, 'LEADERBOARD_PAGE_SIZE', 2)
+    for i, xp in enumerate([50, 300, 120]):
+        user = User.objects.create_user(username=f'p{i}', email=f'p{i}@example.com')
+        Profile.objects.filter(user=user).update(display_name=f'Player {i}', experience_points=xp)
+
+
+def test_page_shows_the_first_slice(client, players):
+    response = client.get(reverse('leaderboard'))
+    content = response.content.decode()
+    assert '<nav' in content
+    assert content.index('Player 1') < content.index('Player 2')
+    assert 'Player 0' not in content
+    assert f'hx-get="{reverse("leaderboard")}?after=120.' in content
+    assert 'HX-Request' in response['Vary']
+
+
+def test_show_more_returns_only_the_next_rows(client, players):
+    profile = Profile.objects.get(display_name='Player 2')
+    url = f'{reverse("leaderboard")}?after=120.{profile.pk}'
+    response = client.get(url, headers=HTMX)
+    content = response.content.decode()
+    assert content.lstrip().startswith('<tr>')
+    assert 'Player 0' in content and 'Player 1' not in content
+    assert 'leaderboard-more' not in content  # the last slice
+    assert 'HX-Request' in response['Vary']
+    # Without htmx the same URL is a full page starting at that slice
+    assert '<nav' in client.get(url).content.decode()
+
+
+def test_slices_are_rendered_once_per_ttl(client, players, django_assert_num_queries):
+    client.get(reverse('leaderboard'), headers=HTMX)
+    with django_assert_num_queries(0):
+        client.get(reverse('leaderboard'), headers=HTMX)
+
+
+def test_bad_cursor(client, players):
+    assert client.get(reverse('leaderboard'), {'after': 'nope'}).status_code == 400
@@ -0,0 +1,102 @@
+"""Tests for the bounded password hashing pool, hash upgrades and the async auth path."""
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.contrib.auth.hashers import identify_hasher
+from django.test import RequestFactory
+
+from base.instrumentation import registry
+from users import hashing
+from users.backends import AdminUsernameBackend
+
+User = get_user_model()
+
+
+class LowCostPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    iterations = 1000
+
+
+@pytest.fixture
+def player(db):
+    return User.objects.create_user(
+        username='hasher', email='hasher@example.com', password='pass-1234', is_staff=True
+    )
+
+
+def test_only_async_checks_run_on_pool(player, monkeypatch):
+    seen = []
+    original = hashing.verify_password
+
+    def spy(*args):
+        seen.append(threading.current_thread().name)
+        return original(*args)
+
+    monkeypatch.setattr(hashing, 'verify_password', spy)
+    assert async_to_sync(player.acheck_password)('pass-1234')
+    assert not async_to_sync(player.acheck_password)('wrong')
+    assert len(seen) == 2
+    assert all(name.startswith('password-hashing') for name in seen)
+
+    # Sync checks stay on the calling thread, which would otherwise just block on the pool
+    monkeypatch.setattr(hashing, 'submit', None)
+    assert player.check_password('pass-1234')
+
+
+def test_login_upgrades_outdated_hash(player, settings):
+    settings.PASSWORD_HASHERS = [
+        'users.test_password_hashing.LowCostPBKDF2PasswordHasher',
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+    assert identify_hasher(player.password).algorithm == 'md5'
+
+    assert player.check_password('pass-1234')
+
+    player.refresh_from_db()
+    assert identify_hasher(player.password).algorithm == 'pbkdf2_sha256'
+    assert player.check_password('pass-1234')
+
+
+def test_async_check_password_upgrades_hash(player, settings):
+    settings.PASSWORD_HASHERS = [
+        'users.test_password_hashing.LowCostPBKDF2PasswordHasher',
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
+    assert async_to_sync(player.acheck_password)('pass-1234')
+    assert not async_to_sync(player.acheck_password)('wrong')
+
+    player.refresh_from_db()
+    assert identify_hasher(player.password).algorithm == 'pbkdf2_sha256'
+
+
+def test_full_queue_rejects_with_back_pressure(settings):
+    settings.PASSWORD_HASHING_WORKERS = 1
+    settings.PASSWORD_HASHING_QUEUE = 1
+    release = threading.Event()
+    before = registry.get_counter('django_password_hashing_rejected_total')
+
+    running = hashing.submit(release.wait)
+    queued = hashing.submit(release.wait)
+    with pytest.raises(hashing.PasswordHashingBusy):
+        hashing.submit(release.wait)
+    release.set()
+    running.result()
+    queued.result()
+
+    assert registry.get_counter('django_password_hashing_rejected_total') == before + 1
+    hashing.submit(int).result()  # slots are released once work finishes
+
+
+def test_async_admin_backend_matches_sync_rules(player):
+    backend = AdminUsernameBackend()
+    admin_request = RequestFactory().post('/admin/login/')
+    site_request = RequestFactory().post('/accounts/login/')
+    authenticate = async_to_sync(backend.aauthenticate)
+
+    assert authenticate(admin_request, username='hasher', password='pass-1234') == player
+    assert authenticate(admin_request, username='hasher@example.com', password='pass-1234')
+    assert authenticate(admin_request, username='hasher', password='wrong') is None
+    assert authenticate(site_request, username='hasher', password='pass-1234') is None
@@ -237,3 +237,72 @@ class TestAccountLinkingByEmail:
         records in EmailAddress can be verified
         """
         pass
+
+
+# =============================================================================
+# Feature 3: Callback Query Counts
+# =============================================================================
+
+
+def complete_google_callback(email):
+    """Run the OAuth callback after the token exchange, as allauth's view would."""
+    from unittest import mock
+
+    from allauth.socialaccount.adapter import get_adapter
+    from allauth.socialaccount.helpers import complete_social_login
+    from django.contrib.auth.models import AnonymousUser
+    from django.contrib.messages.middleware import MessageMiddleware
+    from django.contrib.sessions.middleware import SessionMiddleware
+
+    request = RequestFactory().get('/accounts/google/login/callback/')
+    SessionMiddleware(lambda r: None).process_request(request)
+    MessageMiddleware(lambda r: None).process_request(request)
+    request.user = AnonymousUser()
+    provider = get_adapter().get_provider(request, 'google')
+    response = {'sub': email, 'email': email, 'email_verified': True, 'given_name': 'G'}
+    with mock.patch('allauth.account.adapter.DefaultAccountAdapter.send_mail'):
+        sociallogin = provider.sociallogin_from_response(request, response)
+        complete_social_login(request, sociallogin)
+    return request
+
+
+@pytest.mark.django_db
+class TestCallbackQueryCounts:
+    """
+    Pin the query count of each callback path. Includes two SAVEPOINT statements around
+    the (locked) link lookup, which only appear inside the test transaction.
+    """
+
+    def test_first_login_signup(self, google_social_app, django_assert_num_queries):
+        with django_assert_num_queries(19):
+            request = complete_google_callback('first@example.com')
+
+        assert request.user.email == 'first@example.com'
+        assert request.user.username == 'first'
+
+    def test_repeat_login(self, google_social_app, django_assert_num_queries):
+        complete_google_callback('again@example.com')
+
+        with django_assert_num_queries(7):
+            request = complete_google_callback('again@example.com')
+
+        assert request.user.email == 'again@example.com'
+
+    def test_first_login_links_existing_user(self, google_social_app, django_assert_num_queries):
+        existing = User.objects.create_user(
+            username='linked', email='linked@example.com', password='testpass123'
+        )
+
+        with django_assert_num_queries(11):
+            request = complete_google_callback('linked@example.com')
+
+        assert request.user == existing
+        assert SocialAccount.objects.get().user == existing
+
+    def test_username_collision_takes_next_free_suffix(self, google_social_app):
+        for username in ('dup', 'dup_1', 'dupx'):
+            User.objects.create_user(username=username, email=f'{username}@other.com')
+
+        request = complete_google_callback('dup@example.com')
+
+        assert request.user.username == 'dup_2'
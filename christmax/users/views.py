@@ -1,7 +1,20 @@
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.http import HttpResponse
+from django.http import HttpResponseBadRequest
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.translation import get_language
 from django.views.generic import TemplateView
 from django.utils.decorators import method_decorator
 
+from base.caching import get_or_compute
+from base.htmx import is_htmx
+from base.htmx import vary_on_htmx
+from users import leaderboard
+
+LEADERBOARD_PAGE_SIZE = 25
+
 
 @method_decorator(login_required, name='dispatch')
 class SettingsView(TemplateView):
@@ -22,3 +35,41 @@ class SettingsView(TemplateView):
         context['social_accounts'] = user.socialaccount_set.all()
         
         return context
+
+
+def leaderboard_rows(after):
+    """One slice of leaderboard table rows, rendered once per ``LEADERBOARD_CACHE_TTL``."""
+
+    def render():
+        players, next_cursor = leaderboard.players(after, LEADERBOARD_PAGE_SIZE)
+        context = {
+            'players': players,
+            'next': next_cursor,
+            'first': after is None,
+            'path': reverse('leaderboard'),
+        }
+        return render_to_string('users/partials/leaderboard_rows.html', context)
+
+    return get_or_compute(
+        f'leaderboard:html:{get_language()}:{leaderboard.format_cursor(after)}',
+        render,
+        getattr(settings, 'LEADERBOARD_CACHE_TTL', 10),
+        name='leaderboard',
+    )
+
+
+class LeaderboardView(TemplateView):
+    """Players by experience points; htmx's "Show more" gets only the next slice of rows."""
+    template_name = 'users/leaderboard.html'
+
+    def get(self, request):
+        after = None
+        if request.GET.get('after'):
+            try:
+                after = leaderboard.parse_cursor(request.GET['after'])
+            except ValueError:
+                return HttpResponseBadRequest()
+        rows = leaderboard_rows(after)
+        if is_htmx(request):
+            return vary_on_htmx(HttpResponse(rows))
+        return vary_on_htmx(self.render_to_response({'rows': rows}))
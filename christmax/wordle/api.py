@@ -0,0 +1,74 @@
+"""
+JSON endpoints for the daily puzzles, mounted under /api/v1/ (see christmax/api_v1.py).
+
+GET returns today's game for the session and POST adds a guess. Both answer with the same
+object:
+
+    {"day": "2026-10-19", "length": 5, "max_guesses": 6,
+     "rows": [[["r", 1], ["e", 1], ["a", 2], ["c", 1], ["t", 0]]],
+     "solved": false, "finished": false, "results": null}
+
+Each row holds one ``[character, mark]`` pair per character (0 miss, 1 present, 2 hit).
+Idiom rows add the pinyin, syllable mark and tone mark. ``results`` is everyone's guess
+distribution once the game is over. A GET's ETag is the game's day and a digest of its
+guesses (plus the results total once it is over), so polling an unchanged game costs a
+304 without scoring the board.
+"""
+
+import hashlib
+
+from django.middleware.csrf import get_token
+from django.utils.translation import gettext as _
+
+from base.api import ApiError
+from base.api import ApiResponse
+from base.api import ApiView
+from base.api import conditional
+from wordle import words
+from wordle.views import WORDS
+from wordle.views import current_game
+from wordle.views import is_finished
+from wordle.views import results_counter
+from wordle.views import submit_guess
+
+
+def game_data(mode, game):
+    answer = mode.daily_answer()
+    finished = is_finished(game, answer)
+    return {
+        'day': game['day'],
+        'length': mode.length,
+        'max_guesses': words.MAX_GUESSES,
+        'rows': [mode.feedback(guess, answer) for guess in game['guesses']],
+        'solved': answer in game['guesses'],
+        'finished': finished,
+        'results': results_counter(mode, game['day']).counts() if finished else None,
+    }
+
+
+class PuzzleApi(ApiView):
+    mode = WORDS
+
+    def get(self, request):
+        get_token(request)  # the csrftoken cookie that guess POSTs send back as X-CSRFToken
+        game = current_game(request, self.mode)
+        guesses = hashlib.md5(
+            ' '.join(game['guesses']).encode(), usedforsecurity=False
+        ).hexdigest()
+        etag = f'{self.mode.session_key}:{game["day"]}:{guesses}'
+        if is_finished(game, self.mode.daily_answer()):
+            etag += f':{sum(results_counter(self.mode, game["day"]).counts().values())}'
+        return conditional(
+            request, etag, lambda: ApiResponse(game_data(self.mode, game)), private=True
+        )
+
+
+class GuessApi(ApiView):
+    mode = WORDS
+
+    def post(self, request):
+        game = submit_guess(request, self.mode, str(self.data().get('guess', '')))
+        if game is None:
+            raise ApiError('not_in_word_list', _('Not in word list'), status=422)
+        return ApiResponse(game_data(self.mode, game))
+
@@ -0,0 +1,86 @@
+"""
+Bloom filter of the accepted guesses, checked in the browser before a guess is sent.
+
+The file is little-endian: magic ``WBLM``, format version (u8), hash count k (u8), two
+reserved bytes, bit count m (u32), word count n (u32), then ``ceil(m / 8)`` bytes of bits.
+Bit i is ``byte[i // 8] >> (i % 8) & 1``.
+
+Bit positions use double hashing, ``(h1 + i * h2) mod 2**32 mod m``, over two 32-bit FNV-1a
+hashes of the ASCII word. Each goes through murmur3's finalizer first, because FNV's low
+bits barely change between short words. wordle/static/wordle/guess-validator.js
+reimplements this, so change both together and bump ``VERSION``.
+"""
+
+import math
+import struct
+
+MAGIC = b'WBLM'
+VERSION = 1
+HEADER = struct.Struct('<4sBBHII')
+FNV_PRIME = 0x01000193
+SEEDS = (0x811C9DC5, 0x9747B28C)
+
+
+def _fmix32(value):
+    value ^= value >> 16
+    value = (value * 0x85EBCA6B) & 0xFFFFFFFF
+    value ^= value >> 13
+    value = (value * 0xC2B2AE35) & 0xFFFFFFFF
+    return value ^ value >> 16
+
+
+def _hash(word, seed):
+    """FNV-1a, then the murmur3 finalizer."""
+    value = seed
+    for byte in word.encode('ascii'):
+        value = ((value ^ byte) * FNV_PRIME) & 0xFFFFFFFF
+    return _fmix32(value)
+
+
+def positions(word, hashes, bits):
+    first, second = (_hash(word, seed) for seed in SEEDS)
+    return [((first + i * second) & 0xFFFFFFFF) % bits for i in range(hashes)]
+
+
+def optimal_size(count, error_rate):
+    """``(bits, hashes)`` for ``count`` words at ``error_rate`` false positives."""
+    bits = math.ceil(-max(count, 1) * math.log(error_rate) / math.log(2) ** 2)
+    bits = (bits + 7) // 8 * 8
+    return bits, max(1, round(bits / max(count, 1) * math.log(2)))
+
+
+class BloomFilter:
+    def __init__(self, bits, hashes, count=0, data=None):
+        self.bits = bits
+        self.hashes = hashes
+        self.count = count
+        self.data = bytearray(data if data is not None else (bits + 7) // 8)
+
+    @classmethod
+    def build(cls, words, error_rate=0.001):
+        words = set(words)
+        bloom = cls(*optimal_size(len(words), error_rate))
+        for word in words:
+            bloom.add(word)
+        return bloom
+
+    def add(self, word):
+        for position in positions(word, self.hashes, self.bits):
+            self.data[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, word):
+        return all(
+            self.data[position >> 3] >> (position & 7) & 1
+            for position in positions(word, self.hashes, self.bits)
+        )
+
+    def to_bytes(self):
+        return HEADER.pack(MAGIC, VERSION, self.hashes, 0, self.bits, self.count) + self.data
+
+    @classmethod
+    def from_bytes(cls, payload):
+        magic, version, hashes, _reserved, bits, count = HEADER.unpack_from(payload)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'Not a version {VERSION} word-list Bloom filter')
+        return cls(bits, hashes, count, payload[HEADER.size : HEADER.size + (bits + 7) // 8])
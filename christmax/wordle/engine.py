@@ -0,0 +1,64 @@
+"""
+Wordle scoring.
+
+Latin words are also reduced to a 26-bit letter mask (bit 0 is ``a``). A guess that shares
+no letter with the answer is scored with one AND, and a guessed letter the answer doesn't
+contain is ruled out with a bit test instead of a count lookup. Alphabets too large for a
+mask (see wordle/idioms.py) use ``score_sequence()`` over short tuples of integer IDs.
+"""
+
+MISS, PRESENT, HIT = 0, 1, 2
+
+
+def letter_mask(word):
+    mask = 0
+    for letter in word:
+        mask |= 1 << (ord(letter) - 97)
+    return mask
+
+
+def score(guess, answer):
+    """Feedback for each letter of ``guess``, as a tuple of HIT, PRESENT and MISS."""
+    answer_mask = letter_mask(answer)
+    if not letter_mask(guess) & answer_mask:
+        return (MISS,) * len(guess)
+    result = [MISS] * len(guess)
+    # Answer letters not matched in place; each can mark one guessed letter PRESENT
+    unmatched = {}
+    for i, (guessed, wanted) in enumerate(zip(guess, answer, strict=True)):
+        if guessed == wanted:
+            result[i] = HIT
+        else:
+            unmatched[wanted] = unmatched.get(wanted, 0) + 1
+    for i, guessed in enumerate(guess):
+        if result[i] == HIT or not answer_mask >> (ord(guessed) - 97) & 1:
+            continue
+        if unmatched.get(guessed):
+            result[i] = PRESENT
+            unmatched[guessed] -= 1
+    return tuple(result)
+
+
+def score_sequence(guess, answer):
+    """``score()`` for any two equal-length sequences, e.g. tuples of character IDs."""
+    result = [MISS] * len(guess)
+    unmatched = []
+    for i, (guessed, wanted) in enumerate(zip(guess, answer, strict=True)):
+        if guessed == wanted:
+            result[i] = HIT
+        else:
+            unmatched.append(wanted)
+    if unmatched:
+        for i, guessed in enumerate(guess):
+            if result[i] == MISS and guessed in unmatched:
+                result[i] = PRESENT
+                unmatched.remove(guessed)
+    return tuple(result)
+
+
+def pattern(feedback):
+    """``feedback`` as one base-3 integer (0 to 242 for five letters)."""
+    value = 0
+    for mark in feedback:
+        value = value * 3 + mark
+    return value
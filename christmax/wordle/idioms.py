@@ -0,0 +1,165 @@
+"""
+Four-character idiom (成語) puzzles: the dictionary and its scoring.
+
+A 26-bit letter mask can't cover thousands of CJK characters. The dictionary therefore
+maps every character it uses to a dense integer ID, and stores the idioms in a few flat
+objects instead of one object per idiom. Position i of each belongs to the i-th idiom:
+
+- ``text``: every idiom concatenated, four characters each (one ``str``)
+- ``codes``: four character IDs per idiom (``array('H')``), which is what scoring compares
+- ``syllables`` and ``tones``: toneless pinyin-syllable IDs and tones (1-4, 5 for the
+  neutral tone), four per idiom. They are stored per idiom position rather than per
+  character, because characters like 長 and 為 change reading.
+- ``slots``: an open-addressing hash table of positions (``array('i')``), keyed by the
+  idiom's string hash. Validation costs one hash, usually one probe and one 4-character
+  compare against ``text``.
+
+Characters are scored with ``engine.score_sequence`` over the ID tuples. Optional sound
+feedback scores the syllables the same way, and marks each tone as a positional hit or
+miss. The source is ``data/idioms.tsv``: the idiom, a tab, then numbered pinyin with
+citation tones, using ``v`` for ü.
+"""
+
+import random
+from array import array
+from functools import cache
+from pathlib import Path
+
+from django.utils import timezone
+
+from wordle.engine import HIT
+from wordle.engine import MISS
+from wordle.engine import score_sequence
+from wordle.words import FIRST_DAY
+
+IDIOMS_FILE = Path(__file__).resolve().parent / 'data' / 'idioms.tsv'
+IDIOM_LENGTH = 4
+TONE_MARKS = {'a': 'āáǎà', 'e': 'ēéěè', 'i': 'īíǐì', 'o': 'ōóǒò', 'u': 'ūúǔù', 'ü': 'ǖǘǚǜ'}
+
+
+def mark_tone(syllable, tone):
+    """Numbered pinyin to tone-marked: ``('lv', 4)`` -> ``'lǜ'``."""
+    syllable = syllable.replace('v', 'ü')
+    if not 1 <= tone <= 4:
+        return syllable
+    vowels = [letter for letter in syllable if letter in TONE_MARKS]
+    if not vowels:
+        return syllable
+    # The mark goes on a or e, on the o of "ou", else on the last vowel
+    vowel = next((v for v in 'ae' if v in syllable), 'o' if 'ou' in syllable else vowels[-1])
+    return syllable.replace(vowel, TONE_MARKS[vowel][tone - 1], 1)
+
+
+class IdiomDictionary:
+    def __init__(self, entries):
+        """``entries``: ``(idiom, ['yi1', 'fan1', 'feng1', 'shun4'])`` pairs."""
+        entries = sorted(dict(entries).items())
+        self.text = ''.join(idiom for idiom, _pinyin in entries)
+        self.chars = ''.join(sorted(set(self.text)))
+        self.char_ids = {char: i for i, char in enumerate(self.chars)}
+        self.syllable_names = tuple(sorted({s[:-1] for _idiom, pinyin in entries for s in pinyin}))
+        syllable_ids = {syllable: i for i, syllable in enumerate(self.syllable_names)}
+        pinyin = [syllable for _idiom, syllables in entries for syllable in syllables]
+
+        self.codes = array('H', map(self.char_ids.__getitem__, self.text))
+        self.syllables = array('H', (syllable_ids[syllable[:-1]] for syllable in pinyin))
+        self.tones = array('B', (int(syllable[-1]) for syllable in pinyin))
+        # At most half full, so probes stay short
+        self.mask = (1 << (2 * len(entries)).bit_length()) - 1
+        self.slots = array('i', [-1]) * (self.mask + 1)
+        for i, (idiom, _pinyin) in enumerate(entries):
+            slot = hash(idiom) & self.mask
+            while self.slots[slot] >= 0:
+                slot = (slot + 1) & self.mask
+            self.slots[slot] = i
+
+    @classmethod
+    def load(cls, path=IDIOMS_FILE):
+        entries = []
+        for line in Path(path).read_text(encoding='utf-8').splitlines():
+            if line.strip():
+                idiom, pinyin = line.split('\t')
+                entries.append((idiom.strip(), pinyin.split()))
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.text) // IDIOM_LENGTH
+
+    def index(self, idiom):
+        """Position of ``idiom`` in the arrays, or -1 if it isn't in the dictionary."""
+        slots, text, mask = self.slots, self.text, self.mask
+        slot = hash(idiom) & mask
+        while (i := slots[slot]) >= 0:
+            if text[i * IDIOM_LENGTH : (i + 1) * IDIOM_LENGTH] == idiom:
+                return i
+            slot = (slot + 1) & mask
+        return -1
+
+    def __contains__(self, idiom):
+        return self.index(idiom) >= 0
+
+    def idiom(self, i):
+        return self.text[i * IDIOM_LENGTH : (i + 1) * IDIOM_LENGTH]
+
+    def pinyin(self, i):
+        start, stop = i * IDIOM_LENGTH, (i + 1) * IDIOM_LENGTH
+        return [
+            mark_tone(self.syllable_names[syllable], tone)
+            for syllable, tone in zip(
+                self.syllables[start:stop], self.tones[start:stop], strict=True
+            )
+        ]
+
+    def score(self, guess, answer):
+        """Character feedback for two dictionary positions, as a tuple of marks."""
+        g, a = guess * IDIOM_LENGTH, answer * IDIOM_LENGTH
+        return score_sequence(self.codes[g : g + IDIOM_LENGTH], self.codes[a : a + IDIOM_LENGTH])
+
+    def sound_score(self, guess, answer):
+        """``(syllable marks, tone marks)``; tones are only HIT or MISS, by position."""
+        g, a = guess * IDIOM_LENGTH, answer * IDIOM_LENGTH
+        syllables = score_sequence(
+            self.syllables[g : g + IDIOM_LENGTH], self.syllables[a : a + IDIOM_LENGTH]
+        )
+        tones = tuple(
+            HIT if self.tones[g + i] == self.tones[a + i] else MISS for i in range(IDIOM_LENGTH)
+        )
+        return syllables, tones
+
+    def feedback(self, guess, answer, sounds=True):
+        """
+        One row of the board: ``(char, mark, pinyin, syllable mark, tone mark)`` per
+        character, with the sound fields None unless ``sounds``.
+        """
+        g, a = self.index(guess), self.index(answer)
+        marks = self.score(g, a)
+        if not sounds:
+            return [(char, mark, None, None, None) for char, mark in zip(guess, marks, strict=True)]
+        syllables, tones = self.sound_score(g, a)
+        return list(zip(guess, marks, self.pinyin(g), syllables, tones, strict=True))
+
+
+@cache
+def dictionary():
+    return IdiomDictionary.load()
+
+
+@cache
+def answers():
+    """Dictionary positions in daily order (a fixed shuffle, like the word answers)."""
+    order = list(range(len(dictionary())))
+    random.Random('idioms').shuffle(order)  # noqa: S311
+    return tuple(order)
+
+
+def normalize(idiom):
+    return idiom.strip()
+
+
+def is_valid_guess(idiom):
+    return normalize(idiom) in dictionary()
+
+
+def daily_answer(day=None):
+    day = day or timezone.localdate()
+    return dictionary().idiom(answers()[(day - FIRST_DAY).days % len(answers())])
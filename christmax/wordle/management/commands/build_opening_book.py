@@ -0,0 +1,73 @@
+"""
+Django management command to rebuild the Wordle hint opening book.
+
+Computes the pattern row of every accepted guess against every answer on a process pool,
+then writes wordle/data/opening.json. The book holds the most informative first guess, the
+best second guess for each feedback that first guess can get, and the shortlist of top
+opening guesses that later hints are chosen from. Run it after build_wordlist whenever a
+list changes, and commit the book.
+
+Usage:
+    python manage.py build_opening_book
+    python manage.py build_opening_book --workers 4
+"""
+
+import json
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from wordle import solver as hints
+
+
+class Command(BaseCommand):
+    """Write the first two hint moves to wordle/data/opening.json."""
+
+    help = 'Rebuild the opening book of first and second Wordle hints'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--workers', type=int, default=None, help='Worker processes (default: CPU count)'
+        )
+        parser.add_argument(
+            '--shortlist',
+            type=int,
+            default=100,
+            help='Best opening guesses that later hints choose from (default: 100)',
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        started = time.perf_counter()
+        solver = hints.Solver(hints.solver().guesses, hints.solver().answers)
+        solver.build_table(options['workers'])
+        self.stdout.write(
+            f'Pattern table: {len(solver.guesses):,} x {len(solver.answers):,} '
+            f'in {time.perf_counter() - started:.1f}s'
+        )
+
+        everything = tuple(range(len(solver.answers)))
+        ranked = solver.rank(everything)
+        first = solver.guesses[ranked[0]]
+        by_feedback = defaultdict(list)
+        for i, answer in enumerate(solver.answers):
+            by_feedback[solver.feedback(first, answer)].append(i)
+        second = {
+            str(feedback): solver.best_guess(tuple(candidates))
+            for feedback, candidates in sorted(by_feedback.items())
+            if feedback != hints.SOLVED
+        }
+
+        shortlist = sorted(solver.guesses[g] for g in ranked[: options['shortlist']])
+        book = {'first': first, 'second': second, 'shortlist': shortlist}
+        hints.OPENING_BOOK_FILE.write_text(
+            json.dumps(book, indent=1, sort_keys=True) + '\n', encoding='utf-8'
+        )
+        hints.opening_book.cache_clear()
+        hints.search.cache_clear()
+        self.stdout.write(
+            f'{hints.OPENING_BOOK_FILE.name}: first guess {first!r}, '
+            f'{len(second)} second guesses, {time.perf_counter() - started:.1f}s in total'
+        )
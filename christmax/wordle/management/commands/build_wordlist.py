@@ -0,0 +1,83 @@
+"""
+Django management command to rebuild the Wordle word lists and their Bloom filter.
+
+Normalizes wordle/data/answers.txt and guesses.txt: lowercase, five ASCII letters, sorted,
+no duplicates, and answers are dropped from the guess list. It then writes a Bloom filter of
+every accepted guess to wordle/static/wordle/guesses.bloom, which guess-validator.js checks
+before a guess is submitted. Run it whenever a list changes, and commit both lists and the
+filter.
+
+Usage:
+    python manage.py build_wordlist
+    python manage.py build_wordlist --guesses ~/lists/allowed.txt   # import a new guess list
+    python manage.py build_wordlist --error-rate 0.0001
+"""
+
+import random
+import re
+import string
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from wordle import words
+from wordle.bloom import BloomFilter
+
+BLOOM_FILE = Path(words.__file__).resolve().parent / 'static' / 'wordle' / 'guesses.bloom'
+WORD = re.compile(rf'[a-z]{{{words.WORD_LENGTH}}}')
+
+
+def clean(path):
+    """The valid words in ``path``, normalized, deduplicated and sorted."""
+    normalized = map(words.normalize, words.read_words(path))
+    return sorted({word for word in normalized if WORD.fullmatch(word)})
+
+
+def false_positive_rate(bloom, accepted, samples=100_000):
+    """Measured share of random non-words the filter lets through."""
+    rng = random.Random(0)  # noqa: S311
+    hits = tried = 0
+    while tried < samples:
+        word = ''.join(rng.choices(string.ascii_lowercase, k=words.WORD_LENGTH))
+        if word not in accepted:
+            tried += 1
+            hits += word in bloom
+    return hits / tried
+
+
+class Command(BaseCommand):
+    """Normalize the word lists and write the guess Bloom filter."""
+
+    help = 'Rebuild the Wordle word lists and the browser-side Bloom filter of valid guesses'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('--answers', default=words.ANSWERS_FILE, help='Answer list to import')
+        parser.add_argument('--guesses', default=words.GUESSES_FILE, help='Guess list to import')
+        parser.add_argument(
+            '--error-rate', type=float, default=0.001, help='Target false-positive rate'
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        if not 0 < options['error_rate'] < 1:
+            raise CommandError('--error-rate must be between 0 and 1')
+        answers = clean(options['answers'])
+        if not answers:
+            raise CommandError(f'No valid answers in {options["answers"]}')
+        guesses = sorted(set(clean(options['guesses'])) - set(answers))
+        words.ANSWERS_FILE.write_text('\n'.join(answers) + '\n', encoding='utf-8')
+        words.GUESSES_FILE.write_text('\n'.join(guesses) + '\n', encoding='utf-8')
+        words.answers.cache_clear()
+        words.accepted.cache_clear()
+
+        accepted = words.accepted()
+        bloom = BloomFilter.build(accepted, options['error_rate'])
+        BLOOM_FILE.write_bytes(bloom.to_bytes())
+
+        self.stdout.write(f'{len(answers):,} answers, {len(accepted):,} accepted guesses')
+        self.stdout.write(
+            f'{BLOOM_FILE.name}: {BLOOM_FILE.stat().st_size:,} bytes, {bloom.hashes} hashes, '
+            f'{false_positive_rate(bloom, accepted):.3%} false positives'
+        )
@@ -0,0 +1,71 @@
+"""
+Django management command to play every Wordle answer with the hint solver.
+
+Each answer is solved from scratch by following the hints (wordle/solver.py), the opening
+book included, on a process pool. The report shows how many guesses the solver needed,
+which answers took more than six, and the time per hint. Use it to compare solver or
+word-list changes before committing them.
+
+Usage:
+    python manage.py solve_all_words
+    python manage.py solve_all_words --workers 4
+"""
+
+import os
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from wordle import solver as hints
+from wordle import words
+
+
+def _solve_chunk(answers):
+    results = []
+    for answer in answers:
+        started = time.perf_counter()
+        guesses = hints.solve(answer)
+        results.append((answer, len(guesses), time.perf_counter() - started))
+    return results
+
+
+class Command(BaseCommand):
+    """Solve every answer and report guess counts and hint latency."""
+
+    help = 'Solve every Wordle answer with the hint solver on a process pool'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--workers', type=int, default=None, help='Worker processes (default: CPU count)'
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        workers = options['workers'] or os.cpu_count() or 1
+        answers = sorted(words.answers())
+        chunks = [answers[i::workers] for i in range(workers)]
+        started = time.perf_counter()
+        with ProcessPoolExecutor(workers) as pool:
+            results = [row for chunk in pool.map(_solve_chunk, chunks) for row in chunk]
+        elapsed = time.perf_counter() - started
+
+        counts = [count for _answer, count, _seconds in results]
+        per_guess = sorted(seconds / count for _answer, count, seconds in results)
+        self.stdout.write(
+            f'{len(results):,} answers in {elapsed:.1f}s on {workers} worker(s), '
+            f'first guess {hints.opening_book().get("first", "(no opening book)")!r}'
+        )
+        self.stdout.write(f'Guesses: mean {statistics.mean(counts):.3f}, max {max(counts)}')
+        for count, total in sorted(Counter(counts).items()):
+            self.stdout.write(f'  {count}: {total:5,}')
+        self.stdout.write(
+            f'Time per hint: median {statistics.median(per_guess) * 1000:.1f} ms, '
+            f'p95 {per_guess[int(len(per_guess) * 0.95)] * 1000:.1f} ms'
+        )
+        failed = sorted(answer for answer, count, _seconds in results if count > words.MAX_GUESSES)
+        if failed:
+            self.stdout.write(self.style.WARNING(f'Over {words.MAX_GUESSES}: {", ".join(failed)}'))
@@ -0,0 +1,185 @@
+"""
+Hints: the guess that tells the player the most about today's word.
+
+Each guess splits the remaining candidate answers by the feedback it would get, which is
+one of 243 patterns (``engine.pattern``). The hint is the accepted guess with the highest
+expected information, ``log2(n) - sum(c * log2(c)) / n`` over the pattern counts ``c``.
+Ties go to a guess that could itself be the answer.
+
+Counting is done per guess over a ``bytes`` row of patterns, one byte per answer.
+``operator.itemgetter`` picks out the candidates' bytes and ``Counter`` counts them, so
+both inner loops run in C. ``Solver.build_table()`` fills the rows for every guess
+(guesses x answers, about 1 MB) on a process pool, for offline work. A hint request without
+rows scores only the current candidates.
+
+The first two moves hardly depend on the player, so ``data/opening.json`` stores them as
+an opening book: the best first guess, and the best second guess for each feedback to it.
+``manage.py build_opening_book`` rebuilds it. Later hints are searched among the book's
+shortlist of strong splitters and the candidates themselves, rather than every accepted
+guess. The results are kept in an LRU cache keyed by the candidate set
+(``HINT_CACHE_SIZE`` entries).
+"""
+
+import json
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from functools import lru_cache
+from operator import itemgetter
+
+from wordle import words
+from wordle.engine import pattern
+from wordle.engine import score
+
+OPENING_BOOK_FILE = words.DATA_DIR / 'opening.json'
+HINT_CACHE_SIZE = 4096
+SOLVED = pattern((2,) * words.WORD_LENGTH)
+
+
+def _rows(guesses, answers):
+    """Pattern rows for ``guesses`` against every answer (run in pool workers)."""
+    return [bytes(pattern(score(guess, answer)) for answer in answers) for guess in guesses]
+
+
+class Solver:
+    def __init__(self, guesses, answers):
+        self.guesses = tuple(guesses)
+        self.answers = tuple(answers)
+        answer_set = set(self.answers)
+        self.is_answer = tuple(guess in answer_set for guess in self.guesses)
+        self.guess_index = {guess: g for g, guess in enumerate(self.guesses)}
+        # Guess index -> bytes of patterns against each answer index, once built
+        self.rows = {}
+
+    def build_table(self, workers=None):
+        """Compute every guess's pattern row, split across ``workers`` processes."""
+        workers = workers or os.cpu_count() or 1
+        missing = [g for g in range(len(self.guesses)) if g not in self.rows]
+        chunks = [missing[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [
+                pool.submit(_rows, [self.guesses[g] for g in chunk], self.answers)
+                for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, futures, strict=True):
+                self.rows.update(zip(chunk, future.result(), strict=True))
+
+    def feedback(self, guess, answer):
+        return pattern(score(guess, answer))
+
+    def candidates(self, history):
+        """Indices of the answers consistent with ``history``: ``(guess, pattern)`` pairs."""
+        candidates = range(len(self.answers))
+        for guess, feedback in history:
+            candidates = [
+                i for i in candidates if self.feedback(guess, self.answers[i]) == feedback
+            ]
+        return tuple(candidates)
+
+    def _patterns(self, g, candidates):
+        row = self.rows.get(g)
+        if row is not None:
+            return itemgetter(*candidates)(row)
+        guess = self.guesses[g]
+        return [pattern(score(guess, self.answers[i])) for i in candidates]
+
+    def information(self, g, candidates):
+        """Expected bits learned by guessing ``self.guesses[g]`` (``candidates`` >= 2)."""
+        n = len(candidates)
+        counts = Counter(self._patterns(g, candidates)).values()
+        return math.log2(n) - sum(c * math.log2(c) for c in counts) / n
+
+    def rank(self, candidates, pool=None):
+        """Guess indices from ``pool`` (default: all), most informative first."""
+        pool = range(len(self.guesses)) if pool is None else pool
+        candidate_words = {self.answers[i] for i in candidates}
+        return sorted(
+            pool,
+            key=lambda g: (
+                self.information(g, candidates),
+                self.guesses[g] in candidate_words,
+                self.is_answer[g],
+            ),
+            reverse=True,
+        )
+
+    def best_guess(self, candidates, pool=None):
+        """The most informative guess for a non-empty tuple of candidate indices."""
+        if len(candidates) <= 2:
+            return self.answers[candidates[0]]
+        return self.guesses[self.rank(candidates, pool)[0]]
+
+    def index(self, guess):
+        return self.guess_index[guess]
+
+
+@cache
+def solver():
+    return Solver(sorted(words.accepted()), sorted(words.answers()))
+
+
+@cache
+def opening_book():
+    """
+    ``{'first': word, 'second': {str(pattern): word}, 'shortlist': [word, ...]}``, or {}
+    before it is built.
+    """
+    if not OPENING_BOOK_FILE.exists():
+        return {}
+    return json.loads(OPENING_BOOK_FILE.read_text(encoding='utf-8'))
+
+
+@lru_cache(maxsize=HINT_CACHE_SIZE)
+def search(candidates):
+    """
+    The best guess for ``candidates`` among the book's shortlist and (unless there are
+    more of them than shortlisted guesses) the candidates themselves.
+
+    Searching every accepted guess costs up to seconds for a large candidate set; the
+    shortlist (the strongest opening guesses) covers the good splitters at a fraction of it.
+    """
+    current = solver()
+    shortlist = opening_book().get('shortlist')
+    if shortlist is None:
+        return current.best_guess(candidates)
+    pool = {current.index(guess) for guess in shortlist}
+    if len(candidates) <= len(shortlist):
+        pool.update(current.index(current.answers[i]) for i in candidates)
+    return current.best_guess(candidates, sorted(pool))
+
+
+def from_book(history):
+    """The opening book's move after ``history``, or None when it has none."""
+    book = opening_book()
+    if not book:
+        return None
+    if not history:
+        return book['first']
+    if len(history) == 1 and history[0][0] == book['first']:
+        return book['second'].get(str(history[0][1]))
+    return None
+
+
+def hint(history):
+    """
+    The suggested next guess after ``history``, a list of ``(guess, pattern)`` pairs.
+
+    Returns None once no answer fits the feedback (it can't happen for a real game).
+    """
+    if (guess := from_book(history)) is not None:
+        return guess
+    candidates = solver().candidates(history)
+    return search(candidates) if candidates else None
+
+
+def solve(answer):
+    """The guesses the hints play to find ``answer``."""
+    history = []
+    while True:
+        guess = hint(history)
+        feedback = solver().feedback(guess, answer)
+        history.append((guess, feedback))
+        if feedback == SOLVED:
+            return [guess for guess, _feedback in history]
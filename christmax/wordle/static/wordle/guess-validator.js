@@ -0,0 +1,107 @@
+/* global gettext */
+
+/**
+ * Wordle guess validator.
+ *
+ * Checks a guess against the Bloom filter of valid words (built by `manage.py
+ * build_wordlist`, see wordle/bloom.py) before the form is submitted, so words that are not
+ * in the list are rejected without a round-trip. A Bloom filter has no false negatives, so a
+ * valid word is never blocked; the rare false positive is rejected by the server, which
+ * always validates. If the filter can't be loaded, guesses are simply submitted. Forms posted
+ * by htmx are checked in htmx:beforeRequest, which cancels the request.
+ */
+
+const BLOOM_MAGIC = 'WBLM';
+const BLOOM_VERSION = 1;
+const BLOOM_HEADER_SIZE = 16;
+const FNV_PRIME = 0x01000193;
+const FNV_SEEDS = [0x811c9dc5, 0x9747b28c];
+
+/**
+ * 32-bit FNV-1a hash of an ASCII word, then the murmur3 finalizer (as wordle/bloom.py).
+ *
+ * @param {string} word - Lowercase word
+ * @param {number} seed - Offset basis
+ * @returns {number} Unsigned 32-bit hash
+ */
+function wordHash(word, seed) {
+  let hash = seed;
+  for (let i = 0; i < word.length; i++) {
+    hash = Math.imul(hash ^ word.charCodeAt(i), FNV_PRIME);
+  }
+  hash ^= hash >>> 16;
+  hash = Math.imul(hash, 0x85ebca6b);
+  hash ^= hash >>> 13;
+  hash = Math.imul(hash, 0xc2b2ae35);
+  return (hash ^ (hash >>> 16)) >>> 0;
+}
+
+class GuessFilter {
+  /**
+   * @param {ArrayBuffer} buffer - Contents of guesses.bloom
+   */
+  constructor(buffer) {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== BLOOM_MAGIC || view.getUint8(4) !== BLOOM_VERSION) {
+      throw new Error('Unsupported word-list filter');
+    }
+    this.hashes = view.getUint8(5);
+    this.bits = view.getUint32(8, true);
+    this.data = new Uint8Array(buffer, BLOOM_HEADER_SIZE);
+  }
+
+  /**
+   * @param {string} word - Lowercase word
+   * @returns {boolean} False only if the word is certainly not in the list
+   */
+  mightContain(word) {
+    if (!/^[a-z]+$/.test(word)) {
+      return false;
+    }
+    const first = wordHash(word, FNV_SEEDS[0]);
+    const second = wordHash(word, FNV_SEEDS[1]);
+    for (let i = 0; i < this.hashes; i++) {
+      const position = ((first + Math.imul(i, second)) >>> 0) % this.bits;
+      if (!((this.data[position >> 3] >> (position & 7)) & 1)) {
+        return false;
+      }
+    }
+    return true;
+  }
+}
+
+/**
+ * Reject guesses the filter rules out before they are submitted.
+ *
+ * @param {HTMLFormElement} form - Guess form with a data-wordle-bloom URL
+ */
+function attachGuessValidator(form) {
+  const input = form.elements.guess;
+  let filter = null;
+  fetch(form.dataset.wordleBloom)
+    .then((response) => (response.ok ? response.arrayBuffer() : Promise.reject(response)))
+    .then((buffer) => {
+      filter = new GuessFilter(buffer);
+    })
+    .catch(() => {});
+
+  const reject = (event) => {
+    const word = input.value.trim().toLowerCase();
+    if (filter && !filter.mightContain(word)) {
+      event.preventDefault();
+      input.setCustomValidity(
+        typeof gettext === 'function' ? gettext('Not in word list') : 'Not in word list',
+      );
+      input.reportValidity();
+    }
+  };
+  input.addEventListener('input', () => input.setCustomValidity(''));
+  form.addEventListener('submit', reject);
+  // htmx posts the form from its own submit listener, which may run before ours
+  form.addEventListener('htmx:beforeRequest', reject);
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+  document.querySelectorAll('form[data-wordle-bloom]').forEach(attachGuessValidator);
+});
@@ -0,0 +1,80 @@
+"""Puzzle endpoints of the JSON API (wordle.api)."""
+import json
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from wordle import idioms
+from wordle.api import GuessApi
+from wordle.api import PuzzleApi
+from wordle.views import WORDS
+
+
+@pytest.fixture
+def answer(monkeypatch):
+    cache.clear()
+    mode = WORDS._replace(daily_answer=lambda: 'crane')
+    monkeypatch.setattr(PuzzleApi, 'mode', mode)
+    monkeypatch.setattr(GuessApi, 'mode', mode)
+    return 'crane'
+
+
+def guess(client, word):
+    return client.post(reverse('api-v1:wordle-guess'), {'guess': word})
+
+
+@pytest.mark.django_db
+def test_puzzle_is_served_without_queries(client, answer, django_assert_num_queries):
+    with django_assert_num_queries(0):
+        response = client.get(reverse('api-v1:wordle'))
+    data = json.loads(response.content)
+    assert data['rows'] == []
+    assert data['length'] == 5
+    assert not data['finished']
+    assert response['Content-Type'] == 'application/json'
+
+
+@pytest.mark.django_db
+def test_guess_updates_state_and_etag(client, answer):
+    first = client.get(reverse('api-v1:wordle'))
+    assert client.get(reverse('api-v1:wordle'), HTTP_IF_NONE_MATCH=first['ETag']).status_code == 304
+
+    response = guess(client, 'REACT')
+    assert json.loads(response.content)['rows'] == [
+        [['r', 1], ['e', 1], ['a', 2], ['c', 1], ['t', 0]]
+    ]
+    after = client.get(reverse('api-v1:wordle'), HTTP_IF_NONE_MATCH=first['ETag'])
+    assert after.status_code == 200
+    assert after['ETag'] != first['ETag']
+
+
+@pytest.mark.django_db
+def test_invalid_guess_is_a_json_error(client, answer):
+    response = guess(client, 'zzzzz')
+    assert response.status_code == 422
+    assert json.loads(response.content)['error'] == 'not_in_word_list'
+
+    response = client.post(
+        reverse('api-v1:wordle-guess'), '[1, 2]', content_type='application/json'
+    )
+    assert json.loads(response.content)['error'] == 'invalid_json'
+    assert client.get(reverse('api-v1:wordle-guess')).status_code == 405
+
+
+@pytest.mark.django_db
+def test_finished_game_includes_results(client, answer):
+    data = json.loads(guess(client, 'crane').content)
+    assert data['solved']
+    assert data['finished']
+    assert data['results'] == {'1': 1}
+
+
+@pytest.mark.django_db
+def test_idiom_guess_as_json(client, monkeypatch):
+    answer = idioms.dictionary().index('三心二意')
+    monkeypatch.setattr(idioms, 'answers', lambda: (answer,))
+    response = client.post(
+        reverse('api-v1:idioms-guess'), {'guess': '一心一意'}, content_type='application/json'
+    )
+    assert json.loads(response.content)['rows'][0][1] == ['心', 2, 'xīn', 2, 2]
@@ -0,0 +1,62 @@
+"""Word-list Bloom filter (wordle.bloom) and the build_wordlist command."""
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+
+from wordle import words
+from wordle.bloom import BloomFilter
+from wordle.bloom import positions
+from wordle.management.commands import build_wordlist
+
+STATIC_BLOOM = Path(words.__file__).resolve().parent / 'static' / 'wordle' / 'guesses.bloom'
+
+
+def test_round_trip_has_no_false_negatives():
+    added = ['crane', 'slate', 'eerie']
+    bloom = BloomFilter.from_bytes(BloomFilter.build(added).to_bytes())
+    assert all(word in bloom for word in added)
+    assert bloom.count == 3
+
+
+def test_rejects_other_formats():
+    payload = bytearray(BloomFilter.build(['crane']).to_bytes())
+    payload[4] = 99
+    with pytest.raises(ValueError, match='version'):
+        BloomFilter.from_bytes(bytes(payload))
+
+
+def test_positions_are_stable():
+    # guess-validator.js computes the same positions; see wordle/bloom.py before changing
+    assert positions('crane', 3, 30_000) == positions('crane', 3, 30_000)
+    assert len(set(positions('crane', 10, 30_000))) == 10
+
+
+def test_shipped_filter_matches_word_lists():
+    bloom = BloomFilter.from_bytes(STATIC_BLOOM.read_bytes())
+    assert bloom.count == len(words.accepted())
+    assert all(word in bloom for word in words.accepted())
+
+
+@pytest.fixture
+def word_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(words, 'ANSWERS_FILE', tmp_path / 'answers.txt')
+    monkeypatch.setattr(words, 'GUESSES_FILE', tmp_path / 'guesses.txt')
+    monkeypatch.setattr(build_wordlist, 'BLOOM_FILE', tmp_path / 'guesses.bloom')
+    yield tmp_path
+    words.answers.cache_clear()
+    words.accepted.cache_clear()
+
+
+def test_build_wordlist_normalizes_lists(word_files):
+    (word_files / 'answers.txt').write_text('Crane\nslate\ncrane\nno\n', encoding='utf-8')
+    (word_files / 'guesses.txt').write_text('zesty\nSLATE\nab-cd\n\nqueue\n', encoding='utf-8')
+    out = StringIO()
+    call_command('build_wordlist', stdout=out)
+
+    assert (word_files / 'answers.txt').read_text() == 'crane\nslate\n'
+    assert (word_files / 'guesses.txt').read_text() == 'queue\nzesty\n'
+    bloom = BloomFilter.from_bytes((word_files / 'guesses.bloom').read_bytes())
+    assert all(word in bloom for word in ['crane', 'slate', 'queue', 'zesty'])
+    assert '2 answers, 4 accepted guesses' in out.getvalue()
@@ -0,0 +1,36 @@
+"""Latin Wordle scoring (wordle.engine)."""
+import pytest
+
+from wordle.engine import HIT
+from wordle.engine import MISS
+from wordle.engine import PRESENT
+from wordle.engine import letter_mask
+from wordle.engine import pattern
+from wordle.engine import score
+
+
+def test_letter_mask():
+    assert letter_mask('abc') == 0b111
+    assert letter_mask('zz') == 1 << 25
+
+
+@pytest.mark.parametrize(
+    ('guess', 'answer', 'expected'),
+    [
+        ('crane', 'crane', (HIT,) * 5),
+        ('dumpy', 'crane', (MISS,) * 5),
+        ('react', 'crane', (PRESENT, PRESENT, HIT, PRESENT, MISS)),
+        # Only as many PRESENT marks as the answer has unmatched copies
+        ('speed', 'abide', (MISS, MISS, PRESENT, MISS, PRESENT)),
+        ('eerie', 'there', (PRESENT, MISS, PRESENT, MISS, HIT)),
+        ('lolly', 'hello', (MISS, PRESENT, HIT, HIT, MISS)),
+    ],
+)
+def test_score(guess, answer, expected):
+    assert score(guess, answer) == expected
+
+
+def test_pattern_is_base_three():
+    assert pattern((MISS,) * 5) == 0
+    assert pattern((HIT,) * 5) == 242
+    assert pattern((MISS, MISS, MISS, PRESENT, HIT)) == 5
@@ -0,0 +1,94 @@
+"""Four-character idiom puzzles (wordle.idioms) and the generic scorer."""
+from datetime import date
+
+import pytest
+
+from wordle import idioms
+from wordle.engine import HIT
+from wordle.engine import MISS
+from wordle.engine import PRESENT
+from wordle.engine import score
+from wordle.engine import score_sequence
+from wordle.idioms import IdiomDictionary
+from wordle.idioms import mark_tone
+
+ENTRIES = [
+    ('一心一意', 'yi1 xin1 yi1 yi4'.split()),
+    ('三心二意', 'san1 xin1 er4 yi4'.split()),
+    ('心想事成', 'xin1 xiang3 shi4 cheng2'.split()),
+    ('長年累月', 'chang2 nian2 lei3 yue4'.split()),
+]
+
+
+@pytest.fixture
+def dictionary():
+    return IdiomDictionary(ENTRIES)
+
+
+@pytest.mark.parametrize(
+    ('syllable', 'tone', 'expected'),
+    [
+        ('yi', 1, 'yī'),
+        ('xiang', 3, 'xiǎng'),
+        ('lve', 4, 'lüè'),
+        ('lv', 4, 'lǜ'),
+        ('zhou', 1, 'zhōu'),
+        ('gui', 4, 'guì'),
+        ('de', 5, 'de'),
+    ],
+)
+def test_mark_tone(syllable, tone, expected):
+    assert mark_tone(syllable, tone) == expected
+
+
+def test_score_sequence_matches_latin_scorer():
+    for guess, answer in [('react', 'crane'), ('speed', 'abide'), ('lolly', 'hello')]:
+        assert score_sequence(guess, answer) == score(guess, answer)
+
+
+def test_index_round_trips(dictionary):
+    assert len(dictionary) == 4
+    for idiom, _pinyin in ENTRIES:
+        i = dictionary.index(idiom)
+        assert dictionary.idiom(i) == idiom
+        assert len(dictionary.pinyin(i)) == 4
+    assert dictionary.index('一心二意') == -1
+    assert '心想事成' in dictionary
+    assert '心想' not in dictionary
+
+
+def test_characters_get_dense_ids(dictionary):
+    assert sorted(dictionary.char_ids.values()) == list(range(len(set(dictionary.text))))
+    assert dictionary.codes.typecode == 'H'
+    assert len(dictionary.codes) == len(dictionary.syllables) == len(dictionary.tones) == 16
+
+
+def test_repeated_characters_are_marked_once(dictionary):
+    # 一 twice in the guess, once in the answer (in a different place)
+    marks = dictionary.score(dictionary.index('一心一意'), dictionary.index('心想事成'))
+    assert marks == (MISS, PRESENT, MISS, MISS)
+
+
+def test_feedback_with_sounds(dictionary):
+    assert dictionary.feedback('三心二意', '一心一意') == [
+        ('三', MISS, 'sān', MISS, HIT),
+        ('心', HIT, 'xīn', HIT, HIT),
+        ('二', MISS, 'èr', MISS, MISS),
+        ('意', HIT, 'yì', HIT, HIT),
+    ]
+    assert dictionary.feedback('三心二意', '一心一意', sounds=False)[0] == (
+        '三',
+        MISS,
+        None,
+        None,
+        None,
+    )
+
+
+def test_shipped_dictionary():
+    dictionary = idioms.dictionary()
+    assert len(dictionary) >= 200
+    assert all(len(dictionary.idiom(i)) == 4 for i in range(len(dictionary)))
+    assert sorted(idioms.answers()) == list(range(len(dictionary)))
+    assert idioms.is_valid_guess(' 一帆風順 ')
+    assert idioms.daily_answer(date(2026, 1, 1)) in dictionary
@@ -0,0 +1,91 @@
+"""Entropy-ranked hints and the opening book (wordle.solver)."""
+import math
+
+import pytest
+from django.urls import reverse
+
+from base.instrumentation import registry
+from wordle import solver as hints
+from wordle import words
+from wordle.engine import pattern
+from wordle.solver import Solver
+from wordle.views import WORDS
+
+ANSWERS = ('baker', 'cider', 'fader', 'hiker', 'wider', 'wafer')
+GUESSES = ANSWERS + ('chawk',)
+
+
+@pytest.fixture
+def solver():
+    return Solver(sorted(GUESSES), sorted(ANSWERS))
+
+
+def test_candidates_follow_feedback(solver):
+    feedback = solver.feedback('baker', 'wider')
+    assert [solver.answers[i] for i in solver.candidates([('baker', feedback)])] == [
+        'cider',
+        'wider',
+    ]
+
+
+def test_information_counts_patterns(solver):
+    everything = tuple(range(len(solver.answers)))
+    # Every answer gives 'chawk' a different pattern: log2(6) bits
+    assert solver.information(solver.index('chawk'), everything) == pytest.approx(math.log2(6))
+    assert solver.information(solver.index('baker'), everything) < math.log2(6)
+    # 'wider' splits them all too, and could be the answer
+    assert solver.best_guess(everything) == 'wider'
+
+
+def test_table_rows_give_the_same_answer(solver):
+    everything = tuple(range(len(solver.answers)))
+    expected = [solver.information(g, everything) for g in range(len(solver.guesses))]
+    solver.build_table(workers=2)
+    assert len(solver.rows) == len(solver.guesses)
+    assert [solver.information(g, everything) for g in range(len(solver.guesses))] == expected
+
+
+def test_ties_prefer_a_possible_answer(solver):
+    two = (solver.answers.index('cider'), solver.answers.index('wider'))
+    assert solver.best_guess(two) == 'cider'
+
+
+def test_shipped_opening_book_uses_accepted_words():
+    book = hints.opening_book()
+    accepted = words.accepted()
+    assert book['first'] in accepted
+    assert set(book['second'].values()) <= accepted
+    assert set(book['shortlist']) <= accepted
+    assert book['first'] in book['shortlist']
+
+
+def test_hints_start_from_the_book():
+    book = hints.opening_book()
+    assert hints.hint([]) == book['first']
+    feedback = hints.solver().feedback(book['first'], 'about')
+    assert hints.hint([(book['first'], feedback)]) == book['second'][str(feedback)]
+    assert hints.from_book([('zzzzz', 0)]) is None
+
+
+@pytest.mark.parametrize('answer', ['about', 'floor', 'royal'])
+def test_solve_within_six_guesses(answer):
+    guesses = hints.solve(answer)
+    assert guesses[-1] == answer
+    assert len(guesses) <= words.MAX_GUESSES
+
+
+def test_search_results_are_cached():
+    hints.search.cache_clear()
+    history = [('mamma', pattern((0, 0, 0, 0, 0)))]
+    first = hints.hint(history)
+    assert hints.hint(history) == first
+    assert hints.search.cache_info().hits == 1
+
+
+@pytest.mark.django_db
+def test_hint_view(client, monkeypatch):
+    registry.reset()
+    monkeypatch.setattr('wordle.views.WORDS', WORDS._replace(daily_answer=lambda: 'royal'))
+    response = client.post(reverse('wordle:hint'), follow=True)
+    assert hints.opening_book()['first'].upper() in response.content.decode()
+    assert registry.get_counter('wordle_hints_total', source='book') == 1
@@ -0,0 +1,165 @@
+"""Wordle board and guess endpoint (wordle.views)."""
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+from base.counters import ShardedCounter
+from base.instrumentation import registry
+from wordle import idioms
+from wordle import words
+from wordle.views import WORDS
+from wordle.views import GuessView
+from wordle.views import PlayView
+
+
+@pytest.fixture
+def answer(monkeypatch):
+    registry.reset()
+    cache.clear()
+    mode = WORDS._replace(daily_answer=lambda: 'crane')
+    monkeypatch.setattr(PlayView, 'mode', mode)
+    monkeypatch.setattr(GuessView, 'mode', mode)
+    return 'crane'
+
+
+def guess(client, word):
+    return client.post(reverse('wordle:guess'), {'guess': word}, follow=True)
+
+
+@pytest.mark.django_db
+def test_play_page_loads_validator_and_filter(client):
+    response = client.get(reverse('wordle:play'))
+    assert 'wordle/guess-validator.js' in response.content.decode()
+    assert 'data-wordle-bloom="/static/wordle/guesses.bloom"' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_accepted_guess_is_scored(client, answer):
+    response = guess(client, 'React')
+    assert response.context['rows'] == [
+        [('r', 1), ('e', 1), ('a', 2), ('c', 1), ('t', 0)],
+    ]
+    assert registry.get_counter('wordle_guesses_total', result='accepted') == 1
+
+
+@pytest.mark.django_db
+def test_server_rejects_words_not_in_list(client, answer):
+    response = guess(client, 'zzzzz')
+    assert response.context['rows'] == []
+    assert 'Not in word list' in response.content.decode()
+    assert registry.get_counter('wordle_guesses_total', result='rejected') == 1
+
+
+@pytest.mark.django_db
+def test_game_ends_when_solved(client, answer):
+    guess(client, 'crane')
+    response = guess(client, 'react')
+    assert response.context['solved']
+    assert len(response.context['rows']) == 1
+
+
+@pytest.mark.django_db
+def test_finished_game_shows_everyones_results(client, answer):
+    day = timezone.localdate().isoformat()
+    ShardedCounter(f'wordle:{day}').increment('4', amount=3)
+    guess(client, 'react')
+    response = guess(client, 'crane')
+
+    distribution = response.context['distribution']
+    assert distribution[1] == ('2', 1, 33, True)
+    assert distribution[3] == ('4', 3, 100, False)
+    assert 'How everyone did' in response.content.decode()
+    # Guesses after the end don't count again
+    guess(client, 'crane')
+    assert ShardedCounter(f'wordle:{day}').aggregate() == {'2': 1, '4': 3}
+
+
+def test_daily_answer_cycles_through_answers():
+    first = words.daily_answer(words.FIRST_DAY)
+    assert first in words.answers()
+    assert words.is_valid_guess(f' {first.upper()} ')
+
+
+@pytest.mark.django_db
+def test_idiom_mode_scores_characters_and_sounds(client, monkeypatch):
+    answer = idioms.dictionary().index('三心二意')
+    monkeypatch.setattr(idioms, 'answers', lambda: (answer,))
+    response = client.post(reverse('wordle:idioms-guess'), {'guess': ' 一心一意 '})
+    assert response.url == reverse('wordle:idioms')
+
+    response = client.get(reverse('wordle:idioms'))
+    assert response.context['rows'] == [
+        [
+            ('一', 0, 'yī', 0, 2),
+            ('心', 2, 'xīn', 2, 2),
+            ('一', 0, 'yī', 0, 0),
+            ('意', 2, 'yì', 2, 2),
+        ]
+    ]
+    assert 'xīn' in response.content.decode()
+
+
+HTMX = {'HX-Request': 'true'}
+
+
+def htmx_guess(client, word):
+    return client.post(reverse('wordle:guess'), {'guess': word}, headers=HTMX)
+
+
+@pytest.mark.django_db
+def test_htmx_board_is_the_game_without_the_page(client, answer):
+    guess(client, 'react')
+    page = client.get(reverse('wordle:play'))
+    response = client.get(reverse('wordle:play'), headers=HTMX)
+
+    content = response.content.decode()
+    assert content.lstrip().startswith('<div id="wordle-game">')
+    assert 'id="wordle-keyboard"' in content
+    assert '<nav' not in content and '<nav' in page.content.decode()
+    assert len(response.content) * 2 < len(page.content)
+    assert 'HX-Request' in response['Vary'] and 'HX-Request' in page['Vary']
+
+
+@pytest.mark.django_db
+def test_htmx_guess_returns_the_new_row_and_keyboard(client, answer):
+    htmx_guess(client, 'slate')
+    response = htmx_guess(client, 'react')
+
+    assert response.status_code == 200
+    assert response.context['row'] == [('r', 1), ('e', 1), ('a', 2), ('c', 1), ('t', 0)]
+    keys = dict(key for line in response.context['keyboard'] for key in line)
+    assert [keys[key] for key in 'atsrz'] == ['hit', 'miss', 'miss', 'present', '']
+    content = response.content.decode()
+    assert content.count('class="wordle-tile') == 5  # one row of tiles
+    assert '<span id="wordle-key-r" class="wordle-key present" hx-swap-oob="true">' in content
+    assert content.count('hx-swap-oob="true">') == 6  # the message and the guess's five keys
+    assert 'id="wordle-status"' not in content
+    assert 'HX-Reswap' not in response
+
+
+@pytest.mark.django_db
+def test_htmx_guess_not_in_list_only_updates_the_message(client, answer):
+    response = htmx_guess(client, 'zzzzz')
+    assert response['HX-Reswap'] == 'none'
+    assert response.context['row'] is None
+    assert 'Not in word list</div>' in response.content.decode()
+    # The message was shown in place, not queued for the next full page
+    assert 'Not in word list' not in client.get(reverse('wordle:play')).content.decode()
+
+
+@pytest.mark.django_db
+def test_htmx_guess_that_ends_the_game_swaps_in_the_results(client, answer):
+    response = htmx_guess(client, 'crane')
+    content = response.content.decode()
+    assert '<div id="wordle-status" hx-swap-oob="true">' in content
+    assert 'How everyone did' in content
+    assert 'name="guess"' not in content
+
+
+@pytest.mark.django_db
+def test_htmx_hint_returns_only_the_message(client, monkeypatch):
+    monkeypatch.setattr('wordle.views.WORDS', WORDS._replace(daily_answer=lambda: 'royal'))
+    response = client.post(reverse('wordle:hint'), headers=HTMX)
+    assert response.content.decode().startswith('<div id="wordle-message"')
+    assert 'Try “' in response.content.decode()
@@ -0,0 +1,16 @@
+from django.urls import path
+
+from wordle.views import IDIOMS
+from wordle.views import GuessView
+from wordle.views import HintView
+from wordle.views import PlayView
+
+app_name = 'wordle'
+
+urlpatterns = [
+    path('', PlayView.as_view(), name='play'),
+    path('guess/', GuessView.as_view(), name='guess'),
+    path('hint/', HintView.as_view(), name='hint'),
+    path('idioms/', PlayView.as_view(mode=IDIOMS), name='idioms'),
+    path('idioms/guess/', GuessView.as_view(mode=IDIOMS), name='idioms-guess'),
+]
@@ -0,0 +1,223 @@
+from collections import namedtuple
+
+from django.contrib import messages
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.utils import timezone
+from django.utils.translation import gettext as _
+from django.views import View
+from django.views.generic import TemplateView
+
+from base.counters import ShardedCounter
+from base.htmx import HtmxTemplateMixin
+from base.htmx import is_htmx
+from base.htmx import vary_on_htmx
+from base.instrumentation import registry
+from wordle import idioms
+from wordle import solver
+from wordle import words
+from wordle.engine import score
+
+registry.describe('wordle_guesses_total', 'Wordle guesses received by the server, by outcome')
+registry.describe('wordle_hints_total', 'Wordle hints given, by source (book or search)')
+
+KEY_STATES = {0: 'miss', 1: 'present', 2: 'hit'}
+
+# A puzzle variant: its URL names, session key, templates, answer and guess handling.
+# feedback(guess, answer) returns one board row, a tuple per character. partials is the
+# directory of its row.html and status.html fragments; keyboard lists the on-screen key rows.
+Mode = namedtuple(
+    'Mode',
+    'url_name guess_url_name session_key template partials keyboard length daily_answer '
+    'normalize is_valid feedback',
+)
+
+WORDS = Mode(
+    url_name='wordle:play',
+    guess_url_name='wordle:guess',
+    session_key='wordle',
+    template='wordle/play.html',
+    partials='wordle/partials/words/',
+    keyboard=words.KEYBOARD,
+    length=words.WORD_LENGTH,
+    daily_answer=words.daily_answer,
+    normalize=words.normalize,
+    is_valid=words.is_valid_guess,
+    feedback=lambda guess, answer: list(zip(guess, score(guess, answer), strict=True)),
+)
+IDIOMS = Mode(
+    url_name='wordle:idioms',
+    guess_url_name='wordle:idioms-guess',
+    session_key='wordle-idioms',
+    template='wordle/idioms.html',
+    partials='wordle/partials/idioms/',
+    keyboard=(),
+    length=idioms.IDIOM_LENGTH,
+    daily_answer=idioms.daily_answer,
+    normalize=idioms.normalize,
+    is_valid=idioms.is_valid_guess,
+    feedback=lambda guess, answer: idioms.dictionary().feedback(guess, answer),
+)
+
+
+def current_game(request, mode):
+    """Today's guesses, from the session (a new day starts a new game)."""
+    today = timezone.localdate().isoformat()
+    game = request.session.get(mode.session_key)
+    if not game or game['day'] != today:
+        game = {'day': today, 'guesses': []}
+    return game
+
+
+def is_finished(game, answer):
+    return answer in game['guesses'] or len(game['guesses']) >= words.MAX_GUESSES
+
+
+def _result(game, answer):
+    """The distribution bucket of a finished game: the guess count, or X if unsolved."""
+    return str(len(game['guesses'])) if answer in game['guesses'] else 'X'
+
+
+def results_counter(mode, day):
+    """Everyone's results for one day's puzzle."""
+    return ShardedCounter(f'{mode.session_key}:{day}')
+
+
+def submit_guess(request, mode, guess):
+    """
+    Add ``guess`` to today's game in the session; return the game, or None if the guess
+    isn't in the word list. Guesses after the game has ended are ignored.
+    """
+    game = current_game(request, mode)
+    guess = mode.normalize(guess)
+    if not mode.is_valid(guess):
+        registry.increment('wordle_guesses_total', {'result': 'rejected'})
+        return None
+    if not is_finished(game, answer := mode.daily_answer()):
+        registry.increment('wordle_guesses_total', {'result': 'accepted'})
+        game['guesses'].append(guess)
+        request.session[mode.session_key] = game
+        if is_finished(game, answer):
+            results_counter(mode, game['day']).increment(_result(game, answer))
+    return game
+
+
+def distribution(mode, game, answer):
+    """``(bucket, count, percent of the largest bucket, is the player's)`` rows."""
+    counts = results_counter(mode, game['day']).counts()
+    buckets = [str(n) for n in range(1, words.MAX_GUESSES + 1)] + ['X']
+    largest = max(counts.values(), default=0) or 1
+    mine = _result(game, answer)
+    return [
+        (bucket, counts.get(bucket, 0), 100 * counts.get(bucket, 0) // largest, bucket == mine)
+        for bucket in buckets
+    ]
+
+
+def keyboard(mode, rows):
+    """
+    The on-screen keyboard as rows of ``(key, state)``, where state is the CSS class of the
+    key's best mark so far (board.css), or '' if it hasn't been guessed.
+    """
+    best = {}
+    for row in rows:
+        for char, mark, *_rest in row:
+            best[char] = max(mark, best.get(char, mark))
+    return [[(key, KEY_STATES.get(best.get(key), '')) for key in line] for line in mode.keyboard]
+
+
+def game_context(mode, game, answer):
+    """What the board, keyboard and status templates (wordle/partials/) need."""
+    rows = [mode.feedback(guess, answer) for guess in game['guesses']]
+    finished = is_finished(game, answer)
+    return {
+        'rows': rows,
+        'solved': answer in game['guesses'],
+        'finished': finished,
+        'distribution': distribution(mode, game, answer) if finished else None,
+        'keyboard': keyboard(mode, rows),
+        'word_length': mode.length,
+        'guess_url_name': mode.guess_url_name,
+        'row_template': f'{mode.partials}row.html',
+        'status_template': f'{mode.partials}status.html',
+    }
+
+
+class PlayView(HtmxTemplateMixin, TemplateView):
+    """Today's board; htmx requests get the game without the page around it."""
+
+    mode = WORDS
+    partial_template_name = 'wordle/partials/game.html'
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.template_name = self.mode.template
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(
+            game_context(
+                self.mode, current_game(self.request, self.mode), self.mode.daily_answer()
+            )
+        )
+        return context
+
+
+class GuessView(View):
+    """
+    Record a guess for today's puzzle, then redirect back to the board.
+
+    This is the authoritative check: guess-validator.js already rejects most words that
+    aren't in the list (Bloom filter false positives still get here). htmx requests get
+    only what changed: the new row, its keys and, once the game is over, the result.
+    """
+
+    mode = WORDS
+
+    def post(self, request):
+        before = len(current_game(request, self.mode)['guesses'])
+        game = submit_guess(request, self.mode, request.POST.get('guess', ''))
+        if is_htmx(request):
+            return self.fragment(request, game, before)
+        if game is None:
+            messages.error(request, _('Not in word list'))
+        return redirect(self.mode.url_name)
+
+    def fragment(self, request, game, before):
+        rejected = game is None
+        game = game or current_game(request, self.mode)
+        context = game_context(self.mode, game, self.mode.daily_answer())
+        added = len(game['guesses']) > before
+        context['row'] = context['rows'][-1] if added else None
+        context['message'] = _('Not in word list') if rejected else ''
+        # Only the keys this guess touched need repainting
+        states = dict(key for line in context['keyboard'] for key in line)
+        letters = dict.fromkeys(char for char, *_ in context['row'] or ())
+        context['keys'] = [(char, states[char]) for char in letters if char in states]
+        response = TemplateResponse(request, 'wordle/partials/guessed.html', context)
+        if not added:
+            response['HX-Reswap'] = 'none'  # nothing to append; the message swaps out of band
+        return vary_on_htmx(response)
+
+
+class HintView(View):
+    """Suggest the most informative next guess for today's word puzzle."""
+
+    def post(self, request):
+        game = current_game(request, WORDS)
+        answer = WORDS.daily_answer()
+        message = ''
+        if not is_finished(game, answer):
+            feedback = solver.solver().feedback
+            history = [(guess, feedback(guess, answer)) for guess in game['guesses']]
+            source = 'book' if solver.from_book(history) is not None else 'search'
+            registry.increment('wordle_hints_total', {'source': source})
+            message = _('Try “%(word)s”.') % {'word': solver.hint(history).upper()}
+        if is_htmx(request):
+            response = TemplateResponse(
+                request, 'wordle/partials/message.html', {'message': message}
+            )
+            return vary_on_htmx(response)
+        if message:
+            messages.info(request, message)
+        return redirect(WORDS.url_name)
@@ -0,0 +1,54 @@
+"""
+Wordle word lists: the daily answers and every word accepted as a guess.
+
+``data/answers.txt`` holds the possible answers and ``data/guesses.txt`` the other words a
+player may guess, one per line. Both are maintained with ``manage.py build_wordlist``, which
+also writes the Bloom filter the browser checks guesses against (see wordle/bloom.py).
+"""
+
+import random
+from datetime import date
+from functools import cache
+from pathlib import Path
+
+from django.utils import timezone
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+ANSWERS_FILE = DATA_DIR / 'answers.txt'
+GUESSES_FILE = DATA_DIR / 'guesses.txt'
+WORD_LENGTH = 5
+MAX_GUESSES = 6
+KEYBOARD = ('qwertyuiop', 'asdfghjkl', 'zxcvbnm')
+FIRST_DAY = date(2026, 1, 1)
+
+
+def read_words(path):
+    lines = Path(path).read_text(encoding='utf-8').splitlines()
+    return [word for line in lines if (word := line.strip())]
+
+
+def normalize(word):
+    return word.strip().lower()
+
+
+@cache
+def answers():
+    """The answers in daily order: a fixed shuffle, so the list file can stay sorted."""
+    words = read_words(ANSWERS_FILE)
+    random.Random('wordle').shuffle(words)  # noqa: S311
+    return tuple(words)
+
+
+@cache
+def accepted():
+    """Every valid guess: the answers plus the extra guess list."""
+    return frozenset(answers()).union(read_words(GUESSES_FILE))
+
+
+def is_valid_guess(word):
+    return normalize(word) in accepted()
+
+
+def daily_answer(day=None):
+    day = day or timezone.localdate()
+    return answers()[(day - FIRST_DAY).days % len(answers())]